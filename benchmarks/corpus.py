@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# ./benchmarks/corpus.py
+from __future__ import annotations
+import argparse
+import hashlib
+import random
+import zlib
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+"""
+Deterministic synthetic PDF corpus for the benchmark suite.
+
+Writes PDF syntax directly (standard library only), so the corpus can be
+rebuilt offline and byte for byte: the same CorpusCase always produces the
+same file. Each case controls
+
+    pages, links_per_page   link annotations mixed from URI, explicit GoTo,
+                            named GoTo (/Dest string and /A /D) and GoToR
+    text_lines              filler text per page (anchor text cost)
+    outline_depth/breadth   nested outline (bookmarks), breadth ** depth items
+    object_streams          PDF 1.5 layout: objects packed into compressed
+                            /ObjStm streams behind a cross-reference stream
+    incremental_updates     appended revisions that add links to some pages
+                            (new /Annots, extra content stream, /Prev chain)
+
+Every page is also a named destination (/Names /Dests name tree), which the
+named links target.
+
+Usage:
+    python benchmarks/corpus.py [--quick] [--out DIR]
+"""
+
+PAGE_WIDTH = 612
+PAGE_HEIGHT = 792
+ROWS = 50            # Text rows per column
+ROW_HEIGHT = 14
+COLUMN_WIDTH = 280
+PAGES_PER_NODE = 32  # Kids per intermediate /Pages node
+NAMES_PER_LEAF = 64  # Names per name tree leaf
+OBJECTS_PER_STREAM = 100
+
+WORDS = (
+    "pump station valve flow pressure sensor manual section figure table drawing "
+    "schedule inspection maintenance basin influent effluent motor panel circuit "
+    "reference revision appendix procedure operator control alarm setpoint level"
+).split()
+
+LINK_KINDS = ("uri", "goto", "named_dest", "named_action", "gotor")
+LINK_WEIGHTS = (40, 30, 10, 5, 15)
+
+
+@dataclass(frozen=True)
+class CorpusCase:
+    name: str
+    pages: int
+    links_per_page: int
+    text_lines: int = 20
+    outline_depth: int = 0
+    outline_breadth: int = 0
+    object_streams: bool = False
+    incremental_updates: int = 0
+    seed: int = 0
+
+    def scaled(self, factor: float) -> "CorpusCase":
+        """Same case with fewer pages (for --quick runs)."""
+        return CorpusCase(**{**asdict(self), "pages": max(10, int(self.pages * factor))})
+
+
+CASES: Tuple[CorpusCase, ...] = (
+    CorpusCase("links_dense", pages=200, links_per_page=40, text_lines=10),
+    CorpusCase("text_heavy", pages=300, links_per_page=2, text_lines=60),
+    CorpusCase("outline_deep", pages=300, links_per_page=4, outline_depth=6, outline_breadth=3),
+    CorpusCase("object_streams", pages=500, links_per_page=10, object_streams=True),
+    CorpusCase("incremental", pages=200, links_per_page=10, incremental_updates=3),
+    CorpusCase("large", pages=2000, links_per_page=5, object_streams=True, incremental_updates=1),
+)
+
+QUICK_FACTOR = 0.1
+
+
+def _ref(num: int) -> str:
+    return f"{num} 0 R"
+
+
+def _pdf_string(text: str) -> str:
+    return "(" + text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)") + ")"
+
+
+class _Objects:
+    """Object table of one revision: number -> serialized object (without 'N 0 obj')."""
+
+    def __init__(self, first_num: int = 1):
+        self.next_num = first_num
+        self.bodies: Dict[int, bytes] = {}
+        self.streams: set = set()  # Stream objects cannot go into object streams
+
+    def reserve(self) -> int:
+        num = self.next_num
+        self.next_num += 1
+        return num
+
+    def put(self, num: int, body: str) -> int:
+        self.bodies[num] = body.encode("latin-1")
+        return num
+
+    def put_stream(self, num: int, entries: str, data: bytes, compress: bool = True) -> int:
+        if compress:
+            data = zlib.compress(data, 6)
+            entries += " /Filter /FlateDecode"
+        self.bodies[num] = f"<< {entries} /Length {len(data)} >>\nstream\n".encode("latin-1") + data + b"\nendstream"
+        self.streams.add(num)
+        return num
+
+
+def _write_revision(out: bytearray, objects: _Objects, root: int, file_id: str,
+                    prev_xref: Optional[int], object_streams: bool) -> int:
+    """Append objects plus their cross-reference section to out. Returns the xref offset."""
+    # entries: num -> (type, field2, field3) as in a cross-reference stream
+    entries: Dict[int, Tuple[int, int, int]] = {}
+
+    packed: List[int] = []
+    if object_streams:
+        packed = [num for num in sorted(objects.bodies) if num not in objects.streams]
+    packed_set = set(packed)
+    for num in sorted(objects.bodies):
+        if num in packed_set:
+            continue
+        entries[num] = (1, len(out), 0)
+        out += f"{num} 0 obj\n".encode() + objects.bodies[num] + b"\nendobj\n"
+
+    for start in range(0, len(packed), OBJECTS_PER_STREAM):
+        chunk = packed[start:start + OBJECTS_PER_STREAM]
+        header, body = [], bytearray()
+        for index, num in enumerate(chunk):
+            header.append(f"{num} {len(body)}")
+            body += objects.bodies[num] + b"\n"
+            entries[num] = (2, 0, index)  # Stream number filled in below
+        header_bytes = (" ".join(header) + "\n").encode()
+        stream_num = objects.reserve()
+        data = zlib.compress(header_bytes + bytes(body), 6)
+        for num in chunk:
+            entries[num] = (2, stream_num, entries[num][2])
+        entries[stream_num] = (1, len(out), 0)
+        out += (f"{stream_num} 0 obj\n<< /Type /ObjStm /N {len(chunk)} /First {len(header_bytes)} "
+                f"/Filter /FlateDecode /Length {len(data)} >>\nstream\n").encode() + data + b"\nendstream\nendobj\n"
+
+    size = objects.next_num
+    trailer = f"/Size {size + (1 if object_streams else 0)} /Root {_ref(root)} /ID [<{file_id}> <{file_id}>]"
+    if prev_xref is not None:
+        trailer += f" /Prev {prev_xref}"
+
+    if prev_xref is None:
+        entries[0] = (0, 0, 65535)
+
+    if object_streams:
+        xref_num = size
+        xref_offset = len(out)
+        entries[xref_num] = (1, xref_offset, 0)
+        nums = sorted(entries)
+        rows = b"".join(
+            t.to_bytes(1, "big") + f2.to_bytes(4, "big") + (f3 & 0xFFFF).to_bytes(2, "big")
+            for t, f2, f3 in (entries[n] for n in nums)
+        )
+        index = " ".join(f"{start} {count}" for start, count in _runs(nums))
+        data = zlib.compress(rows, 6)
+        out += (f"{xref_num} 0 obj\n<< /Type /XRef {trailer} /W [1 4 2] /Index [{index}] "
+                f"/Filter /FlateDecode /Length {len(data)} >>\nstream\n").encode() + data + b"\nendstream\nendobj\n"
+    else:
+        xref_offset = len(out)
+        out += b"xref\n"
+        nums = sorted(entries)
+        for start, count in _runs(nums):
+            out += f"{start} {count}\n".encode()
+            for num in range(start, start + count):
+                kind, offset, gen = entries[num]
+                out += f"{offset:010d} {gen:05d} {'f' if kind == 0 else 'n'}\r\n".encode()
+        out += f"trailer\n<< {trailer} >>\n".encode()
+    out += f"startxref\n{xref_offset}\n%%EOF\n".encode()
+    return xref_offset
+
+
+def _runs(nums: List[int]) -> List[Tuple[int, int]]:
+    """Consecutive runs of sorted object numbers, as (first, count) xref subsections."""
+    runs: List[Tuple[int, int]] = []
+    for num in nums:
+        if runs and runs[-1][0] + runs[-1][1] == num:
+            runs[-1] = (runs[-1][0], runs[-1][1] + 1)
+        else:
+            runs.append((num, 1))
+    return runs
+
+
+def _text_line(rng: random.Random, words: int = 9) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def _row_position(row: int) -> Tuple[float, float]:
+    column, row = divmod(row % (2 * ROWS), ROWS)
+    return 40 + column * COLUMN_WIDTH, PAGE_HEIGHT - 32 - row * ROW_HEIGHT
+
+
+def _content(lines: List[Tuple[float, float, str]]) -> bytes:
+    ops = ["BT", "/F1 9 Tf"]
+    for x, y, text in lines:
+        ops.append(f"1 0 0 1 {x:.1f} {y:.1f} Tm {_pdf_string(text)} Tj")
+    ops.append("ET")
+    return "\n".join(ops).encode("latin-1")
+
+
+def _link_target(kind: str, page_refs: List[int], rng: random.Random, source_page: int) -> Tuple[str, str]:
+    """(destination or action entries, visible anchor text) for one link of the given kind."""
+    target = rng.randrange(len(page_refs))
+    if kind == "uri":
+        url = f"https://example.com/doc/p{source_page + 1}/t{target + 1}"
+        return f"/A << /S /URI /URI {_pdf_string(url)} >>", url
+    if kind == "goto":
+        return f"/Dest [{_ref(page_refs[target])} /XYZ 0 {PAGE_HEIGHT} 0]", f"See page {target + 1}"
+    if kind == "named_dest":
+        return f"/Dest {_pdf_string(_dest_name(target))}", f"Section {target + 1}"
+    if kind == "named_action":
+        return f"/A << /S /GoTo /D {_pdf_string(_dest_name(target))} >>", f"Jump to section {target + 1}"
+    other = f"other_{target % 7}.pdf"
+    return f"/A << /S /GoToR /F {_pdf_string(other)} /D [0 /Fit] >>", f"{other} page 1"
+
+
+def _dest_name(page_index: int) -> str:
+    return f"p{page_index + 1:05d}"
+
+
+def _links_on_page(objects: _Objects, rng: random.Random, page_index: int, page_refs: List[int],
+                   first_row: int, count: int, counts: Dict[str, int]
+                   ) -> Tuple[List[int], List[Tuple[float, float, str]]]:
+    """count link annotations from text row first_row on. Returns (annotation numbers, text lines)."""
+    annots, lines = [], []
+    for k in range(count):
+        kind = rng.choices(LINK_KINDS, LINK_WEIGHTS)[0]
+        target, text = _link_target(kind, page_refs, rng, page_index)
+        x, y = _row_position(first_row + k)
+        width = min(5.0 * len(text), COLUMN_WIDTH - 20)
+        annot = (f"<< /Type /Annot /Subtype /Link /Rect [{x:.1f} {y - 3:.1f} {x + width:.1f} {y + 10:.1f}] "
+                 f"/Border [0 0 0] {target} >>")
+        annots.append(objects.put(objects.reserve(), annot))
+        lines.append((x, y, text))
+        counts[kind] += 1
+    return annots, lines
+
+
+def _page_dict(parent: int, contents: List[int], annots: List[int]) -> str:
+    contents_ref = _ref(contents[0]) if len(contents) == 1 else "[" + " ".join(_ref(c) for c in contents) + "]"
+    annots_entry = f" /Annots [{' '.join(_ref(a) for a in annots)}]" if annots else ""
+    return (f"<< /Type /Page /Parent {_ref(parent)} /MediaBox [0 0 {PAGE_WIDTH} {PAGE_HEIGHT}] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {contents_ref}{annots_entry} >>")
+
+
+def _outline(objects: _Objects, case: CorpusCase, page_refs: List[int]) -> Tuple[Optional[int], int]:
+    """Nested outline of outline_breadth ** level items per level. Returns (outlines dict num, item count)."""
+    if not case.outline_depth or not case.outline_breadth:
+        return None, 0
+    root = objects.reserve()
+    counter = [0]
+
+    def build(parent: int, level: int, prefix: str) -> Tuple[int, int, int]:
+        nums = [objects.reserve() for _ in range(case.outline_breadth)]
+        total = 0
+        for i, num in enumerate(nums):
+            title = f"{prefix}{i + 1}"
+            target = page_refs[counter[0] % len(page_refs)]
+            counter[0] += 1
+            entries = f"/Title {_pdf_string('Chapter ' + title)} /Parent {_ref(parent)} /Dest [{_ref(target)} /Fit]"
+            if i > 0:
+                entries += f" /Prev {_ref(nums[i - 1])}"
+            if i + 1 < len(nums):
+                entries += f" /Next {_ref(nums[i + 1])}"
+            descendants = 0
+            if level < case.outline_depth:
+                first, last, descendants = build(num, level + 1, title + ".")
+                entries += f" /First {_ref(first)} /Last {_ref(last)} /Count {descendants}"
+            objects.put(num, f"<< {entries} >>")
+            total += 1 + descendants
+        return nums[0], nums[-1], total
+
+    first, last, total = build(root, 1, "")
+    objects.put(root, f"<< /Type /Outlines /First {_ref(first)} /Last {_ref(last)} /Count {total} >>")
+    return root, total
+
+
+def _name_tree(objects: _Objects, page_refs: List[int]) -> int:
+    """/Dests name tree with one destination per page, NAMES_PER_LEAF names per leaf."""
+    leaves = []
+    for start in range(0, len(page_refs), NAMES_PER_LEAF):
+        chunk = range(start, min(start + NAMES_PER_LEAF, len(page_refs)))
+        names = " ".join(f"{_pdf_string(_dest_name(i))} [{_ref(page_refs[i])} /Fit]" for i in chunk)
+        limits = f"[{_pdf_string(_dest_name(chunk[0]))} {_pdf_string(_dest_name(chunk[-1]))}]"
+        leaves.append(objects.put(objects.reserve(), f"<< /Limits {limits} /Names [{names}] >>"))
+    return objects.put(objects.reserve(), f"<< /Kids [{' '.join(_ref(n) for n in leaves)}] >>")
+
+
+def build_pdf(case: CorpusCase) -> Tuple[bytes, Dict[str, Any]]:
+    """The PDF bytes for case, and a summary of what is in it (expected counts)."""
+    rng = random.Random(f"{case.name}:{case.seed}")
+    objects = _Objects(first_num=4)  # 1 catalog, 2 page tree root, 3 font
+    counts = {kind: 0 for kind in LINK_KINDS}
+
+    page_refs = [objects.reserve() for _ in range(case.pages)]
+    parents = []
+    for start in range(0, case.pages, PAGES_PER_NODE):
+        kids = page_refs[start:start + PAGES_PER_NODE]
+        node = objects.reserve()
+        objects.put(node, f"<< /Type /Pages /Parent {_ref(2)} /Kids [{' '.join(_ref(k) for k in kids)}] /Count {len(kids)} >>")
+        parents.extend([node] * len(kids))
+    objects.put(2, f"<< /Type /Pages /Kids [{' '.join(_ref(n) for n in dict.fromkeys(parents))}] /Count {case.pages} >>")
+    objects.put(3, "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>")
+
+    # Per page state, reused by incremental updates
+    page_contents: List[List[int]] = []
+    page_annots: List[List[int]] = []
+    for i in range(case.pages):
+        annots, lines = _links_on_page(objects, rng, i, page_refs, 0, case.links_per_page, counts)
+        for row in range(case.links_per_page, case.links_per_page + case.text_lines):
+            x, y = _row_position(row)
+            lines.append((x, y, _text_line(rng)))
+        content = objects.put_stream(objects.reserve(), "", _content(lines))
+        page_contents.append([content])
+        page_annots.append(annots)
+        objects.put(page_refs[i], _page_dict(parents[i], [content], annots))
+
+    outlines, outline_items = _outline(objects, case, page_refs)
+    names = _name_tree(objects, page_refs)
+    catalog = f"<< /Type /Catalog /Pages {_ref(2)} /Names << /Dests {_ref(names)} >>"
+    if outlines is not None:
+        catalog += f" /Outlines {_ref(outlines)} /PageMode /UseOutlines"
+    objects.put(1, catalog + " >>")
+
+    file_id = hashlib.md5(repr(case).encode()).hexdigest()
+    out = bytearray(b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n")
+    xref = _write_revision(out, objects, 1, file_id, None, case.object_streams)
+
+    # Incremental updates: add two links (and their anchor text) to every 7th page
+    next_num = objects.next_num + (1 if case.object_streams else 0)
+    for update in range(case.incremental_updates):
+        revision = _Objects(first_num=next_num)
+        for i in range(update % 7, case.pages, 7):
+            first_row = case.links_per_page + case.text_lines + 2 * update
+            annots, lines = _links_on_page(revision, rng, i, page_refs, first_row, 2, counts)
+            content = revision.put_stream(revision.reserve(), "", _content(lines))
+            page_contents[i].append(content)
+            page_annots[i].extend(annots)
+            revision.put(page_refs[i], _page_dict(parents[i], page_contents[i], page_annots[i]))
+        xref = _write_revision(out, revision, 1, file_id, xref, case.object_streams)
+        next_num = revision.next_num + (1 if case.object_streams else 0)
+
+    data = bytes(out)
+    summary = {
+        "case": asdict(case),
+        "pages": case.pages,
+        "links": sum(counts.values()),
+        "links_by_kind": counts,
+        "outline_items": outline_items,
+        "named_destinations": case.pages,
+        "bytes": len(data),
+        "sha256": hashlib.sha256(data).hexdigest(),
+    }
+    return data, summary
+
+
+def generate(out_dir: Path, cases=CASES, quick: bool = False) -> Dict[str, Dict[str, Any]]:
+    """Write every case to out_dir/<name>.pdf (skipping files that already match). Returns the summaries by case name."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    summaries = {}
+    for case in cases:
+        if quick:
+            case = case.scaled(QUICK_FACTOR)
+        data, summary = build_pdf(case)
+        path = out_dir / f"{case.name}.pdf"
+        if not path.exists() or path.read_bytes() != data:
+            path.write_bytes(data)
+        summary["path"] = str(path)
+        summaries[case.name] = summary
+    return summaries
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate the synthetic benchmark corpus.")
+    parser.add_argument("--out", type=Path, default=Path(__file__).resolve().parent / "corpus")
+    parser.add_argument("--quick", action="store_true", help=f"Scale page counts by {QUICK_FACTOR}.")
+    args = parser.parse_args()
+    out_dir = args.out / ("quick" if args.quick else "full")
+    for name, summary in generate(out_dir, quick=args.quick).items():
+        print(f"{name:<16} {summary['pages']:>6} pages {summary['links']:>7} links {summary['bytes'] / 1e6:>8.2f} MB  {summary['path']}")
+
+
+if __name__ == "__main__":
+    main()
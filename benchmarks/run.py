@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# ./benchmarks/run.py
+from __future__ import annotations
+import argparse
+import contextlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+import corpus
+
+"""
+Benchmark every engine through run_report() on the synthetic corpus.
+
+    python benchmarks/run.py                   # full corpus, compare with baseline-full.json
+    python benchmarks/run.py --quick           # 10% page counts, for a fast local check
+    python benchmarks/run.py --save-baseline   # accept the current numbers as the baseline
+
+Each (case, engine) pair runs in a fresh interpreter, so peak RSS belongs to
+that engine alone and no import or cache state leaks between engines. The
+worker times --repeat calls of run_report(use_cache=False, print_bool=False)
+and reports the median; pages/sec and links/sec are derived from it.
+
+Results go to benchmarks/results/<quick|full>.json. With a baseline for the
+same mode (benchmarks/baseline-<quick|full>.json), the run fails (exit 1)
+when, for any case and engine present in both:
+
+    pages/sec drops more than --tolerance (default 25%)
+    peak RSS grows more than --rss-tolerance (default 20%)
+    the link count changes (a correctness regression, no tolerance)
+
+Baselines are machine specific: record one per machine or CI runner with
+--save-baseline before comparing. Cases whose corpus file changed since the
+baseline (different sha256) are skipped with a note.
+
+The working tree's src/ is put first on PYTHONPATH, so the checkout is what
+gets measured, installed or not.
+"""
+
+BENCH_DIR = Path(__file__).resolve().parent
+SRC_DIR = BENCH_DIR.parent / "src"
+ENGINES = ("pypdf", "pymupdf", "pdfium", "xref")
+
+
+def worker(engine: str, pdf_path: str, repeat: int) -> Dict[str, Any]:
+    """Runs in the child interpreter: time run_report() repeat times on one file."""
+    from pdflinkcheck.bench import peak_rss_mb
+    from pdflinkcheck.report import run_report
+    walls = []
+    report = {}
+    # Engines and run_report print progress; keep stdout for the JSON result
+    with contextlib.redirect_stdout(sys.stderr):
+        for _ in range(repeat):
+            start = time.perf_counter()
+            report = run_report(pdf_path, engine, print_bool=False, use_cache=False)
+            walls.append(time.perf_counter() - start)
+    metadata = report.get("metadata", {})
+    return {
+        "walls_s": [round(w, 6) for w in walls],
+        "links": metadata.get("link_counts", {}).get("total_links_count"),
+        "toc_entries": len(report.get("data", {}).get("toc", [])),
+        "peak_rss_mb": peak_rss_mb(),
+        "stages": metadata.get("timings", {}).get("stages", {}),
+        "counters": metadata.get("counters", {}),
+    }
+
+
+def available_engines() -> List[str]:
+    """ENGINES whose library imports in the benchmark interpreter."""
+    code = ("from pdflinkcheck.environment import pymupdf_is_available, pdfium_is_available;"
+            "print(pymupdf_is_available(), pdfium_is_available())")
+    out = subprocess.run([sys.executable, "-c", code], env=_child_env(), capture_output=True, text=True, check=True)
+    # Importing fitz may print a deprecation notice first; the flags are the last line
+    has_pymupdf, has_pdfium = (flag == "True" for flag in out.stdout.strip().splitlines()[-1].split())
+    return [e for e in ENGINES if (e != "pymupdf" or has_pymupdf) and (e != "pdfium" or has_pdfium)]
+
+
+def _child_env() -> Dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (str(SRC_DIR), env.get("PYTHONPATH", "")) if p)
+    return env
+
+
+def run_case(engine: str, summary: Dict[str, Any], repeat: int) -> Dict[str, Any]:
+    cmd = [sys.executable, str(Path(__file__).resolve()), "--worker", engine, summary["path"], str(repeat)]
+    proc = subprocess.run(cmd, env=_child_env(), capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"{engine} on {summary['path']} failed:\n{proc.stderr[-2000:]}")
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    median = statistics.median(result["walls_s"])
+    result.update({
+        "wall_s_median": round(median, 6),
+        "wall_s_min": min(result["walls_s"]),
+        "pages_per_s": round(summary["pages"] / median, 1),
+        "links_per_s": round((result["links"] or 0) / median, 1),
+    })
+    return result
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float, rss_tolerance: float) -> List[str]:
+    """Regressions of results against baseline, as printable lines."""
+    problems = []
+    for name, base_case in baseline["cases"].items():
+        case = results["cases"].get(name)
+        if case is None:
+            continue
+        if case["sha256"] != base_case["sha256"]:
+            print(f"note: {name}: corpus file changed since the baseline, not compared")
+            continue
+        for engine, base in base_case["engines"].items():
+            now = case["engines"].get(engine)
+            if now is None:
+                continue
+            label = f"{name}/{engine}"
+            if now["links"] != base["links"]:
+                problems.append(f"{label}: link count {base['links']} -> {now['links']}")
+            if now["pages_per_s"] < base["pages_per_s"] * (1 - tolerance):
+                problems.append(f"{label}: pages/sec {base['pages_per_s']} -> {now['pages_per_s']} "
+                                f"({now['pages_per_s'] / base['pages_per_s'] - 1:+.0%})")
+            if base.get("peak_rss_mb") and now.get("peak_rss_mb") and now["peak_rss_mb"] > base["peak_rss_mb"] * (1 + rss_tolerance):
+                problems.append(f"{label}: peak RSS {base['peak_rss_mb']} -> {now['peak_rss_mb']} MB "
+                                f"({now['peak_rss_mb'] / base['peak_rss_mb'] - 1:+.0%})")
+    return problems
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark pdflinkcheck engines on the synthetic corpus.")
+    parser.add_argument("--quick", action="store_true", help="Use the scaled-down corpus.")
+    parser.add_argument("--repeat", type=int, default=3, help="run_report() calls per case and engine (median is reported).")
+    parser.add_argument("--engines", default=",".join(ENGINES), help="Comma-separated engines; unavailable ones are skipped.")
+    parser.add_argument("--cases", default="", help="Comma-separated case names (default: all).")
+    parser.add_argument("--baseline", type=Path, default=None, help="Baseline JSON (default: benchmarks/baseline-<mode>.json).")
+    parser.add_argument("--save-baseline", action="store_true", help="Write the results as the new baseline instead of comparing.")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed pages/sec drop (fraction).")
+    parser.add_argument("--rss-tolerance", type=float, default=0.20, help="Allowed peak RSS growth (fraction).")
+    parser.add_argument("--worker", nargs=3, metavar=("ENGINE", "PDF", "REPEAT"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        engine, pdf_path, repeat = args.worker
+        print(json.dumps(worker(engine, pdf_path, int(repeat))))
+        return 0
+
+    mode = "quick" if args.quick else "full"
+    cases = corpus.CASES
+    if args.cases:
+        wanted = set(args.cases.split(","))
+        cases = tuple(c for c in cases if c.name in wanted)
+    summaries = corpus.generate(BENCH_DIR / "corpus" / mode, cases, quick=args.quick)
+
+    requested = [e.strip() for e in args.engines.split(",") if e.strip()]
+    available = available_engines()
+    engines = [e for e in requested if e in available]
+    for skipped in sorted(set(requested) - set(engines)):
+        print(f"note: engine {skipped} is not available, skipped")
+
+    from_src = subprocess.run([sys.executable, "-c", "from pdflinkcheck.version_info import get_version_from_pyproject as v; print(v())"],
+                              env=_child_env(), capture_output=True, text=True)
+    results: Dict[str, Any] = {
+        "pdflinkcheck_version": from_src.stdout.strip() or None,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "mode": mode,
+        "repeat": args.repeat,
+        "cases": {},
+    }
+
+    print(f"{'case':<16} {'engine':<8} {'median s':>9} {'pages/s':>9} {'links/s':>10} {'links':>7} {'RSS MB':>7}")
+    for name, summary in summaries.items():
+        case_result = {key: summary[key] for key in ("pages", "links", "outline_items", "bytes", "sha256")}
+        case_result["engines"] = {}
+        for engine in engines:
+            r = run_case(engine, summary, args.repeat)
+            case_result["engines"][engine] = r
+            print(f"{name:<16} {engine:<8} {r['wall_s_median']:>9.3f} {r['pages_per_s']:>9.1f} "
+                  f"{r['links_per_s']:>10.1f} {r['links']:>7} {r['peak_rss_mb'] if r['peak_rss_mb'] is not None else '-':>7}")
+        results["cases"][name] = case_result
+
+    results_path = BENCH_DIR / "results" / f"{mode}.json"
+    results_path.parent.mkdir(exist_ok=True)
+    results_path.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    print(f"\nResults: {results_path}")
+
+    baseline_path = args.baseline or BENCH_DIR / f"baseline-{mode}.json"
+    if args.save_baseline:
+        baseline_path.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"Baseline saved: {baseline_path}")
+        return 0
+    if not baseline_path.exists():
+        print(f"No baseline at {baseline_path}; run with --save-baseline to record one.")
+        return 0
+
+    problems = compare(results, json.loads(baseline_path.read_text(encoding="utf-8")), args.tolerance, args.rss_tolerance)
+    if problems:
+        print(f"\nRegressions against {baseline_path.name}:")
+        for line in problems:
+            print(f"  {line}")
+        return 1
+    print(f"No regressions against {baseline_path.name}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# ./benchmarks/startup.py
+from __future__ import annotations
+import argparse
+import compileall
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+"""
+CLI cold-start budget.
+
+    python benchmarks/startup.py               # measure, exit 1 if over budget
+    python benchmarks/startup.py --runs 30     # steadier medians
+
+CI invokes the CLI thousands of times, so argument parsing must not pay for
+what the command does not use. For each command in COMMANDS this runs the
+CLI in a fresh interpreter and checks, with `python -X importtime`:
+
+    none of its FORBIDDEN modules is imported (PDF engines, numpy, and for
+    --version also rich.console and logging)
+    pdflinkcheck's own import time, the cumulative time of pdflinkcheck.cli
+    minus typer's, stays under --budget-ms (default 30)
+
+and reports the median wall time next to a bare `python -c pass`. Wall time
+is informational only: it depends on the machine, and typer alone is most of
+it. Bytecode is compiled first, so the numbers match an installed package.
+"""
+
+BENCH_DIR = Path(__file__).resolve().parent
+SRC_DIR = BENCH_DIR.parent / "src"
+
+ENGINE_MODULES = ("fitz", "pymupdf", "pypdfium2", "pypdf", "numpy")
+
+# (arguments, modules that must not be imported)
+COMMANDS = (
+    (["--version"], ENGINE_MODULES + ("rich.console", "logging", "multiprocessing")),
+    (["analyze", "--help"], ENGINE_MODULES),
+    (["bench", "--help"], ENGINE_MODULES),
+)
+
+
+def _child_env() -> Dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (str(SRC_DIR), env.get("PYTHONPATH", "")) if p)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return env
+
+
+def median_wall_ms(cmd: List[str], runs: int) -> float:
+    walls = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(cmd, env=_child_env(), capture_output=True)
+        walls.append(time.perf_counter() - start)
+    return round(statistics.median(walls) * 1000, 1)
+
+
+def import_times(args: List[str]) -> Dict[str, float]:
+    """Cumulative import time in ms per module, from one `python -X importtime` run."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-m", "pdflinkcheck", *args],
+                          env=_child_env(), capture_output=True, text=True)
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        if cumulative.strip().isdigit():
+            times.setdefault(name.strip(), int(cumulative) / 1000)
+    return times
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check the pdflinkcheck CLI cold-start budget.")
+    parser.add_argument("--runs", type=int, default=10, help="Runs per command (median is reported).")
+    parser.add_argument("--budget-ms", type=float, default=30.0, help="Allowed pdflinkcheck import time, excluding typer.")
+    args = parser.parse_args()
+
+    compileall.compile_dir(str(SRC_DIR / "pdflinkcheck"), quiet=1)
+    baseline = median_wall_ms([sys.executable, "-c", "pass"], args.runs)
+    print(f"python -c pass: {baseline} ms\n")
+    print(f"{'command':<22} {'wall ms':>8} {'own import ms':>14}  heavy modules imported")
+
+    problems = []
+    for cli_args, forbidden in COMMANDS:
+        label = " ".join(cli_args)
+        wall = median_wall_ms([sys.executable, "-m", "pdflinkcheck", *cli_args], args.runs)
+        times = import_times(cli_args)
+        own = round(times.get("pdflinkcheck.cli", 0.0) - times.get("typer", 0.0), 1)
+        heavy = [m for m in forbidden if m in times]
+        print(f"{label:<22} {wall:>8} {own:>14}  {', '.join(heavy) or '-'}")
+        if heavy:
+            problems.append(f"{label}: imports {', '.join(heavy)}")
+        if own > args.budget_ms:
+            problems.append(f"{label}: pdflinkcheck import time {own} ms > budget {args.budget_ms} ms")
+
+    if problems:
+        print("\nOver budget:")
+        for line in problems:
+            print(f"  {line}")
+        return 1
+    print(f"\nWithin budget ({args.budget_ms} ms of pdflinkcheck import time, no heavy modules).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -18,6 +18,33 @@ def run_report_and_call_exports(*args, **kwargs):
     from pdflinkcheck.report import run_report_and_call_exports as _run
     return _run(*args, **kwargs)
 
+def open_session(*args, **kwargs):
+    from pdflinkcheck.session import open_session as _open
+    return _open(*args, **kwargs)
+open_session.__doc__ = (
+    "Open a PDF once with the chosen engine and return a DocumentSession that serves\n"
+    "links, TOC and page count from the single open handle.\n\n"
+    "See pdflinkcheck.session for full details."
+)
+
+def iter_links(*args, **kwargs):
+    from pdflinkcheck.session import iter_links as _iter
+    return _iter(*args, **kwargs)
+iter_links.__doc__ = (
+    "Yield normalized link records page by page: iter_links(pdf_path, engine='pypdf').\n"
+    "Nothing is accumulated, so memory stays flat on very large documents.\n\n"
+    "See pdflinkcheck.session.iter_links for full details."
+)
+
+def extract_link_table(*args, **kwargs):
+    from pdflinkcheck.session import extract_link_table as _extract
+    return _extract(*args, **kwargs)
+extract_link_table.__doc__ = (
+    "Extract links into a compact columnar LinkTable: extract_link_table(pdf_path, engine='pypdf').\n"
+    "Convert with table.to_dicts() at the export boundary.\n\n"
+    "See pdflinkcheck.linktable for full details."
+)
+
 # --- pypdf ---
 def extract_links_pypdf(*args, **kwargs):
     from pdflinkcheck.analysis_pypdf import extract_links_pypdf as _extract
@@ -27,6 +54,11 @@ def extract_toc_pypdf(*args, **kwargs):
     from pdflinkcheck.analysis_pypdf import extract_toc_pypdf as _extract
     return _extract(*args, **kwargs)
 
+# --- xref (triage, no anchor text) ---
+def extract_links_xref(*args, **kwargs):
+    from pdflinkcheck.analysis_xref import extract_links_xref as _extract
+    return _extract(*args, **kwargs)
+
 # --- PyMuPDF ---
 def extract_links_pymupdf(*args, **kwargs):
     try:
@@ -103,10 +135,14 @@ else:
 # Define __all__ such that the library functions are self documenting.
 __all__ = [
     "run_report_and_call_exports",
+    "open_session",
+    "iter_links",
+    "extract_link_table",
     "extract_links_pymupdf", 
     "extract_toc_pymupdf", 
     "extract_links_pypdf", 
     "extract_toc_pypdf", 
+    "extract_links_xref",
     "analyze_pdf_pdfium",     
 ]
 
@@ -114,15 +150,23 @@ __all__ = [
 if _load_gui_func:
     __all__.append("start_gui")
 
-# Handle dev module if you want it public
-try:
-    from pdflinkcheck import dev
+# Handle dev module if you want it public. It is listed when its
+# dependencies are installed but loaded on first access (pdflinkcheck.dev,
+# or `from pdflinkcheck import *`): it imports typer, rich and click, which
+# would otherwise be paid by every `import pdflinkcheck`, the CLI's included.
+import importlib.util as _importlib_util
+if all(_importlib_util.find_spec(_dep) is not None for _dep in ("typer", "rich", "click")):
     __all__.append("dev")
-except ImportError:
-    pass
+
+def __getattr__(name):
+    if name == "dev":
+        import importlib
+        return importlib.import_module("pdflinkcheck.dev")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # 4. THE CLEANUP (This removes items from dir())
 del _os
+del _importlib_util
 del _gui_easteregg_env_flag
 del _load_gui_func
 
@@ -3,4 +3,9 @@ from __future__ import annotations
 from pdflinkcheck.cli import app
 
 if __name__ == "__main__":
+    import sys
+    if getattr(sys, "frozen", False):
+        # Process pools in frozen builds; a no-op (and a 6 ms import) otherwise
+        import multiprocessing
+        multiprocessing.freeze_support()
     app()
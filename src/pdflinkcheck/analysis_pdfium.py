@@ -1,8 +1,13 @@
 # src/pdflinkcheck/analysis_pdfium.py
 from __future__ import annotations
 import ctypes
-from typing import List, Dict, Any
-from pdflinkcheck.helpers import PageRef
+import functools
+import sys
+from typing import List, Dict, Any, Iterator, Optional
+from pdflinkcheck import timing
+from pdflinkcheck.helpers import ANCHOR_TEXT_SKIPPED, PageRef, check_anchor_text_mode
+from pdflinkcheck.sharding import should_shard, run_sharded
+from pdflinkcheck.source import is_path, open_stream
 
 from pdflinkcheck.environment import pdfium_is_available
 from pdflinkcheck.helpers import PageRef
@@ -19,15 +24,45 @@ except ImportError:
     pdfium = None
     pdfium_c = None
 
-def analyze_pdf(path: str) -> Dict[str, Any]:
+def open_doc(pdf_source):
+    """pdfium.PdfDocument for a path or an in-memory source (bytes, BytesIO, file object, mmap; see pdflinkcheck.source)."""
+    if is_path(pdf_source) or isinstance(pdf_source, bytes):
+        return pdfium.PdfDocument(pdf_source)
+    # Read through PDFium's block-reader callback; mmap and bytearray are not copied
+    return pdfium.PdfDocument(open_stream(pdf_source))
+
+def analyze_pdf(path: str, jobs: int = 1, anchor_text: str = "accurate", web_links: bool = True) -> Dict[str, Any]:
+    """
+    Extract links and TOC with PDFium.
+
+    path: A file path, or the document itself in memory (see open_doc()).
+    jobs: Worker processes for page-sharded link extraction of very large documents.
+          1 (default) stays in-process; 0 uses all CPU cores. Documents under
+          sharding.SHARD_MIN_PAGES pages are always extracted in-process.
+    anchor_text: "accurate" (default), "fast" or "none", see iter_links_from_doc().
+    web_links: Detect URLs in the page text, see iter_links_from_doc().
+    """
     # 1. Guard the entry point
     if not pdfium_is_available() or pdfium is None:
         raise ImportError(
             "pypdfium2 is not installed. "
             "\nInstall it with: \n\tpip install pdflinkcheck[pdfium] \n\t OR \n\t uv sync --extra pdfium"
         )
-    doc = pdfium.PdfDocument(path)
-    links = []
+    doc = open_doc(path)
+    try:
+        toc_list = extract_toc_from_doc(doc)
+        # Workers reopen the file by path, so in-memory documents are never sharded
+        shard_path = path if is_path(path) else None
+        links = extract_links_from_doc(doc, pdf_path=shard_path, jobs=jobs, anchor_text=anchor_text, web_links=web_links)
+    finally:
+        doc.close()
+    return {"links": links, "toc": toc_list}
+
+def extract_toc_from_doc(doc) -> List[Dict[str, Any]]:
+    """
+    TOC extraction from an already open pdfium.PdfDocument.
+    Used by analyze_pdf() and by pdflinkcheck.session.PdfiumSession.
+    """
     toc_list = []
     seen_toc = set()
 
@@ -41,16 +76,110 @@ def analyze_pdf(path: str) -> Dict[str, Any]:
             if key not in seen_toc:
                 toc_list.append({"level": item.level + 1, "title": title, "target_page": page_idx})
                 seen_toc.add(key)
+    return toc_list
+
+def _extract_links_shard(path: str, start: int, stop: int, anchor_text: str = "accurate", web_links: bool = True) -> List[Dict[str, Any]]:
+    """Worker for sharding.run_sharded(): open the document and extract pages [start, stop)."""
+    doc = pdfium.PdfDocument(path)
+    try:
+        return extract_links_from_doc(doc, page_range=range(start, stop), anchor_text=anchor_text, web_links=web_links)
+    finally:
+        doc.close()
+
+def extract_links_from_doc(doc, page_range: Optional[range] = None, pdf_path: Optional[str] = None, jobs: int = 1, anchor_text: str = "accurate", web_links: bool = True) -> List[Dict[str, Any]]:
+    """
+    Link extraction from an already open pdfium.PdfDocument.
+    Used by analyze_pdf() and by pdflinkcheck.session.PdfiumSession.
+    The document is left open; the caller owns it.
+
+    Args:
+        doc: The open pdfium.PdfDocument.
+        page_range: 0-based pages to extract. Defaults to every page.
+        pdf_path: Path the workers reopen when sharding. Sharding is skipped without it.
+        jobs: See analyze_pdf().
+        anchor_text: See iter_links_from_doc().
+        web_links: See iter_links_from_doc().
+    """
+    check_anchor_text_mode(anchor_text)
+    if page_range is None and pdf_path is not None and should_shard(len(doc), jobs):
+        shard_fn = functools.partial(_extract_links_shard, anchor_text=anchor_text, web_links=web_links)
+        try:
+            return run_sharded(shard_fn, str(pdf_path), len(doc), jobs)
+        except Exception as e:
+            print(f"Page-sharded extraction failed, continuing in a single process: {e}", file=sys.stderr)
+
+    return list(iter_links_from_doc(doc, page_range, anchor_text=anchor_text, web_links=web_links))
+
+class _LazyTextPage:
+    """
+    The page's PdfTextPage, built on first use. Building it lays out every
+    character on the page, which is the main per-page cost of this engine,
+    so pages that need neither web-link detection nor anchor text skip it.
+    """
+    __slots__ = ("page", "_text_page")
+
+    def __init__(self, page):
+        self.page = page
+        self._text_page = None
+
+    def get(self):
+        if self._text_page is None:
+            self._text_page = self.page.get_textpage()
+            timing.count("text_extractions")
+        return self._text_page
+
+    def close(self) -> None:
+        if self._text_page is not None:
+            self._text_page.close()
+            self._text_page = None
+
+def iter_links_from_doc(doc, page_range: Optional[range] = None, anchor_text: str = "accurate", web_links: bool = True) -> Iterator[Dict[str, Any]]:
+    """
+    Yield link dicts page by page from an already open pdfium.PdfDocument.
+    page_range: 0-based pages to scan. Defaults to every page.
+    anchor_text: "none" skips get_text_bounded() and sets link_text to
+                 ANCHOR_TEXT_SKIPPED. "fast" and "accurate" are the same:
+                 bounded text lookups on the shared text page are already cheap.
+    web_links: True (default) detects URLs in the page text (FPDFLink_LoadWebLinks),
+               which needs a text page for every page. False reports URI link
+               annotations instead; the text page is then only built for pages
+               that have link annotations and only when anchor text is wanted.
+    """
+    check_anchor_text_mode(anchor_text)
+    with_text = anchor_text != "none"
+    if page_range is None:
+        page_range = range(len(doc))
 
     # 2. Link Enumeration
-    for page_index in range(len(doc)):
+    for page_index in page_range:
         page = doc.get_page(page_index)
-        text_page = page.get_textpage()
-        source_ref = PageRef.from_index(page_index)
+        timing.count("pages_loaded")
+        text_page = _LazyTextPage(page)
+        try:
+            yield from _iter_page_links(doc, page, text_page, PageRef.from_index(page_index), with_text, web_links)
+        finally:
+            # Also runs when the consumer stops early and the generator is closed
+            text_page.close()
+            page.close()
+
+def _get_uri_path(doc, action) -> str:
+    """URI of a PDFACTION_URI action. PDFium returns it as NUL-terminated 7-bit bytes."""
+    buflen = pdfium_c.FPDFAction_GetURIPath(doc.raw, action, None, 0)
+    if buflen <= 0:
+        return ""
+    buffer = ctypes.create_string_buffer(buflen)
+    pdfium_c.FPDFAction_GetURIPath(doc.raw, action, buffer, buflen)
+    return buffer.value.decode('utf-8', errors='replace')
 
-        # --- A. EXTERNAL WEB LINKS ---
-        pagelink_raw = pdfium_c.FPDFLink_LoadWebLinks(text_page.raw)
-        if pagelink_raw:
+def _iter_page_links(doc, page, text_page: _LazyTextPage, source_ref: PageRef, with_text: bool = True, web_links: bool = True) -> Iterator[Dict[str, Any]]:
+    """
+    Links of one page: web links from the text page (web_links=True), then
+    link annotations: GoTo always, URI only when web_links is False.
+    """
+    # --- A. EXTERNAL WEB LINKS ---
+    pagelink_raw = pdfium_c.FPDFLink_LoadWebLinks(text_page.get().raw) if web_links else None
+    if pagelink_raw:
+        try:
             count = pdfium_c.FPDFLink_CountWebLinks(pagelink_raw)
             for i in range(count):
                 buflen = pdfium_c.FPDFLink_GetURL(pagelink_raw, i, None, 0)
@@ -62,60 +191,84 @@ def analyze_pdf(path: str) -> Dict[str, Any]:
 
                 l, t, r, b = (ctypes.c_double() for _ in range(4))
                 pdfium_c.FPDFLink_GetRect(pagelink_raw, i, 0, ctypes.byref(l), ctypes.byref(t), ctypes.byref(r), ctypes.byref(b))
-                
+            
                 rect = [l.value, b.value, r.value, t.value]
-                links.append({
+                if with_text:
+                    with timing.stage("anchor_text"):
+                        link_text = text_page.get().get_text_bounded(left=l.value, top=t.value, right=r.value, bottom=b.value).strip() or url
+                else:
+                    link_text = ANCHOR_TEXT_SKIPPED
+                yield {
                     'page': source_ref.machine,
                     'rect': rect,
-                    'link_text': text_page.get_text_bounded(left=l.value, top=t.value, right=r.value, bottom=b.value).strip() or url,
+                    'link_text': link_text,
                     'type': 'External (URI)',
                     'url': url,
                     'target': url,
                     'source_kind': 'pypdfium2_weblink'
-                })
+                }
+        finally:
             pdfium_c.FPDFLink_CloseWebLinks(pagelink_raw)
 
-        # --- B. INTERNAL GOTO LINKS (Standard Annotations) ---
-        # We iterate through standard link annotations for GoTo actions
-        pos = 0
-        while True:
-            annot_raw = pdfium_c.FPDFPage_GetAnnot(page.raw, pos)
-            if not annot_raw:
-                break
-            
+    # --- B. LINK ANNOTATIONS ---
+    # Counted up front: pages without annotations end here
+    annot_count = pdfium_c.FPDFPage_GetAnnotCount(page.raw)
+    timing.count("annotations_seen", annot_count)
+    for pos in range(annot_count):
+        annot_raw = pdfium_c.FPDFPage_GetAnnot(page.raw, pos)
+        if not annot_raw:
+            continue
+        try:
             subtype = pdfium_c.FPDFAnnot_GetSubtype(annot_raw)
             if subtype == pdfium_c.FPDF_ANNOT_LINK:
                 # Get Rect
                 fs_rect = pdfium_c.FS_RECTF()
                 pdfium_c.FPDFAnnot_GetRect(annot_raw, fs_rect)
-                
+                rect = [fs_rect.left, fs_rect.bottom, fs_rect.right, fs_rect.top]
+            
                 # Try to get Destination
                 link_annot = pdfium_c.FPDFAnnot_GetLink(annot_raw)
                 dest = pdfium_c.FPDFLink_GetDest(doc.raw, link_annot)
-                
+                link_dict = None
+            
                 if dest:
                     dest_idx = pdfium_c.FPDFDest_GetDestPageIndex(doc.raw, dest)
                     dest_ref = PageRef.from_index(dest_idx)
-                    
-                    links.append({
+                    link_dict = {
                         'page': source_ref.machine,
-                        'rect': [fs_rect.left, fs_rect.bottom, fs_rect.right, fs_rect.top],
-                        'link_text': text_page.get_text_bounded(left=fs_rect.left, top=fs_rect.top, right=fs_rect.right, bottom=fs_rect.bottom).strip(),
+                        'rect': rect,
+                        'link_text': None,
                         'type': 'Internal (GoTo/Dest)',
                         'destination_page': dest_ref.machine,
                         'target': dest_ref.machine,
                         'source_kind': 'pypdfium2_annot'
-                    })
-            
-            # Note: We don't close annot here if we are just enumerating by index 
-            # in some builds, but standard practice is to increment pos
-            pos += 1
-
-        page.close()
-        text_page.close()
+                    }
+                elif not web_links:
+                    # Without text-based detection, URI annotations are the external links
+                    action = pdfium_c.FPDFLink_GetAction(link_annot)
+                    if action and pdfium_c.FPDFAction_GetType(action) == pdfium_c.PDFACTION_URI:
+                        url = _get_uri_path(doc, action)
+                        link_dict = {
+                            'page': source_ref.machine,
+                            'rect': rect,
+                            'link_text': None,
+                            'type': 'External (URI)',
+                            'url': url,
+                            'target': url,
+                            'source_kind': 'pypdfium2_annot'
+                        }
 
-    doc.close()
-    return {"links": links, "toc": toc_list}
+                if link_dict is not None:
+                    if with_text:
+                        with timing.stage("anchor_text"):
+                            link_dict['link_text'] = text_page.get().get_text_bounded(left=fs_rect.left, top=fs_rect.top, right=fs_rect.right, bottom=fs_rect.bottom).strip()
+                    else:
+                        link_dict['link_text'] = ANCHOR_TEXT_SKIPPED
+                    yield link_dict
+        finally:
+            # FPDFPage_GetAnnot hands out a new handle on every call. The link
+            # handle from FPDFAnnot_GetLink is owned by the page, not by us.
+            pdfium_c.FPDFPage_CloseAnnot(annot_raw)
 
 if __name__ == "__main__":
     import json
@@ -5,12 +5,18 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 import logging
-from typing import Dict, Any, Optional, List
+import functools
+import mmap
+from typing import Dict, Any, Iterator, Optional, List
 
 logging.getLogger("fitz").setLevel(logging.ERROR) 
 
 from pdflinkcheck.environment import pymupdf_is_available
-from pdflinkcheck.helpers import PageRef
+from pdflinkcheck.helpers import ANCHOR_TEXT_SKIPPED, PageRef, check_anchor_text_mode
+from pdflinkcheck import timing
+from pdflinkcheck.sharding import should_shard, run_sharded
+from pdflinkcheck.source import is_path, read_buffer, release_buffers
+from pdflinkcheck.spatial import WordGrid, expand_rect, match_boxes_to_rects
 
 try:
     if pymupdf_is_available():
@@ -24,6 +30,22 @@ except ImportError:
 Inspect target PDF for both URI links and for GoTo links.
 """
 
+# Pages per open document in low-memory mode, see extract_links_pymupdf()
+LOW_MEMORY_REOPEN_EVERY = 500
+
+# Clipped text passes per page for anchor_text="fast", see link_clips()
+FAST_MAX_CLIPS = 3
+
+def open_doc(pdf_source):
+    """fitz.Document for a path or an in-memory source (bytes, BytesIO, file object, mmap; see pdflinkcheck.source)."""
+    if is_path(pdf_source):
+        return fitz.open(pdf_source)
+    buffer = read_buffer(pdf_source)
+    if isinstance(buffer, mmap.mmap):
+        # PyMuPDF takes buffer views but not mmap objects themselves
+        buffer = memoryview(buffer)
+    return fitz.open(stream=buffer, filetype="pdf")
+
 # Helper function: Prioritize 'from'
 def get_link_rect(link_dict):
     """
@@ -50,7 +72,16 @@ def get_link_rect(link_dict):
     # 3. Fallback to None if 'from' is missing
     return None
 
-def get_anchor_text(page, link_rect):
+def get_anchor_text(page, link_rect, word_index: Optional[WordGrid] = None):
+    """
+    Collects the words intersecting the link rect, expanded asymmetrically.
+
+    Args:
+        page: The fitz.Page object where the link is located.
+        link_rect: A tuple of four floats (x0, y0, x1, y1).
+        word_index: Optional WordGrid built once per page from page.get_text("words").
+                    When omitted, the words are fetched and indexed for this call only.
+    """
     if not link_rect:
         return "N/A: Missing Rect"
 
@@ -63,23 +94,14 @@ def get_anchor_text(page, link_rect):
         # 2. Use asymmetric expansion (similar to the pypdf logic)
         # 10 points horizontal to catch wide characters/kerning
         # 3 points vertical to stay within the line
-        search_rect = fitz.Rect(
-            rect.x0 - 10, 
-            rect.y0 - 3, 
-            rect.x1 + 10, 
-            rect.y1 + 3
-        )
+        search_rect = expand_rect((rect.x0, rect.y0, rect.x1, rect.y1))
 
-        # 3. Extract all words on the page
+        # 3. Look up only the words near the link
         # Each word is: (x0, y0, x1, y1, "text", block_no, line_no, word_no)
-        words = page.get_text("words")
+        if word_index is None:
+            word_index = build_word_index(page)
         
-        anchor_parts = []
-        for w in words:
-            word_rect = fitz.Rect(w[:4])
-            # Check if the word intersects our expanded link rectangle
-            if word_rect.intersects(search_rect):
-                anchor_parts.append(w[4])
+        anchor_parts = word_index.texts_in(search_rect)
 
         cleaned_text = " ".join(anchor_parts).strip()
         
@@ -87,6 +109,92 @@ def get_anchor_text(page, link_rect):
             
     except Exception:
         return "N/A: Rect Error"
+
+def link_clips(search_rects: List[tuple]) -> List[tuple]:
+    """
+    Clip rects for anchor_text="fast": the link rects grouped into horizontal
+    bands, so links at the top and bottom of a page become two small clips
+    instead of one page-sized union. Every clipped get_text() still
+    interprets the whole page, so with more than FAST_MAX_CLIPS bands a
+    single clip around all of them is cheaper.
+    """
+    bands: List[tuple] = []
+    for x0, y0, x1, y1 in sorted(search_rects, key=lambda r: r[1]):
+        if bands and y0 <= bands[-1][3]:
+            bx0, by0, bx1, by1 = bands[-1]
+            bands[-1] = (min(bx0, x0), by0, max(bx1, x1), max(by1, y1))
+        else:
+            bands.append((x0, y0, x1, y1))
+    if len(bands) > FAST_MAX_CLIPS:
+        bands = [(
+            min(b[0] for b in bands), bands[0][1],
+            max(b[2] for b in bands), max(b[3] for b in bands),
+        )]
+    return bands
+
+def get_anchor_texts(page, link_rects: List[Optional[tuple]], clip_to_links: bool = False) -> List[str]:
+    """
+    Batched get_anchor_text() for every link rect on one page.
+
+    The words are fetched once and matched against all expanded link rects
+    in a single call to match_boxes_to_rects() (numpy broadcast when
+    available, WordGrid otherwise). Results line up with link_rects.
+
+    clip_to_links: Only extract words inside the expanded link rects, one
+                   clipped pass per band of links (anchor_text="fast", see
+                   link_clips()). Cheaper on text-heavy pages; a word
+                   straddling the clip edge may come back truncated.
+    """
+    results: List[Optional[str]] = [None] * len(link_rects)
+    search_rects: List[Optional[tuple]] = []
+
+    for i, link_rect in enumerate(link_rects):
+        search_rect = None
+        if not link_rect:
+            results[i] = "N/A: Missing Rect"
+        else:
+            try:
+                rect = fitz.Rect(link_rect)
+                if rect.is_empty:
+                    results[i] = "N/A: Rect Error"
+                else:
+                    search_rect = expand_rect((rect.x0, rect.y0, rect.x1, rect.y1))
+            except Exception:
+                results[i] = "N/A: Rect Error"
+        search_rects.append(search_rect)
+
+    if any(r is not None for r in search_rects):
+        try:
+            if clip_to_links:
+                words, seen = [], set()
+                for clip in link_clips([r for r in search_rects if r is not None]):
+                    for word in page.get_text("words", clip=fitz.Rect(clip)):
+                        # A word straddling two bands comes back from both
+                        if word[:5] not in seen:
+                            seen.add(word[:5])
+                            words.append(word)
+                    timing.count("text_extractions")
+            else:
+                words = page.get_text("words")
+                timing.count("text_extractions")
+            matches = match_boxes_to_rects(words, search_rects)
+        except Exception:
+            words, matches = [], None
+
+        for i, search_rect in enumerate(search_rects):
+            if search_rect is None:
+                continue
+            if matches is None:
+                results[i] = "N/A: Rect Error"
+                continue
+            cleaned_text = " ".join(words[j][4] for j in matches[i]).strip()
+            results[i] = cleaned_text if cleaned_text else "N/A: No Visible Text"
+
+    return results
+
+def build_word_index(page) -> WordGrid:
+    """Fetches the words of a page once and indexes them for per-link lookups."""
+    return WordGrid(page.get_text("words"))
     
 def get_anchor_text_stable(page, link_rect):
     """
@@ -183,7 +291,7 @@ def extract_toc_pymupdf(pdf_path):
         A list of dictionaries representing the structural TOC/bookmarks.
     """
     try:
-        doc = fitz.open(pdf_path)
+        doc = open_doc(pdf_path)
         structural_toc = analyze_toc_fitz(doc)
     except Exception as e:
         print(f"An error occurred: {e}", file=sys.stderr)
@@ -218,28 +326,127 @@ def serialize_fitz_object(obj):
     return obj
 
 
-def extract_links_pymupdf(pdf_path):
+def extract_links_pymupdf(pdf_path, jobs: int = 1, anchor_text: str = "accurate", low_memory: bool = False, reopen_every: Optional[int] = None):
+    """
+    Args:
+        pdf_path: The file system path (str) to the target PDF document, or the
+                  document itself in memory (see open_doc()).
+        jobs: Worker processes for page-sharded extraction of very large documents.
+              1 (default) stays in-process; 0 uses all CPU cores. Documents under
+              sharding.SHARD_MIN_PAGES pages are always extracted in-process.
+        anchor_text: "accurate" (default), "fast" or "none", see iter_links_from_doc().
+        low_memory: Reopen the document every LOW_MEMORY_REOPEN_EVERY pages.
+                    MuPDF keeps every object it has parsed until the document
+                    is closed, so this is what bounds resident memory on
+                    multi-thousand-page documents.
+        reopen_every: Reopen the document every N pages (overrides the
+                      low_memory default; 0 never reopens).
+    """
+    if reopen_every is None:
+        reopen_every = LOW_MEMORY_REOPEN_EVERY if low_memory else 0
     links_data = []
     try:
-        doc = fitz.open(pdf_path)        
+        doc = open_doc(pdf_path)
+    except Exception as e:
+        print(f"An error occurred: {e}", file=sys.stderr)
+        return links_data
+    page_count = doc.page_count
+    # Workers reopen the file by path, so in-memory documents are never sharded
+    shard_path = pdf_path if is_path(pdf_path) else None
+    if reopen_every and page_count > reopen_every and not (shard_path and should_shard(page_count, jobs)):
+        # Page shards already get short-lived documents of their own
+        doc.close()
+        release_buffers(doc)
+        return list(iter_links_reopening(pdf_path, page_count, reopen_every, anchor_text))
+    links_data = extract_links_from_doc(doc, pdf_path=shard_path, jobs=jobs, anchor_text=anchor_text)
+    doc.close()
+    release_buffers(doc)
+    return links_data
+
+def iter_links_reopening(pdf_path, page_count: int, reopen_every: int = LOW_MEMORY_REOPEN_EVERY, anchor_text: str = "accurate") -> Iterator[Dict[str, Any]]:
+    """
+    iter_links_from_doc() over chunks of reopen_every pages, each with a freshly
+    opened document (low-memory mode; used by pdflinkcheck.session.PymupdfSession).
+    """
+    for start in range(0, page_count, reopen_every):
+        doc = open_doc(pdf_path)
+        try:
+            yield from iter_links_from_doc(doc, range(start, min(start + reopen_every, page_count)), anchor_text=anchor_text)
+        finally:
+            doc.close()
+            release_buffers(doc)
+
+def _extract_links_shard(pdf_path, start: int, stop: int, anchor_text: str = "accurate") -> List[Dict[str, Any]]:
+    """Worker for sharding.run_sharded(): open the document and extract pages [start, stop)."""
+    doc = open_doc(pdf_path)
+    try:
+        return extract_links_from_doc(doc, page_range=range(start, stop), anchor_text=anchor_text)
+    finally:
+        doc.close()
+
+def extract_links_from_doc(doc, page_range: Optional[range] = None, pdf_path=None, jobs: int = 1, anchor_text: str = "accurate") -> List[Dict[str, Any]]:
+    """
+    Link extraction from an already open fitz.Document.
+    Used by extract_links_pymupdf() and by pdflinkcheck.session.PymupdfSession.
+    The document is left open; the caller owns it.
+
+    Args:
+        doc: The open fitz.Document.
+        page_range: 0-based pages to extract. Defaults to every page.
+        pdf_path: Path the workers reopen when sharding. Sharding is skipped without it.
+        jobs: See extract_links_pymupdf().
+        anchor_text: See iter_links_from_doc().
+    """
+    check_anchor_text_mode(anchor_text)
+    if page_range is None and pdf_path is not None and should_shard(doc.page_count, jobs):
+        shard_fn = functools.partial(_extract_links_shard, anchor_text=anchor_text)
+        try:
+            return run_sharded(shard_fn, str(pdf_path), doc.page_count, jobs)
+        except Exception as e:
+            print(f"Page-sharded extraction failed, continuing in a single process: {e}", file=sys.stderr)
+
+    return list(iter_links_from_doc(doc, page_range, anchor_text=anchor_text))
+
+def iter_links_from_doc(doc, page_range: Optional[range] = None, anchor_text: str = "accurate") -> Iterator[Dict[str, Any]]:
+    """
+    Yield link dicts page by page from an already open fitz.Document.
+    page_range: 0-based pages to scan. Defaults to every page.
+    anchor_text: "accurate" extracts every word on the page, "fast" only the
+                 words inside the link rects (see get_anchor_texts()), "none"
+                 skips text extraction and sets link_text to ANCHOR_TEXT_SKIPPED.
+    """
+    check_anchor_text_mode(anchor_text)
+    if page_range is None:
+        page_range = range(doc.page_count)
+
+    try:
         # This represents the maximum valid 0-index in the doc
         last_page_ref = PageRef.from_pymupdf_total_page_count(doc.page_count)
 
         #print(last_page_ref)       # Output: "358" (Because of __str__)
         #print(int(last_page_ref))  # Output: 357   (Because of __int__)
 
-        for page_num in range(doc.page_count):
+        for page_num in page_range:
             page = doc.load_page(page_num)
+            timing.count("pages_loaded")
             source_ref = PageRef.from_index(page_num)
 
-            for link in page.get_links():
-                link_rect = get_link_rect(link)
-                anchor_text = get_anchor_text(page, link_rect)
+            page_links = page.get_links()
+            timing.count("annotations_seen", len(page_links))
+            # Anchor text for every link on the page is resolved in one batch
+            link_rects = [get_link_rect(link) for link in page_links]
+            if anchor_text == "none":
+                anchor_texts = [ANCHOR_TEXT_SKIPPED] * len(page_links)
+            else:
+                with timing.stage("anchor_text"):
+                    anchor_texts = get_anchor_texts(page, link_rects, clip_to_links=(anchor_text == "fast"))
+
+            for link, link_rect, link_text in zip(page_links, link_rects, anchor_texts):
                 
                 link_dict = {
                     'page': source_ref.machine,
                     'rect': link_rect,
-                    'link_text': anchor_text,
+                    'link_text': link_text,
                     'xref': link.get("xref")
                 }
                 
@@ -298,11 +505,9 @@ def extract_links_pymupdf(pdf_path):
                         'target': 'Unknown'  # STRING
                     })
 
-                links_data.append(link_dict)
-        doc.close()
+                yield link_dict
     except Exception as e:
         print(f"An error occurred: {e}", file=sys.stderr)
-    return links_data
 
 def call_stable():
     """
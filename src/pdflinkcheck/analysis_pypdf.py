@@ -3,13 +3,17 @@
 # src/pdflinkcheck/analysis_pypdf.py
 from __future__ import annotations
 import sys
+import itertools
 from pathlib import Path
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterator, Optional, List, Tuple
 
 from pypdf import PdfReader
-from pypdf.generic import Destination, NameObject, ArrayObject, IndirectObject
-from pdflinkcheck.helpers import PageRef
+from pypdf.generic import Destination, NameObject, ArrayObject, DictionaryObject, IndirectObject
+from pdflinkcheck import timing
+from pdflinkcheck.helpers import ANCHOR_TEXT_SKIPPED, PageRef, check_anchor_text_mode
+from pdflinkcheck.source import is_path, open_stream
+from pdflinkcheck.spatial import expand_rect, match_points_to_rects
 
 
 from pdflinkcheck.io import error_logger, export_report_data, get_first_pdf_in_cwd, LOG_FILE_PATH
@@ -18,10 +22,30 @@ from pdflinkcheck.io import error_logger, export_report_data, get_first_pdf_in_c
 Inspect target PDF for both URI links and for GoTo links, using only pypdf, not Fitz
 """
 
-def get_anchor_text_pypdf(page, rect) -> str:
+def get_text_runs_pypdf(page) -> List[Tuple[str, float, float]]:
+    """
+    Parses the page content stream once and collects every non-blank text run
+    with its insertion point (x, y), taken from the text matrix.
+    The result is shared by all link rects on the page, see get_anchor_text_pypdf().
+    """
+    runs: List[Tuple[str, float, float]] = []
+
+    def visitor_body(text, cm, tm, font_dict, font_size):
+        # tm[4], tm[5] are the current text insertion point coordinates (x, y)
+        if text.strip():
+            runs.append((text, tm[4], tm[5]))
+
+    page.extract_text(visitor_text=visitor_body)
+    timing.count("text_extractions")
+    return runs
+
+def get_anchor_text_pypdf(page, rect, text_runs: Optional[List[Tuple[str, float, float]]] = None) -> str:
     """
     Extracts text within the link's bounding box using a visitor function.
     Reliable for finding text associated with a link without PyMuPDF.
+
+    Pass text_runs from get_text_runs_pypdf() to avoid re-parsing the page
+    content stream for every link on the same page.
     """
     if not rect:
         return "N/A: Missing Rect"
@@ -32,39 +56,151 @@ def get_anchor_text_pypdf(page, rect) -> str:
     y_min = min(rect[1], rect[3])
     x_max = max(rect[0], rect[2])
     y_max = max(rect[1], rect[3])
-    
-    parts: List[str] = []
 
-    def visitor_body(text, cm, tm, font_dict, font_size):
-        # tm[4], tm[5] are the current text insertion point coordinates (x, y)
-        x, y = tm[4], tm[5]
+    if text_runs is None:
+        text_runs = get_text_runs_pypdf(page)
 
-        # Using a threshold to account for font metrics/descenders
-        # Generous tolerance (±10 pt) to catch descenders, ascenders, kerning, and minor misalignments
-        tolerance = 10
-        if (x_min - tolerance) <= x <= (x_max + tolerance) and (y_min - tolerance) <= y <= (y_max + tolerance):
-            if text.strip():
-                parts.append(text)
+    # Using a threshold to account for font metrics/descenders
+    # Generous tolerance (±10 pt) to catch descenders, ascenders, kerning, and minor misalignments
+    tolerance = 10
+    x_lo, x_hi = x_min - tolerance, x_max + tolerance
+    y_lo, y_hi = y_min - tolerance, y_max + tolerance
 
-    page.extract_text(visitor_text=visitor_body)
+    parts: List[str] = [
+        text for text, x, y in text_runs
+        if x_lo <= x <= x_hi and y_lo <= y <= y_hi
+    ]
     
     raw_extracted = "".join(parts)
     cleaned = " ".join(raw_extracted.split()).strip()
     
     return cleaned if cleaned else "Graphic/Empty Link"
 
-def resolve_pypdf_destination(reader: PdfReader, dest, obj_id_to_page: dict) -> Optional[int]:
+def get_anchor_texts_pypdf(page, rects: List[Any]) -> List[str]:
+    """
+    Batched get_anchor_text_pypdf() for every link rect on one page.
+
+    The page text runs are parsed once (only if some link has a Rect) and
+    matched against all link rects in a single call to match_points_to_rects().
+    Results line up with rects.
+    """
+    # Same ±10 pt tolerance as get_anchor_text_pypdf()
+    tolerance = 10
+    search_rects = [
+        expand_rect((min(r[0], r[2]), min(r[1], r[3]), max(r[0], r[2]), max(r[1], r[3])), tolerance, tolerance)
+        if r else None
+        for r in rects
+    ]
+    if not any(search_rects):
+        return ["N/A: Missing Rect"] * len(rects)
+
+    text_runs = get_text_runs_pypdf(page)
+    matches = match_points_to_rects([(x, y) for _, x, y in text_runs], search_rects)
+
+    results: List[str] = []
+    for search_rect, idxs in zip(search_rects, matches):
+        if search_rect is None:
+            results.append("N/A: Missing Rect")
+            continue
+        raw_extracted = "".join(text_runs[j][0] for j in idxs)
+        cleaned = " ".join(raw_extracted.split()).strip()
+        results.append(cleaned if cleaned else "Graphic/Empty Link")
+    return results
+
+def _dest_array_to_page(value, obj_id_to_page: dict) -> Optional[int]:
+    """Page index of an explicit destination: [page_ref /XYZ ...] or a dict holding one under /D."""
+    try:
+        value = value.get_object()
+        if isinstance(value, DictionaryObject):
+            value = value.get("/D")
+            value = value.get_object() if value is not None else None
+        if isinstance(value, ArrayObject) and len(value) > 0:
+            if isinstance(value[0], IndirectObject):
+                return obj_id_to_page.get(value[0].idnum)
+    except Exception:
+        pass
+    return None
+
+def _name_key(name) -> str:
+    name = name.get_object() if isinstance(name, IndirectObject) else name
+    if isinstance(name, bytes):
+        return name.decode("latin-1")
+    return str(name)
+
+def build_named_dest_index(reader: PdfReader, obj_id_to_page: dict) -> Dict[str, int]:
+    """
+    Flatten the catalog's /Dests dictionary and /Names -> /Dests name tree into
+    one {name: 0-based page index} map, so each named link resolves with a dict lookup.
+    Names whose target page cannot be found are left out.
+    """
+    index: Dict[str, int] = {}
+    try:
+        root = reader.trailer["/Root"].get_object()
+    except Exception:
+        return index
+
+    # PDF 1.1 style: /Dests is a plain dictionary keyed by name objects
+    try:
+        dests = root.get("/Dests")
+        if dests is not None:
+            for name, value in dests.get_object().items():
+                page = _dest_array_to_page(value, obj_id_to_page)
+                if page is not None:
+                    index[str(name)] = page
+    except Exception as e:
+        error_logger.warning(f"Could not read /Dests dictionary: {e}")
+
+    # PDF 1.2+ style: /Names /Dests is a name tree of /Kids and [key value ...] /Names arrays
+    try:
+        names = root.get("/Names")
+        tree = names.get_object().get("/Dests") if names is not None else None
+        stack = [tree] if tree is not None else []
+        seen = set()
+        while stack:
+            node_ref = stack.pop()
+            if isinstance(node_ref, IndirectObject):
+                if node_ref.idnum in seen:
+                    continue # Malformed trees can loop
+                seen.add(node_ref.idnum)
+            node = node_ref.get_object()
+            pairs = node.get("/Names")
+            if pairs is not None:
+                pairs = pairs.get_object()
+                for i in range(0, len(pairs) - 1, 2):
+                    page = _dest_array_to_page(pairs[i + 1], obj_id_to_page)
+                    if page is not None:
+                        index.setdefault(_name_key(pairs[i]), page)
+            kids = node.get("/Kids")
+            if kids is not None:
+                stack.extend(reversed(kids.get_object()))
+    except Exception as e:
+        error_logger.warning(f"Could not read /Names /Dests tree: {e}")
+
+    return index
+
+def resolve_pypdf_destination(reader: PdfReader, dest, obj_id_to_page: dict, named_dests: Optional[Dict[str, int]] = None) -> Optional[int]:
     try:
         if isinstance(dest, Destination):
             # .page_number in pypdf is already 0-indexed
             return dest.page_number 
 
         if isinstance(dest, IndirectObject):
-            return obj_id_to_page.get(dest.idnum)
+            if dest.idnum in obj_id_to_page:
+                return obj_id_to_page[dest.idnum]
+            # Indirect reference to the destination itself (array, dict or name)
+            dest = dest.get_object()
 
-        if isinstance(dest, ArrayObject) and len(dest) > 0:
-            if isinstance(dest[0], IndirectObject):
-                return obj_id_to_page.get(dest[0].idnum)
+        if isinstance(dest, (ArrayObject, DictionaryObject)):
+            return _dest_array_to_page(dest, obj_id_to_page)
+
+        # Named destination: /Name (via /Dests) or string (via the /Names tree)
+        if named_dests is not None and isinstance(dest, (str, bytes)):
+            key = _name_key(dest)
+            page = named_dests.get(key)
+            if page is None:
+                # Writers disagree on whether /Dests keys and link names carry the leading slash
+                page = named_dests.get(key[1:] if key.startswith("/") else "/" + key)
+            return page
 
         return None  # Unresolved → None
     except Exception:
@@ -89,84 +225,181 @@ def resolve_pypdf_destination_(reader: PdfReader, dest, obj_id_to_page: dict) ->
     except Exception:
         return "Error Resolving"
 
-def extract_links_pypdf(pdf_path):
+def open_reader(pdf_source) -> PdfReader:
+    """PdfReader for a path or an in-memory source (bytes, BytesIO, file object, mmap; see pdflinkcheck.source)."""
+    return PdfReader(pdf_source if is_path(pdf_source) else open_stream(pdf_source))
+
+def extract_links_pypdf(pdf_path, anchor_text: str = "accurate", low_memory: bool = False, reopen_every: int = 0):
     """
     Termux-compatible link extraction using pure-Python pypdf.
     Matches the reporting schema of the PyMuPDF version.
+    pdf_path: A path, or the document itself in memory (see open_reader()).
+    anchor_text: "accurate" (default), "fast" or "none", see iter_links_from_reader().
+    low_memory: Drop each page's parsed objects once its links are emitted, so
+                the reader's object cache no longer grows with the page count.
+                Shared objects such as fonts are parsed again for every page.
+    reopen_every: Also start a fresh PdfReader every N pages (0, the default,
+                  never reopens). Rarely needed: low_memory alone keeps pypdf
+                  flat, and each reopen re-reads the file and its page tree.
+    """
+    if reopen_every:
+        return list(_iter_links_reopening(pdf_path, reopen_every, anchor_text, low_memory))
+    reader = open_reader(pdf_path)
+    return list(iter_links_from_reader(reader, anchor_text=anchor_text, low_memory=low_memory))
+
+def _iter_links_reopening(pdf_path, reopen_every: int, anchor_text: str, low_memory: bool) -> Iterator[Dict[str, Any]]:
+    """iter_links_from_reader() over chunks of reopen_every pages, each with a fresh PdfReader."""
+    total_pages = len(open_reader(pdf_path).pages)
+    for start in range(0, total_pages, reopen_every):
+        reader = open_reader(pdf_path)
+        yield from iter_links_from_reader(
+            reader, range(start, min(start + reopen_every, total_pages)), anchor_text, low_memory
+        )
+
+def extract_links_from_reader(reader: PdfReader, anchor_text: str = "accurate", low_memory: bool = False) -> List[Dict[str, Any]]:
+    """
+    Link extraction from an already open PdfReader.
+    Used by extract_links_pypdf() and by pdflinkcheck.session.PypdfSession.
+    low_memory: See extract_links_pypdf().
+    """
+    return list(iter_links_from_reader(reader, anchor_text=anchor_text, low_memory=low_memory))
+
+def link_dict_from_annot(reader: PdfReader, obj, page_source: PageRef, link_text: str, obj_id_to_page: dict, named_dests: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
+    """
+    Classify one /Link annotation dictionary into the shared link schema.
+    Used by iter_links_from_reader() and by the anchor-text-free xref scanner (analysis_xref.py).
     """
-    reader = PdfReader(pdf_path)
+    rect = obj.get("/Rect")
+    link_dict = {
+        'page': page_source.machine,
+        'rect': list(rect) if rect else None,
+        'link_text': link_text,
+        'type': 'Other Action',
+        'target': 'Unknown'
+    }
+    
+    # Handle URI (External)
+    if "/A" in obj and "/URI" in obj["/A"]:
+        uri = obj["/A"]["/URI"]
+        link_dict.update({
+            'type': 'External (URI)',
+            'url': uri,
+            'target': uri
+        })
+    
+    # Handle GoTo (Internal)
+    elif "/Dest" in obj or ("/A" in obj and "/D" in obj["/A"]):
+        # An empty or null /Dest falls back to the action's /D, when there is one
+        dest = obj.get("/Dest")
+        if not dest and "/A" in obj:
+            dest = obj["/A"].get("/D")
+        target_page = resolve_pypdf_destination(reader, dest, obj_id_to_page, named_dests)
+        # print(f"DEBUG: resolved target_page = {target_page} (type: {type(target_page)})")
+        if target_page is not None:
+            dest_page = PageRef.from_index(target_page)
+            link_dict.update({
+                'type': 'Internal (GoTo/Dest)',
+                'destination_page': dest_page.machine,
+                #'target': f"Page {target_page}"
+                'target': dest_page.machine
+            })
     
+    # Handle Remote GoTo (GoToR)
+    elif "/A" in obj and obj["/A"].get("/S") == "/GoToR":
+        remote_file = obj["/A"].get("/F")
+        link_dict.update({
+            'type': 'Remote (GoToR)',
+            'remote_file': str(remote_file),
+            'target': f"File: {remote_file}"
+        })
+
+    return link_dict
+
+def _drop_resolved_since(reader: PdfReader, mark: int) -> None:
+    """Forget the objects the reader resolved since len(reader.resolved_objects) was mark."""
+    # resolved_objects is a plain dict, so the newest entries are at the end
+    cache = reader.resolved_objects
+    # Still counted as resolved (PypdfSession counts what is left at close)
+    timing.count("objects_resolved", len(cache) - mark)
+    for key in list(itertools.islice(reversed(cache), len(cache) - mark)):
+        del cache[key]
+
+def iter_links_from_reader(reader: PdfReader, page_range: Optional[range] = None, anchor_text: str = "accurate", low_memory: bool = False) -> Iterator[Dict[str, Any]]:
+    """
+    Yield link dicts page by page from an already open PdfReader.
+    page_range: 0-based pages to scan. Defaults to every page.
+    anchor_text: "none" skips the content stream parse and sets link_text to
+                 ANCHOR_TEXT_SKIPPED. "fast" and "accurate" are the same here:
+                 one text pass per page that has links is already the cheapest
+                 path pypdf offers.
+    low_memory: Evict the objects resolved for a page (annotations, content
+                streams, fonts) from the reader's cache after its links are
+                yielded, instead of keeping them for the reader's lifetime.
+    """
+    check_anchor_text_mode(anchor_text)
+
     # Pre-map Object IDs to Page Numbers for fast internal link resolution
     obj_id_to_page = {
         page.indirect_reference.idnum: i
         for i, page in enumerate(reader.pages)
     }
 
-    all_links = []
-    
-    for i, page in enumerate(reader.pages):
-        #page_num = i 
-        # Use PageRef to stay consistent
-        page_source = PageRef.from_index(i)
-        if "/Annots" not in page:
-            continue
-            
-        for annot in page["/Annots"]:
-            obj = annot.get_object()
-            if obj.get("/Subtype") != "/Link":
+    # Named destinations, flattened once per document
+    named_dests = build_named_dest_index(reader, obj_id_to_page)
+
+    if page_range is None:
+        page_range = range(len(reader.pages))
+
+    for i in page_range:
+        resolved_mark = len(reader.resolved_objects)
+        # finally: pages without /Annots, and a consumer that stops early, are evicted too
+        try:
+            page = reader.pages[i]
+            timing.count("pages_loaded")
+            #page_num = i 
+            # Use PageRef to stay consistent
+            page_source = PageRef.from_index(i)
+            if "/Annots" not in page:
                 continue
 
-            rect = obj.get("/Rect")
-            anchor_text = get_anchor_text_pypdf(page, rect)
-            
-            link_dict = {
-                'page': page_source.machine,
-                'rect': list(rect) if rect else None,
-                'link_text': anchor_text,
-                'type': 'Other Action',
-                'target': 'Unknown'
-            }
-            
-            # Handle URI (External)
-            if "/A" in obj and "/URI" in obj["/A"]:
-                uri = obj["/A"]["/URI"]
-                link_dict.update({
-                    'type': 'External (URI)',
-                    'url': uri,
-                    'target': uri
-                })
-            
-            # Handle GoTo (Internal)
-            elif "/Dest" in obj or ("/A" in obj and "/D" in obj["/A"]):
-                dest = obj.get("/Dest") or obj["/A"].get("/D")
-                target_page = resolve_pypdf_destination(reader, dest, obj_id_to_page)
-                # print(f"DEBUG: resolved target_page = {target_page} (type: {type(target_page)})")
-                if target_page is not None:
-                    dest_page = PageRef.from_index(target_page)
-                    link_dict.update({
-                        'type': 'Internal (GoTo/Dest)',
-                        'destination_page': dest_page.machine,
-                        #'target': f"Page {target_page}"
-                        'target': dest_page.machine
-                    })
-            
-            # Handle Remote GoTo (GoToR)
-            elif "/A" in obj and obj["/A"].get("/S") == "/GoToR":
-                remote_file = obj["/A"].get("/F")
-                link_dict.update({
-                    'type': 'Remote (GoToR)',
-                    'remote_file': str(remote_file),
-                    'target': f"File: {remote_file}"
-                })
+            page_link_objs = []
+            annots = page["/Annots"]
+            timing.count("annotations_seen", len(annots))
+            for annot in annots:
+                obj = annot.get_object()
+                if obj.get("/Subtype") != "/Link":
+                    continue
+                page_link_objs.append(obj)
+
+            # Anchor text for every link on the page is resolved in one sweep
+            if anchor_text == "none":
+                page_anchor_texts = [ANCHOR_TEXT_SKIPPED] * len(page_link_objs)
+            else:
+                page_rects = [obj.get("/Rect") for obj in page_link_objs]
+                with timing.stage("anchor_text"):
+                    page_anchor_texts = get_anchor_texts_pypdf(page, page_rects)
 
-            all_links.append(link_dict)
-                        
-    return all_links
+            for obj, link_text in zip(page_link_objs, page_anchor_texts):
+                yield link_dict_from_annot(reader, obj, page_source, link_text, obj_id_to_page, named_dests)
+        finally:
+            if low_memory:
+                _drop_resolved_since(reader, resolved_mark)
 
 
 def extract_toc_pypdf(pdf_path: str) -> List[Dict[str, Any]]:
     try:
-        reader = PdfReader(pdf_path)
+        reader = open_reader(pdf_path)
+    except Exception as e:
+        print(f"TOC error: {e}", file=sys.stderr)
+        return []
+    return extract_toc_from_reader(reader)
+
+def extract_toc_from_reader(reader: PdfReader) -> List[Dict[str, Any]]:
+    """
+    TOC extraction from an already open PdfReader.
+    Used by extract_toc_pypdf() and by pdflinkcheck.session.PypdfSession.
+    """
+    try:
         # Note: outline is a property, not a method.
         toc_tree = reader.outline 
         toc_data = []
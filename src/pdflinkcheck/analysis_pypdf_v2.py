@@ -5,11 +5,13 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 
 from pypdf import PdfReader
 from pypdf.generic import Destination, NameObject, IndirectObject
 
+from pdflinkcheck.spatial import ANCHOR_H_TOL, ANCHOR_V_TOL, expand_rect, match_points_to_rects
+
 """
 Inspect target PDF for both URI links and GoTo links, using only pypdf (no PyMuPDF/Fitz).
 Fully fixed and improved version as of December 2025 (compatible with pypdf >= 4.0).
@@ -66,6 +68,51 @@ def get_anchor_text_pypdf(page, rect) -> str:
     return cleaned if cleaned else "Graphic/Empty Link"
 
 
+def get_text_runs_pypdf(page) -> List[Tuple[str, float, float]]:
+    """
+    Parses the page content stream once and returns every non-blank text run
+    with its approximate character center (x, y), as computed in get_anchor_text_pypdf().
+    """
+    runs: List[Tuple[str, float, float]] = []
+
+    def visitor_body(text: str, cm, tm, font_dict, font_size):
+        if not text.strip():
+            return
+        actual_font_size = font_size if font_size else 10
+        runs.append((text, tm[4] + (actual_font_size / 4), tm[5] + (actual_font_size / 3)))
+
+    page.extract_text(visitor_text=visitor_body)
+    return runs
+
+
+def get_anchor_texts_pypdf(page, rects: List[Optional[Any]]) -> List[str]:
+    """
+    Batched get_anchor_text_pypdf() for every link rect on one page.
+    The page is parsed once and all rects (with the same 10pt / 3pt asymmetric
+    tolerance) are matched in one call to match_points_to_rects().
+    """
+    search_rects = [
+        expand_rect((min(r[0], r[2]), min(r[1], r[3]), max(r[0], r[2]), max(r[1], r[3])), ANCHOR_H_TOL, ANCHOR_V_TOL)
+        if r else None
+        for r in rects
+    ]
+    if not any(search_rects):
+        return ["N/A: Missing Rect"] * len(rects)
+
+    text_runs = get_text_runs_pypdf(page)
+    matches = match_points_to_rects([(x, y) for _, x, y in text_runs], search_rects)
+
+    results: List[str] = []
+    for search_rect, idxs in zip(search_rects, matches):
+        if search_rect is None:
+            results.append("N/A: Missing Rect")
+            continue
+        raw = "".join(text_runs[j][0] for j in idxs)
+        cleaned = " ".join(raw.split()).strip()
+        results.append(cleaned if cleaned else "Graphic/Empty Link")
+    return results
+
+
 def resolve_pypdf_destination(reader: PdfReader, dest) -> str:
     """
     Resolves any form of destination (/Dest or /A /D) to a human-readable page number.
@@ -107,6 +154,7 @@ def extract_links_pypdf(pdf_path: Path | str) -> List[Dict[str, Any]]:
             continue
 
         annots = page["/Annots"]
+        page_links: List[Any] = []
         for annot_ref in annots:
             try:
                 annot = annot_ref.get_object()
@@ -115,10 +163,13 @@ def extract_links_pypdf(pdf_path: Path | str) -> List[Dict[str, Any]]:
 
             if annot.get("/Subtype") != "/Link":
                 continue
+            page_links.append(annot)
 
-            rect = annot.get("/Rect")
-            anchor_text = get_anchor_text_pypdf(page, rect)
+        # Anchor text for every link on the page is resolved in one batch
+        page_rects = [annot.get("/Rect") for annot in page_links]
+        page_anchor_texts = get_anchor_texts_pypdf(page, page_rects)
 
+        for annot, rect, anchor_text in zip(page_links, page_rects, page_anchor_texts):
             link_dict: Dict[str, Any] = {
                 "page": page_num,
                 "rect": list(rect) if rect else None,
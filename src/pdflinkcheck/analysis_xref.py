@@ -0,0 +1,768 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# src/pdflinkcheck/analysis_xref.py
+from __future__ import annotations
+import mmap
+import re
+import zlib
+from typing import Dict, Any, Iterator, List, NamedTuple, Optional, Tuple
+
+from pdflinkcheck import timing
+from pdflinkcheck.helpers import ANCHOR_TEXT_SKIPPED, PageRef
+from pdflinkcheck.source import is_path, read_buffer, release_buffers
+
+"""
+Raw xref-level link scanner ("xref" engine) for triage runs.
+
+Counts and classifies links without anchor text, at close to disk speed.
+RawPdf reads the cross-reference table (classic tables, xref streams and
+hybrid files, following /Prev), and parses single objects on demand straight
+from the memory-mapped file or from decompressed object streams. Link
+extraction walks the page tree from /Root, reads each page's /Annots array
+and touches only /Subtype /Link dictionaries and their /A and /Dest entries.
+No page objects are built and no content stream is decoded.
+
+Records use the pypdf engine's schema, with link_text set to
+ANCHOR_TEXT_SKIPPED, the same placeholder as anchor_text="none" in every
+engine. Encrypted files, filters other than FlateDecode on xref/object
+streams, and damaged cross-reference data raise XrefError;
+open_xref_document() then falls back to an object-level walk through pypdf,
+which is slower but still skips anchor text.
+"""
+
+# How far back from EOF to look for "startxref"
+STARTXREF_SEARCH_BYTES = 4096
+
+
+class XrefError(Exception):
+    """The raw scanner cannot handle this file; use the pypdf fallback."""
+
+
+# Anything the raw scanner may raise on malformed input
+RAW_SCAN_ERRORS = (XrefError, ValueError, KeyError, IndexError, TypeError, AttributeError)
+
+
+class Ref(NamedTuple):
+    num: int
+    gen: int
+
+
+class Name(str):
+    """A PDF name, kept with its leading slash like pypdf's NameObject ("/Link")."""
+    __slots__ = ()
+
+
+# --- Tokenizer / object parser -------------------------------------------------
+
+_WS = re.compile(rb"(?:[\x00\t\n\x0c\r ]+|%[^\r\n]*)*")
+_OBJ_HEADER = re.compile(rb"[\x00\t\n\x0c\r ]*(\d+)[\x00\t\n\x0c\r ]+(\d+)[\x00\t\n\x0c\r ]+obj")
+# Classic xref table rows: 10-digit offset, 5-digit generation, n/f, two-byte EOL
+_XREF_BLOCK = re.compile(rb"(?:\d{10} \d{5} [nf](?: \r| \n|\r\n))*")
+_XREF_ROW = re.compile(rb"(\d{10}) \d{5} ([nf])")
+_NAME_ESCAPE = re.compile(rb"#([0-9A-Fa-f]{2})")
+_HEX_JUNK = re.compile(rb"[^0-9A-Fa-f]")
+_STRING_ESCAPES = {
+    ord("n"): b"\n", ord("r"): b"\r", ord("t"): b"\t", ord("b"): b"\b", ord("f"): b"\x0c",
+    ord("("): b"(", ord(")"): b")", ord("\\"): b"\\",
+}
+
+
+def _decode_text(raw: bytes) -> str:
+    """PDF text string to str: UTF-16BE/UTF-8 with BOM, otherwise Latin-1 (close to PDFDocEncoding)."""
+    if raw.startswith(b"\xfe\xff"):
+        return raw[2:].decode("utf-16-be", errors="replace")
+    if raw.startswith(b"\xef\xbb\xbf"):
+        return raw[3:].decode("utf-8", errors="replace")
+    return raw.decode("latin-1")
+
+
+def _parse_literal_string(buf, pos: int) -> Tuple[str, int]:
+    # pos is just past the opening "("
+    out = bytearray()
+    depth = 1
+    end = len(buf)
+    while pos < end:
+        c = buf[pos]
+        if c == 0x5C:  # backslash
+            pos += 1
+            if pos >= end:
+                break
+            c = buf[pos]
+            if c in _STRING_ESCAPES:
+                out += _STRING_ESCAPES[c]
+                pos += 1
+            elif 0x30 <= c <= 0x37:  # octal, up to 3 digits
+                digits = 0
+                value = 0
+                while pos < end and digits < 3 and 0x30 <= buf[pos] <= 0x37:
+                    value = value * 8 + buf[pos] - 0x30
+                    pos += 1
+                    digits += 1
+                out.append(value & 0xFF)
+            elif c in (0x0D, 0x0A):  # line continuation
+                pos += 1
+                if c == 0x0D and pos < end and buf[pos] == 0x0A:
+                    pos += 1
+            else:
+                out.append(c)
+                pos += 1
+            continue
+        if c == 0x28:
+            depth += 1
+        elif c == 0x29:
+            depth -= 1
+            if depth == 0:
+                return _decode_text(bytes(out)), pos + 1
+        out.append(c)
+        pos += 1
+    raise XrefError("Unterminated string")
+
+
+_TOKEN = re.compile(
+    rb"(?:[\x00\t\n\x0c\r ]+|%[^\r\n]*)*"  # whitespace and comments
+    rb"(?:"
+    rb"(?P<ref>(\d+)[\x00\t\n\x0c\r ]+(\d+)[\x00\t\n\x0c\r ]+R(?![A-Za-z]))"
+    rb"|(?P<num>[+-]?(?:\d+\.?\d*|\.\d+))"
+    rb"|(?P<name>/[^\x00\t\n\x0c\r ()<>\[\]{}/%]*)"
+    rb"|(?P<dopen><<)|(?P<dclose>>>)|(?P<aopen>\[)|(?P<aclose>\])"
+    rb"|(?P<hex><[^>]*>)"
+    rb"|(?P<str>\()"
+    rb"|(?P<kw>[A-Za-z]+)"
+    rb")"
+)
+
+
+# Names repeat constantly (/Type, /Annot, /Rect ...); decode each spelling once
+_NAME_CACHE: Dict[bytes, Name] = {}
+_NAME_CACHE_MAX = 4096
+
+
+def _name(raw: bytes) -> Name:
+    name = _NAME_CACHE.get(raw)
+    if name is None:
+        text = raw
+        if b"#" in text:
+            text = _NAME_ESCAPE.sub(lambda e: bytes([int(e.group(1), 16)]), text)
+        name = Name(text.decode("latin-1"))
+        if len(_NAME_CACHE) < _NAME_CACHE_MAX:
+            _NAME_CACHE[raw] = name
+    return name
+
+
+def parse_object(buf, pos: int) -> Tuple[Any, int]:
+    """
+    Parse one PDF object at pos. Returns (value, position after it).
+    dict -> dict (Name keys), array -> list, name -> Name, string -> str,
+    "N G R" -> Ref, numbers -> int/float, true/false/null -> bool/None.
+
+    Iterative: containers are collected on an explicit stack, so one regex
+    match per token is the whole per-token cost.
+    """
+    stack: List[Tuple[bool, List[Any]]] = []  # (is_dict, items)
+    match = _TOKEN.match
+    while True:
+        m = match(buf, pos)
+        if m is None or m.lastgroup is None:
+            raise XrefError(f"Unexpected data at {pos}")
+        pos = m.end()
+        kind = m.lastgroup
+        if kind == "num":
+            text = m.group("num")
+            value = float(text) if b"." in text else int(text)
+        elif kind == "name":
+            value = _name(m.group("name"))
+        elif kind == "ref":
+            value = Ref(int(m.group(2)), int(m.group(3)))
+        elif kind == "dopen" or kind == "aopen":
+            stack.append((kind == "dopen", []))
+            continue
+        elif kind == "dclose" or kind == "aclose":
+            if not stack or stack[-1][0] != (kind == "dclose"):
+                raise XrefError(f"Unbalanced container at {pos}")
+            is_dict, items = stack.pop()
+            if is_dict:
+                if len(items) % 2:
+                    raise XrefError("Dictionary with an odd number of items")
+                value = dict(zip(items[0::2], items[1::2]))
+            else:
+                value = items
+        elif kind == "str":
+            value, pos = _parse_literal_string(buf, pos)
+        elif kind == "hex":
+            digits = _HEX_JUNK.sub(b"", m.group("hex")[1:-1])
+            if len(digits) % 2:
+                digits += b"0"
+            value = _decode_text(bytes.fromhex(digits.decode("ascii")))
+        else:
+            word = m.group("kw")
+            value = True if word == b"true" else False if word == b"false" else None
+
+        if not stack:
+            return value, pos
+        stack[-1][1].append(value)
+
+
+# --- Stream decoding --------------------------------------------------------------
+
+def _png_unpredict(data: bytes, columns: int) -> bytes:
+    """Undo PNG row predictors (/Predictor >= 10), as used by xref streams."""
+    row_len = columns + 1
+    out = bytearray()
+    prev = bytearray(columns)
+    for start in range(0, len(data) - columns, row_len):
+        filter_type = data[start]
+        row = bytearray(data[start + 1:start + row_len])
+        if filter_type == 1:
+            for i in range(1, columns):
+                row[i] = (row[i] + row[i - 1]) & 0xFF
+        elif filter_type == 2:
+            for i in range(columns):
+                row[i] = (row[i] + prev[i]) & 0xFF
+        elif filter_type == 3:
+            for i in range(columns):
+                left = row[i - 1] if i else 0
+                row[i] = (row[i] + ((left + prev[i]) >> 1)) & 0xFF
+        elif filter_type == 4:
+            for i in range(columns):
+                a = row[i - 1] if i else 0
+                b = prev[i]
+                c = prev[i - 1] if i else 0
+                p = a + b - c
+                pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+                pred = a if pa <= pb and pa <= pc else (b if pb <= pc else c)
+                row[i] = (row[i] + pred) & 0xFF
+        elif filter_type != 0:
+            raise XrefError(f"Unknown PNG predictor {filter_type}")
+        out += row
+        prev = row
+    return bytes(out)
+
+
+def _decode_stream(stream_dict: Dict[str, Any], data: bytes) -> bytes:
+    filters = stream_dict.get("/Filter")
+    params = stream_dict.get("/DecodeParms")
+    if isinstance(filters, list):
+        if len(filters) > 1:
+            raise XrefError("Chained stream filters are not supported")
+        filters = filters[0] if filters else None
+        params = params[0] if isinstance(params, list) and params else params
+    if filters is None:
+        return data
+    if filters not in ("/FlateDecode", "/Fl"):
+        raise XrefError(f"Unsupported stream filter {filters}")
+    try:
+        decoded = zlib.decompress(data)
+    except zlib.error:
+        # Tolerate trailing garbage after the deflate stream
+        decoded = zlib.decompressobj().decompress(data)
+    predictor = params.get("/Predictor", 1) if isinstance(params, dict) else 1
+    if predictor >= 10:
+        decoded = _png_unpredict(decoded, int(params.get("/Columns", 1)))
+    elif predictor != 1:
+        raise XrefError(f"Unsupported predictor {predictor}")
+    return decoded
+
+
+# --- Document ---------------------------------------------------------------------
+
+class RawPdf:
+    """
+    Minimal read-only PDF object store over a memory-mapped file, or over a
+    document already in memory (bytes, bytearray, mmap, BytesIO or an open
+    file; see pdflinkcheck.source).
+
+    Usage:
+        raw = RawPdf("manual.pdf")
+        catalog = raw.resolve(raw.trailer["/Root"])
+        raw.close()
+
+    allow_encrypted=True opens encrypted files anyway, for callers that only
+    look at the cross-reference data and unencrypted dictionaries.
+    """
+    def __init__(self, pdf_path, allow_encrypted: bool = False):
+        self.pdf_path = pdf_path
+        self._file = None
+        if is_path(pdf_path):
+            self._file = open(pdf_path, "rb")
+            try:
+                self.buf = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:  # empty file
+                self._file.close()
+                raise XrefError(f"Cannot map file: {e}") from e
+        else:
+            # Caller's buffer: used as is, and left open by close()
+            self.buf = read_buffer(pdf_path)
+            if not len(self.buf):
+                raise XrefError("Empty document")
+        self._offsets: Dict[int, int] = {}
+        self._compressed: Dict[int, Tuple[int, int]] = {}
+        self._objects: Dict[int, Any] = {}
+        self._object_streams: Dict[int, Tuple[bytes, List[int]]] = {}
+        self._pages: Optional[List[Tuple[Optional[int], Dict[str, Any]]]] = None
+        try:
+            self.trailer = self._read_xref()
+            if "/Encrypt" in self.trailer and not allow_encrypted:
+                raise XrefError("Encrypted document")
+            if "/Root" not in self.trailer:
+                raise XrefError("Trailer has no /Root")
+        except Exception:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        buf = getattr(self, "buf", None)
+        if buf is not None:
+            if self._file is not None:
+                buf.close()
+            self.buf = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    # --- xref ---
+
+    def _read_xref(self) -> Dict[str, Any]:
+        buf = self.buf
+        tail_start = max(0, len(buf) - STARTXREF_SEARCH_BYTES)
+        idx = buf.rfind(b"startxref", tail_start)
+        if idx < 0:
+            raise XrefError("startxref not found")
+        offset, _ = parse_object(buf, idx + len(b"startxref"))
+        if not isinstance(offset, int):
+            raise XrefError("Invalid startxref offset")
+
+        trailer: Optional[Dict[str, Any]] = None
+        visited = set()
+        pending = [offset]
+        while pending:
+            offset = pending.pop()
+            if offset in visited or not 0 <= offset < len(buf):
+                continue
+            visited.add(offset)
+            pos = _WS.match(buf, offset).end()
+            if buf[pos:pos + 4] == b"xref":
+                section = self._read_xref_table(pos + 4)
+                if "/Prev" in section:
+                    pending.append(section["/Prev"])
+                if "/XRefStm" in section:
+                    # Hybrid file: its xref stream takes precedence over /Prev (popped first)
+                    pending.append(section["/XRefStm"])
+            else:
+                section = self._read_xref_stream(pos)
+                if "/Prev" in section:
+                    pending.append(section["/Prev"])
+            if trailer is None:
+                trailer = section
+        if trailer is None:
+            raise XrefError("No cross-reference section")
+        return trailer
+
+    def _read_xref_table(self, pos: int) -> Dict[str, Any]:
+        buf = self.buf
+        while True:
+            pos = _WS.match(buf, pos).end()
+            if buf[pos:pos + 7] == b"trailer":
+                trailer, _ = parse_object(buf, pos + 7)
+                return trailer
+            start, pos = parse_object(buf, pos)
+            count, pos = parse_object(buf, pos)
+            if not isinstance(start, int) or not isinstance(count, int):
+                raise XrefError("Malformed xref subsection header")
+            pos = _WS.match(buf, pos).end()
+            block = bytes(buf[pos:pos + 20 * count])
+            if _XREF_BLOCK.fullmatch(block):
+                # Well-formed 20-byte entries, split in C. Sections are read newest
+                # first, so entries already known take precedence.
+                rows = {
+                    start + i: int(offset)
+                    for i, (offset, kind) in enumerate(_XREF_ROW.findall(block)) if kind == b"n"
+                }
+                if self._compressed:
+                    rows = {num: offset for num, offset in rows.items() if num not in self._compressed}
+                rows.update(self._offsets)
+                self._offsets = rows
+                pos += len(block)
+                continue
+            for num in range(start, start + count):
+                pos = _WS.match(buf, pos).end()
+                entry = bytes(buf[pos:pos + 18])
+                if len(entry) < 18:
+                    raise XrefError("Truncated xref table")
+                if entry[17:18] == b"n" and num not in self._offsets and num not in self._compressed:
+                    self._offsets[num] = int(entry[0:10])
+                pos += 18
+
+    def _read_stream_at(self, pos: int) -> Tuple[Dict[str, Any], bytes]:
+        buf = self.buf
+        m = _OBJ_HEADER.match(buf, pos)
+        if not m:
+            raise XrefError(f"No object header at {pos}")
+        stream_dict, pos = parse_object(buf, m.end())
+        pos = _WS.match(buf, pos).end()
+        if buf[pos:pos + 6] != b"stream":
+            raise XrefError("Expected stream")
+        pos += 6
+        if buf[pos:pos + 2] == b"\r\n":
+            pos += 2
+        elif buf[pos:pos + 1] in (b"\n", b"\r"):
+            pos += 1
+        length = stream_dict.get("/Length")
+        if isinstance(length, Ref):
+            try:
+                length = self.resolve(length)
+            except XrefError:
+                length = None
+        if not isinstance(length, int) or buf[pos + length:pos + length + 40].find(b"endstream") < 0:
+            end = buf.find(b"endstream", pos)
+            if end < 0:
+                raise XrefError("Unterminated stream")
+            length = end - pos
+        return stream_dict, bytes(buf[pos:pos + length])
+
+    def _read_xref_stream(self, pos: int) -> Dict[str, Any]:
+        stream_dict, data = self._read_stream_at(pos)
+        if stream_dict.get("/Type") != "/XRef":
+            raise XrefError("startxref does not point at an xref table or stream")
+        data = _decode_stream(stream_dict, data)
+        w1, w2, w3 = (int(w) for w in stream_dict["/W"])
+        index = stream_dict.get("/Index") or [0, stream_dict["/Size"]]
+        row_len = w1 + w2 + w3
+        row = 0
+        for i in range(0, len(index) - 1, 2):
+            start, count = index[i], index[i + 1]
+            for num in range(start, start + count):
+                base = row * row_len
+                row += 1
+                if base + row_len > len(data):
+                    raise XrefError("Truncated xref stream")
+                kind = int.from_bytes(data[base:base + w1], "big") if w1 else 1
+                field2 = int.from_bytes(data[base + w1:base + w1 + w2], "big")
+                field3 = int.from_bytes(data[base + w1 + w2:base + row_len], "big")
+                if num in self._offsets or num in self._compressed:
+                    continue
+                if kind == 1:
+                    self._offsets[num] = field2
+                elif kind == 2:
+                    self._compressed[num] = (field2, field3)
+        return stream_dict
+
+    @property
+    def encrypted(self) -> bool:
+        return "/Encrypt" in self.trailer
+
+    @property
+    def uses_object_streams(self) -> bool:
+        """True if any object is stored compressed in an object stream."""
+        return bool(self._compressed)
+
+    # --- objects ---
+
+    def get(self, num: int) -> Any:
+        """The object with number num (generation is not checked), parsed once and cached."""
+        if num in self._objects:
+            return self._objects[num]
+        if num in self._offsets:
+            m = _OBJ_HEADER.match(self.buf, self._offsets[num])
+            if not m or int(m.group(1)) != num:
+                raise XrefError(f"Object {num} is not at its xref offset")
+            value, _ = parse_object(self.buf, m.end())
+        elif num in self._compressed:
+            value = self._get_compressed(*self._compressed[num])
+        else:
+            value = None  # Missing objects are null, per the spec
+        self._objects[num] = value
+        timing.count("objects_resolved")
+        return value
+
+    def _get_compressed(self, stream_num: int, index: int) -> Any:
+        cached = self._object_streams.get(stream_num)
+        if cached is None:
+            if stream_num not in self._offsets:
+                raise XrefError(f"Object stream {stream_num} not found")
+            stream_dict, data = self._read_stream_at(self._offsets[stream_num])
+            data = _decode_stream(stream_dict, data)
+            first = int(stream_dict["/First"])
+            header = [int(t) for t in data[:first].split()]
+            offsets = [first + header[i] for i in range(1, len(header), 2)]
+            cached = self._object_streams[stream_num] = (data, offsets)
+        data, offsets = cached
+        value, _ = parse_object(data, offsets[index])
+        return value
+
+    def resolve(self, value: Any, depth: int = 0) -> Any:
+        while isinstance(value, Ref):
+            if depth > 32:
+                raise XrefError("Reference chain too deep")
+            value = self.get(value.num)
+            depth += 1
+        return value
+
+    # --- document structure ---
+
+    def pages(self) -> List[Tuple[Optional[int], Dict[str, Any]]]:
+        """Leaf page dictionaries in document order, as (object number, page dict)."""
+        if self._pages is None:
+            catalog = self.resolve(self.trailer["/Root"])
+            pages: List[Tuple[Optional[int], Dict[str, Any]]] = []
+            stack = [catalog.get("/Pages")]
+            seen = set()
+            while stack:
+                node_ref = stack.pop()
+                num = node_ref.num if isinstance(node_ref, Ref) else None
+                if num is not None:
+                    if num in seen:
+                        continue  # Malformed trees can loop
+                    seen.add(num)
+                node = self.resolve(node_ref)
+                if not isinstance(node, dict):
+                    continue
+                kids = self.resolve(node.get("/Kids"))
+                if isinstance(kids, list) and node.get("/Type") != "/Page":
+                    stack.extend(reversed(kids))
+                else:
+                    pages.append((num, node))
+            self._pages = pages
+        return self._pages
+
+    @property
+    def page_count(self) -> int:
+        return len(self.pages())
+
+    def named_destinations(self, obj_id_to_page: Dict[int, int]) -> Dict[str, int]:
+        """Flatten /Dests and the /Names -> /Dests name tree into {name: page index}."""
+        index: Dict[str, int] = {}
+        catalog = self.resolve(self.trailer["/Root"])
+
+        dests = self.resolve(catalog.get("/Dests"))
+        if isinstance(dests, dict):
+            for name, value in dests.items():
+                page = self._dest_to_page(value, obj_id_to_page)
+                if page is not None:
+                    index[str(name)] = page
+
+        names = self.resolve(catalog.get("/Names"))
+        tree = names.get("/Dests") if isinstance(names, dict) else None
+        stack = [tree] if tree is not None else []
+        seen = set()
+        while stack:
+            node_ref = stack.pop()
+            if isinstance(node_ref, Ref):
+                if node_ref.num in seen:
+                    continue
+                seen.add(node_ref.num)
+            node = self.resolve(node_ref)
+            if not isinstance(node, dict):
+                continue
+            pairs = self.resolve(node.get("/Names"))
+            if isinstance(pairs, list):
+                for i in range(0, len(pairs) - 1, 2):
+                    page = self._dest_to_page(pairs[i + 1], obj_id_to_page)
+                    if page is not None:
+                        index.setdefault(str(self.resolve(pairs[i])), page)
+            kids = self.resolve(node.get("/Kids"))
+            if isinstance(kids, list):
+                stack.extend(reversed(kids))
+        return index
+
+    def _dest_to_page(self, value: Any, obj_id_to_page: Dict[int, int]) -> Optional[int]:
+        """Page index of an explicit destination: [page_ref ...] or a dict holding one under /D."""
+        value = self.resolve(value)
+        if isinstance(value, dict):
+            value = self.resolve(value.get("/D"))
+        if isinstance(value, list) and value and isinstance(value[0], Ref):
+            return obj_id_to_page.get(value[0].num)
+        return None
+
+    def resolve_destination(self, dest: Any, obj_id_to_page: Dict[int, int], named_dests: Dict[str, int]) -> Optional[int]:
+        """Same rules as analysis_pypdf.resolve_pypdf_destination(), on raw objects."""
+        if isinstance(dest, Ref):
+            if dest.num in obj_id_to_page:
+                return obj_id_to_page[dest.num]
+            dest = self.resolve(dest)
+        if isinstance(dest, (list, dict)):
+            return self._dest_to_page(dest, obj_id_to_page)
+        if isinstance(dest, str):
+            page = named_dests.get(dest)
+            if page is None:
+                page = named_dests.get(dest[1:] if dest.startswith("/") else "/" + dest)
+            return page
+        return None
+
+
+def iter_links_from_raw(raw: RawPdf, page_range: Optional[range] = None) -> Iterator[Dict[str, Any]]:
+    """Yield link dicts page by page (pypdf engine schema, no anchor text)."""
+    pages = raw.pages()
+    obj_id_to_page = {num: i for i, (num, _) in enumerate(pages) if num is not None}
+    named_dests = None  # Built on the first named link
+
+    if page_range is None:
+        page_range = range(len(pages))
+
+    for i in page_range:
+        timing.count("pages_loaded")
+        annots = raw.resolve(pages[i][1].get("/Annots"))
+        if not isinstance(annots, list):
+            continue
+        timing.count("annotations_seen", len(annots))
+        page_source = PageRef.from_index(i)
+        for annot in annots:
+            obj = raw.resolve(annot)
+            if not isinstance(obj, dict) or obj.get("/Subtype") != "/Link":
+                continue
+
+            rect = raw.resolve(obj.get("/Rect"))
+            link_dict = {
+                'page': page_source.machine,
+                'rect': [raw.resolve(v) for v in rect] if rect else None,
+                'link_text': ANCHOR_TEXT_SKIPPED,
+                'type': 'Other Action',
+                'target': 'Unknown'
+            }
+            action = raw.resolve(obj.get("/A"))
+            if not isinstance(action, dict):
+                action = None
+
+            # Handle URI (External)
+            if action is not None and "/URI" in action:
+                uri = raw.resolve(action["/URI"])
+                link_dict.update({
+                    'type': 'External (URI)',
+                    'url': uri,
+                    'target': uri
+                })
+
+            # Handle GoTo (Internal)
+            elif "/Dest" in obj or (action is not None and "/D" in action):
+                # An empty or null /Dest falls back to the action's /D, when there is one
+                dest = obj.get("/Dest")
+                if not dest and action is not None:
+                    dest = action.get("/D")
+                if named_dests is None:
+                    named_dests = raw.named_destinations(obj_id_to_page)
+                target_page = raw.resolve_destination(dest, obj_id_to_page, named_dests)
+                if target_page is not None:
+                    dest_page = PageRef.from_index(target_page)
+                    link_dict.update({
+                        'type': 'Internal (GoTo/Dest)',
+                        'destination_page': dest_page.machine,
+                        'target': dest_page.machine
+                    })
+
+            # Handle Remote GoTo (GoToR)
+            elif action is not None and action.get("/S") == "/GoToR":
+                remote_file = raw.resolve(action.get("/F"))
+                link_dict.update({
+                    'type': 'Remote (GoToR)',
+                    'remote_file': str(remote_file),
+                    'target': f"File: {remote_file}"
+                })
+
+            yield link_dict
+
+
+# --- pypdf object-level fallback ------------------------------------------------
+
+class PypdfObjectScan:
+    """
+    Fallback for files RawPdf rejects (encryption, exotic filters, broken xref).
+    Walks the page tree through pypdf's object resolver, still without PageObject
+    wrappers or content streams.
+    """
+    def __init__(self, pdf_path):
+        from pdflinkcheck.analysis_pypdf import open_reader
+        self.pdf_path = pdf_path
+        self.reader = open_reader(pdf_path)
+        self._pages = None
+
+    def pages(self) -> List[Tuple[Optional[int], Any]]:
+        if self._pages is None:
+            from pypdf.generic import IndirectObject
+            root = self.reader.trailer["/Root"].get_object()
+            pages = []
+            stack = [root.get("/Pages")]
+            seen = set()
+            while stack:
+                node_ref = stack.pop()
+                if node_ref is None:
+                    continue
+                num = node_ref.idnum if isinstance(node_ref, IndirectObject) else None
+                if num is not None:
+                    if num in seen:
+                        continue
+                    seen.add(num)
+                node = node_ref.get_object()
+                kids = node.get("/Kids")
+                if kids is not None and node.get("/Type") != "/Page":
+                    stack.extend(reversed(kids.get_object()))
+                else:
+                    pages.append((num, node))
+            self._pages = pages
+        return self._pages
+
+    @property
+    def page_count(self) -> int:
+        return len(self.pages())
+
+    def close(self) -> None:
+        if self.reader is not None:
+            timing.count("objects_resolved", len(self.reader.resolved_objects))
+            release_buffers(self.reader)
+        self.reader = None
+
+
+def iter_links_from_pypdf_scan(scan: PypdfObjectScan, page_range: Optional[range] = None) -> Iterator[Dict[str, Any]]:
+    from pdflinkcheck.analysis_pypdf import build_named_dest_index, link_dict_from_annot
+    pages = scan.pages()
+    obj_id_to_page = {num: i for i, (num, _) in enumerate(pages) if num is not None}
+    named_dests = build_named_dest_index(scan.reader, obj_id_to_page)
+
+    if page_range is None:
+        page_range = range(len(pages))
+
+    for i in page_range:
+        timing.count("pages_loaded")
+        annots = pages[i][1].get("/Annots")
+        if annots is None:
+            continue
+        annots = annots.get_object()
+        timing.count("annotations_seen", len(annots))
+        page_source = PageRef.from_index(i)
+        for annot in annots:
+            obj = annot.get_object()
+            if obj.get("/Subtype") != "/Link":
+                continue
+            yield link_dict_from_annot(scan.reader, obj, page_source, link_text=ANCHOR_TEXT_SKIPPED, obj_id_to_page=obj_id_to_page, named_dests=named_dests)
+
+
+# --- Public entry points ----------------------------------------------------------
+
+def open_xref_document(pdf_path: str):
+    """RawPdf for pdf_path, or the slower PypdfObjectScan if the raw scanner cannot read it."""
+    try:
+        return RawPdf(pdf_path)
+    except RAW_SCAN_ERRORS:
+        return PypdfObjectScan(pdf_path)
+
+
+def iter_links_from_document(doc, page_range: Optional[range] = None) -> Iterator[Dict[str, Any]]:
+    if isinstance(doc, RawPdf):
+        return iter_links_from_raw(doc, page_range)
+    return iter_links_from_pypdf_scan(doc, page_range)
+
+
+def extract_links_xref(pdf_path: str) -> List[Dict[str, Any]]:
+    """
+    Triage link extraction: the same records as extract_links_pypdf(), minus anchor text.
+    Falls back to the pypdf object walk if the raw scan hits something it cannot parse.
+    """
+    doc = open_xref_document(pdf_path)
+    try:
+        return list(iter_links_from_document(doc))
+    except RAW_SCAN_ERRORS:
+        if not isinstance(doc, RawPdf):
+            raise
+        doc.close()
+        doc = PypdfObjectScan(pdf_path)
+        return list(iter_links_from_document(doc))
+    finally:
+        doc.close()
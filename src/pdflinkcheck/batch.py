@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# src/pdflinkcheck/batch.py
+from __future__ import annotations
+import glob
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pdflinkcheck.io import PDFLINKCHECK_HOME
+
+"""
+Batch analysis of many PDFs.
+
+`pdflinkcheck analyze` accepts files, directories and glob patterns. Each
+document is analyzed by run_report_and_call_exports() in a worker process;
+only a small per-file summary travels back to the parent, and results are
+yielded in completion order so the caller can stream them.
+
+Reports go to BATCH_REPORTS_DIR, in a directory that mirrors the PDF's own
+(see batch_output_dir()): a/manual.pdf and b/manual.pdf get separate reports,
+and workers never write the same file. Rescans overwrite a file's previous
+reports.
+
+In-flight work is bounded (MAX_IN_FLIGHT_PER_JOB x jobs), so a 40,000 file
+tree does not queue 40,000 futures up front.
+
+With a ScanManifest (`--incremental`), files whose stat and content are
+unchanged since the last scan are not dispatched at all; their previous
+summary is reused (see pdflinkcheck.manifest).
+"""
+
+# Futures kept queued per worker process. Enough to hide scheduling gaps,
+# small enough to keep memory flat for very large corpora.
+MAX_IN_FLIGHT_PER_JOB = 2
+
+GLOB_CHARS = ("*", "?", "[")
+
+BATCH_REPORTS_DIR = PDFLINKCHECK_HOME / "batch"
+
+
+def batch_output_dir(pdf_path: str | Path) -> Path:
+    """
+    Report directory for one PDF in batch mode: its absolute parent directory
+    mirrored under BATCH_REPORTS_DIR, e.g. /srv/docs/a/manual.pdf ->
+    BATCH_REPORTS_DIR/srv/docs/a (the drive letter becomes a directory on Windows).
+    """
+    parent = Path(pdf_path).resolve().parent
+    parts = [part.replace(":", "").strip("\\/") for part in parent.parts]
+    return BATCH_REPORTS_DIR.joinpath(*[part for part in parts if part])
+
+
+def expand_pdf_paths(inputs: Iterable[str | Path]) -> List[Path]:
+    """
+    Resolve files, directories (searched recursively) and glob patterns into
+    a sorted, de-duplicated list of PDF paths.
+
+    Raises:
+        FileNotFoundError: If an input is neither an existing path nor a glob
+                           pattern matching at least one PDF.
+    """
+    found: Dict[Path, None] = {}
+    for raw in inputs:
+        item = str(raw)
+        p = Path(item).expanduser()
+        if p.is_dir():
+            matches = [c for c in p.rglob("*") if c.is_file() and c.suffix.lower() == ".pdf"]
+        elif p.is_file():
+            matches = [p]
+        elif any(ch in item for ch in GLOB_CHARS):
+            matches = [
+                Path(m) for m in glob.glob(os.path.expanduser(item), recursive=True)
+                if Path(m).is_file() and Path(m).suffix.lower() == ".pdf"
+            ]
+            if not matches:
+                raise FileNotFoundError(f"No PDF files match pattern: {item}")
+        else:
+            raise FileNotFoundError(f"Path does not exist: {item}")
+
+        for m in sorted(matches):
+            found.setdefault(m.resolve(), None)
+    return list(found)
+
+
+def summarize_report(pdf_path: str, report_results: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a full report to the picklable per-file summary used in batch mode."""
+    stats = report_results.get("data", {}).get("validation", {}).get("summary-stats", {})
+    link_counts = report_results.get("metadata", {}).get("link_counts", {})
+    files = report_results.get("files", {})
+    return {
+        "pdf_path": pdf_path,
+        "error": None,
+        "total_links_count": link_counts.get("total_links_count", 0),
+        "toc_entry_count": link_counts.get("toc_entry_count", 0),
+        "broken-page": stats.get("broken-page", 0),
+        "broken-file": stats.get("broken-file", 0),
+        "export_path_json": str(files["export_path_json"]) if files.get("export_path_json") else None,
+        "export_path_txt": str(files["export_path_txt"]) if files.get("export_path_txt") else None,
+    }
+
+
+def analyze_one(pdf_path: str, pdf_library: str = "pypdf", export_format: str = "JSON", use_cache: bool = False, anchor_text: str = "accurate", content_hash: Optional[str] = None, web_links: bool = True, low_memory: bool = False) -> Dict[str, Any]:
+    """
+    Worker entry point: analyze one PDF and return its summary.
+    Top-level so ProcessPoolExecutor can pickle it. Never raises.
+    content_hash, if the caller already hashed the file, spares the cache a second read.
+    """
+    from pdflinkcheck.report import run_report_and_call_exports
+    try:
+        report_results = run_report_and_call_exports(
+            pdf_path=pdf_path,
+            export_format=export_format,
+            pdf_library=pdf_library,
+            print_bool=False,
+            use_cache=use_cache,
+            anchor_text=anchor_text,
+            content_hash=content_hash,
+            web_links=web_links,
+            low_memory=low_memory,
+            output_dir=batch_output_dir(pdf_path),
+            announce_exports=False,
+        )
+        return summarize_report(pdf_path, report_results)
+    except Exception as e:
+        return {"pdf_path": pdf_path, "error": f"{type(e).__name__}: {e}"}
+
+
+def rescan_one(
+    pdf_path: str,
+    pdf_library: str = "pypdf",
+    export_format: str = "JSON",
+    use_cache: bool = False,
+    known_hash: Optional[str] = None,
+    anchor_text: str = "accurate",
+    web_links: bool = True,
+    low_memory: bool = False,
+) -> Dict[str, Any]:
+    """
+    Worker entry point for incremental scans: hash the file and analyze it only
+    if the hash differs from known_hash. The summary carries "sha256"; an
+    unchanged file returns {"pdf_path", "error": None, "sha256", "unchanged": True}.
+    Never raises.
+    """
+    from pdflinkcheck.cache import hash_file
+    try:
+        content_hash = hash_file(pdf_path)
+    except OSError as e:
+        return {"pdf_path": pdf_path, "error": f"{type(e).__name__}: {e}"}
+    if known_hash is not None and content_hash == known_hash:
+        return {"pdf_path": pdf_path, "error": None, "sha256": content_hash, "unchanged": True}
+    result = analyze_one(pdf_path, pdf_library, export_format, use_cache, anchor_text, content_hash, web_links, low_memory)
+    result["sha256"] = content_hash
+    return result
+
+
+def _plan_tasks(
+    paths: Iterable[str],
+    pdf_library: str,
+    export_format: str,
+    use_cache: bool,
+    manifest,
+    pending: Dict[str, Tuple[os.stat_result, Any]],
+    version: str,
+    anchor_text: str = "accurate",
+    mode: str = "",
+    web_links: bool = True,
+    low_memory: bool = False,
+) -> Iterator[Tuple[Optional[Dict[str, Any]], Optional[Callable[..., Dict[str, Any]]], tuple]]:
+    """
+    Yield (ready_result, None, ()) for files answered from the manifest, or
+    (None, fn, args) for work to run in a worker.
+    """
+    for path in paths:
+        if manifest is None:
+            yield None, analyze_one, (path, pdf_library, export_format, use_cache, anchor_text, None, web_links, low_memory)
+            continue
+        try:
+            st = os.stat(path)
+        except OSError as e:
+            yield {"pdf_path": path, "error": f"{type(e).__name__}: {e}"}, None, ()
+            continue
+        entry = manifest.lookup(path, pdf_library, mode)
+        if entry is not None and entry.stat_matches(st, version):
+            yield dict(entry.summary, pdf_path=path, unchanged=True), None, ()
+            continue
+        pending[path] = (st, entry)
+        known_hash = entry.sha256 if entry is not None and entry.version == version else None
+        yield None, rescan_one, (path, pdf_library, export_format, use_cache, known_hash, anchor_text, web_links, low_memory)
+
+
+def iter_batch_results(
+    pdf_paths: Iterable[str | Path],
+    pdf_library: str = "pypdf",
+    export_format: str = "JSON",
+    jobs: int = 1,
+    use_cache: bool = False,
+    manifest=None,
+    anchor_text: str = "accurate",
+    web_links: bool = True,
+    low_memory: bool = False,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield one summary per PDF, in completion order.
+
+    Args:
+        pdf_paths: PDF files to analyze (see expand_pdf_paths()).
+        pdf_library: Engine passed to run_report().
+        export_format: Passed to run_report_and_call_exports(); "" for no export files.
+        jobs: Worker processes. 1 runs in this process; 0 or less uses os.cpu_count().
+        use_cache: Passed to run_report() (see pdflinkcheck.cache).
+        manifest: Optional pdflinkcheck.manifest.ScanManifest. Unchanged files
+                  are answered from it (summary has "unchanged": True) and
+                  every successful result is recorded back into it.
+        anchor_text: Passed to run_report(); "none" skips text extraction.
+        web_links: Passed to run_report() (pdfium URL detection).
+        low_memory: Passed to run_report() (flat memory on very long documents).
+    """
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+    pending: Dict[str, Tuple[os.stat_result, Any]] = {}
+    version = mode = ""
+    if manifest is not None:
+        from pdflinkcheck.manifest import scan_mode
+        from pdflinkcheck.version_info import get_version_from_pyproject
+        version = get_version_from_pyproject()
+        mode = scan_mode(anchor_text, export_format, web_links)
+    tasks = _plan_tasks(
+        (str(p) for p in pdf_paths), pdf_library, export_format, use_cache, manifest, pending, version, anchor_text, mode, web_links, low_memory
+    )
+
+    def finish(result: Dict[str, Any]) -> Dict[str, Any]:
+        path = result["pdf_path"]
+        if path not in pending:
+            return result
+        st, entry = pending.pop(path)
+        if result.get("error"):
+            # Not recorded, so a failing file is retried on the next scan
+            return result
+        if result.get("unchanged"):
+            # Touched but byte-identical: keep the old summary, refresh the stat
+            sha256, summary = entry.sha256, entry.summary
+            result = dict(summary, pdf_path=path, unchanged=True)
+        else:
+            sha256 = result.pop("sha256")
+            summary = dict(result)
+        manifest.record(path, pdf_library, mode, version, st, sha256, summary)
+        return result
+
+    if jobs == 1:
+        for ready, fn, args in tasks:
+            yield ready if ready is not None else finish(fn(*args))
+        return
+
+    max_in_flight = jobs * MAX_IN_FLIGHT_PER_JOB
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        in_flight = set()
+        ready_results: deque = deque()
+
+        def submit_next() -> bool:
+            for ready, fn, args in tasks:
+                if ready is not None:
+                    ready_results.append(ready)
+                    continue
+                in_flight.add(pool.submit(fn, *args))
+                return True
+            return False
+
+        while len(in_flight) < max_in_flight and submit_next():
+            pass
+
+        while in_flight or ready_results:
+            while ready_results:
+                yield ready_results.popleft()
+            if not in_flight:
+                break
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                in_flight.discard(future)
+                yield finish(future.result())
+                submit_next()
+
+
+def run_batch(
+    pdf_paths: Iterable[str | Path],
+    pdf_library: str = "pypdf",
+    export_format: str = "JSON",
+    jobs: int = 1,
+    use_cache: bool = False,
+    on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+    manifest=None,
+    anchor_text: str = "accurate",
+    web_links: bool = True,
+    low_memory: bool = False,
+) -> Dict[str, Any]:
+    """
+    Analyze many PDFs and aggregate their summaries.
+
+    on_result, if given, is called with each per-file summary as soon as it
+    completes (completion order), e.g. to print progress. manifest enables
+    incremental rescans (see iter_batch_results()).
+
+    Returns:
+        Aggregate dict with file counts, link totals, broken counts and the
+        list of failed files.
+    """
+    aggregate: Dict[str, Any] = {
+        "files_total": 0,
+        "files_ok": 0,
+        "files_failed": 0,
+        "files_unchanged": 0,
+        "files_with_broken_links": 0,
+        "total_links_count": 0,
+        "toc_entry_count": 0,
+        "broken-page": 0,
+        "broken-file": 0,
+        "failures": [],
+    }
+    for result in iter_batch_results(pdf_paths, pdf_library, export_format, jobs, use_cache, manifest, anchor_text, web_links, low_memory):
+        aggregate["files_total"] += 1
+        if result.get("error"):
+            aggregate["files_failed"] += 1
+            aggregate["failures"].append({"pdf_path": result["pdf_path"], "error": result["error"]})
+        else:
+            aggregate["files_ok"] += 1
+            if result.get("unchanged"):
+                aggregate["files_unchanged"] += 1
+            for key in ("total_links_count", "toc_entry_count", "broken-page", "broken-file"):
+                aggregate[key] += result.get(key, 0)
+            if result.get("broken-page", 0) + result.get("broken-file", 0) > 0:
+                aggregate["files_with_broken_links"] += 1
+        if on_result is not None:
+            try:
+                on_result(result)
+            except Exception as e:
+                print(f"Batch progress callback failed: {e}", file=sys.stderr)
+    return aggregate
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# src/pdflinkcheck/bench.py
+from __future__ import annotations
+import contextlib
+import io
+import multiprocessing
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from pdflinkcheck.environment import pymupdf_is_available, pdfium_is_available
+
+"""
+Compare the engines on your own PDFs (`pdflinkcheck bench`).
+
+Every (file, engine) pair runs in a freshly spawned interpreter, so peak RSS
+belongs to that engine alone and no import, page or cache state leaks from
+one engine into the next. The worker calls run_report(use_cache=False,
+print_bool=False) once cold (engine import and first parse included, what a
+one-shot CLI call pays) and then `repeat` more times warm:
+
+    results = run_bench(["manual.pdf", "scan.pdf"], repeat=5)
+    for row in results:
+        print(row["pdf_path"], row["engine"], row["median_s"], row["peak_rss_mb"])
+
+Peak RSS is the worker's high-water mark, interpreter included. It is
+reported on Linux and macOS only (resource module); None elsewhere.
+
+Pairs run one after another, never in parallel: concurrent workers would
+compete for cores and memory bandwidth and skew each other's latency.
+"""
+
+ENGINES = ("pypdf", "pymupdf", "pdfium", "xref")
+
+# Percentile reported next to the median
+TAIL_PERCENTILE = 95
+
+
+def available_engines() -> List[str]:
+    """ENGINES whose library is installed, in ENGINES order."""
+    return [
+        engine for engine in ENGINES
+        if (engine != "pymupdf" or pymupdf_is_available()) and (engine != "pdfium" or pdfium_is_available())
+    ]
+
+
+def peak_rss_mb() -> Optional[float]:
+    """High-water resident set size of this process in MB, or None where unsupported."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def percentile(values: List[float], q: float) -> float:
+    """q-th percentile of values with linear interpolation between closest ranks."""
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * q / 100
+    lower = int(k)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (k - lower)
+
+
+def measure(pdf_path: str, engine: str, repeat: int = 5, anchor_text: str = "accurate") -> Dict[str, Any]:
+    """
+    Worker entry point: one cold and `repeat` warm run_report() calls on one file.
+    Top-level so ProcessPoolExecutor can pickle it. Never raises.
+    """
+    from pdflinkcheck.report import run_report
+    result: Dict[str, Any] = {"pdf_path": pdf_path, "engine": engine, "error": None}
+    walls = []
+    report: Dict[str, Any] = {}
+    try:
+        # Engines and run_report print progress; the bench table is the only output
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(repeat + 1):
+                start = time.perf_counter()
+                report = run_report(pdf_path, engine, print_bool=False, use_cache=False, anchor_text=anchor_text)
+                walls.append(time.perf_counter() - start)
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+        return result
+    if not report:
+        result["error"] = "run_report() returned no report"
+        return result
+
+    metadata = report.get("metadata", {})
+    warm = walls[1:]
+    result.update({
+        "cold_s": round(walls[0], 6),
+        "walls_s": [round(w, 6) for w in warm],
+        "median_s": round(statistics.median(warm), 6),
+        "p95_s": round(percentile(warm, TAIL_PERCENTILE), 6),
+        "links": metadata.get("link_counts", {}).get("total_links_count", 0),
+        "toc_entries": metadata.get("link_counts", {}).get("toc_entry_count", 0),
+        "pages": report.get("data", {}).get("validation", {}).get("total_pages"),
+        "peak_rss_mb": peak_rss_mb(),
+    })
+    return result
+
+
+def run_bench(
+    pdf_paths: Iterable[str | Path],
+    engines: Optional[List[str]] = None,
+    repeat: int = 5,
+    anchor_text: str = "accurate",
+    on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Benchmark each engine on each PDF and return one result dict per pair,
+    file-major in the given order.
+
+    engines defaults to available_engines(). on_result is called with each
+    result as soon as it is measured, for progress output.
+
+    Raises:
+        ValueError: If repeat < 1 or an engine is unknown or not installed.
+    """
+    if repeat < 1:
+        raise ValueError("repeat must be at least 1.")
+    available = available_engines()
+    engines = list(engines) if engines else available
+    for engine in engines:
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown PDF engine: {engine!r}. Expected one of {ENGINES}.")
+        if engine not in available:
+            raise ValueError(f"PDF engine {engine!r} is not installed.")
+
+    spawn = multiprocessing.get_context("spawn")
+    results = []
+    for pdf_path in pdf_paths:
+        for engine in engines:
+            # A new spawned worker per pair: a forked child would inherit
+            # whatever engines and memory the parent (or the previous pair)
+            # had already loaded
+            with ProcessPoolExecutor(max_workers=1, mp_context=spawn) as pool:
+                result = pool.submit(measure, str(pdf_path), engine, repeat, anchor_text).result()
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+    return results
+
+
+def summarize_by_engine(results: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Per-engine totals over all files: summed cold and median latency, summed
+    links, highest peak RSS and the number of files that failed.
+    """
+    summary: Dict[str, Dict[str, Any]] = {}
+    for result in results:
+        entry = summary.setdefault(result["engine"], {
+            "files_ok": 0, "files_failed": 0, "cold_s": 0.0, "median_s": 0.0, "links": 0, "peak_rss_mb": None,
+        })
+        if result["error"]:
+            entry["files_failed"] += 1
+            continue
+        entry["files_ok"] += 1
+        entry["cold_s"] = round(entry["cold_s"] + result["cold_s"], 6)
+        entry["median_s"] = round(entry["median_s"] + result["median_s"], 6)
+        entry["links"] += result["links"]
+        if result["peak_rss_mb"] is not None:
+            entry["peak_rss_mb"] = max(entry["peak_rss_mb"] or 0.0, result["peak_rss_mb"])
+    return summary
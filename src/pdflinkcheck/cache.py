@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# src/pdflinkcheck/cache.py
+from __future__ import annotations
+import hashlib
+import importlib.metadata
+import io
+import json
+import mmap
+import os
+import tempfile
+from functools import cache
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from pdflinkcheck.io import PDFLINKCHECK_HOME, error_logger
+
+"""
+Persistent on-disk cache of engine extraction results.
+
+Entries are keyed by the SHA-256 of the PDF bytes, the engine name, the
+pdflinkcheck version and the installed version of the engine's library
+(an engine upgrade can change what is extracted), and hold what is expensive to recompute: the extracted
+links, the structural TOC and the page count. Validation, risk scoring and
+the text report are rebuilt on every run, because they depend on the PDF's
+location (relative GoToR targets, paths in the report) rather than only on
+its bytes.
+
+Entries live in PDFLINKCHECK_HOME/cache as JSON files. Reads refresh the
+file's mtime; when the directory grows past the size cap, the least recently
+used entries are evicted first.
+
+Environment:
+    PDFLINKCHECK_CACHE_MAX_MB: size cap in megabytes (default 256).
+"""
+
+CACHE_DIR = PDFLINKCHECK_HOME / "cache"
+CACHE_SUFFIX = ".json"
+DEFAULT_MAX_MB = 256
+HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def get_max_bytes() -> int:
+    try:
+        return int(float(os.environ.get("PDFLINKCHECK_CACHE_MAX_MB", DEFAULT_MAX_MB)) * 1024 * 1024)
+    except ValueError:
+        return DEFAULT_MAX_MB * 1024 * 1024
+
+
+def hash_file(pdf_path: str | Path) -> str:
+    """SHA-256 hex digest of the file contents, read in chunks."""
+    digest = hashlib.sha256()
+    with open(pdf_path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_source(pdf_source) -> str:
+    """
+    SHA-256 hex digest of a path (see hash_file()) or of an in-memory source
+    (see pdflinkcheck.source). Buffers are hashed in place; file objects are
+    read in chunks from offset 0.
+    """
+    from pdflinkcheck.source import is_path
+    if is_path(pdf_source):
+        return hash_file(pdf_source)
+    if isinstance(pdf_source, (bytes, bytearray, memoryview, mmap.mmap)):
+        return hashlib.sha256(pdf_source).hexdigest()
+    if isinstance(pdf_source, io.BytesIO):
+        return hashlib.sha256(pdf_source.getbuffer()).hexdigest()
+    digest = hashlib.sha256()
+    pdf_source.seek(0)
+    for chunk in iter(lambda: pdf_source.read(HASH_CHUNK_BYTES), b""):
+        digest.update(chunk)
+    pdf_source.seek(0)
+    return digest.hexdigest()
+
+
+# Distribution behind each engine. xref reads the file itself but falls back
+# to pypdf on files its scanner rejects.
+ENGINE_DISTRIBUTIONS = {
+    "pypdf": "pypdf",
+    "pymupdf": "PyMuPDF",
+    "pdfium": "pypdfium2",
+    "xref": "pypdf",
+}
+
+
+@cache
+def engine_version(pdf_library: str) -> str:
+    """Installed version of pdf_library's distribution, or "" if unknown or not installed."""
+    distribution = ENGINE_DISTRIBUTIONS.get(pdf_library.lower())
+    if distribution is None:
+        return ""
+    try:
+        return importlib.metadata.version(distribution)
+    except importlib.metadata.PackageNotFoundError:
+        return ""
+
+
+def make_key(content_hash: str, pdf_library: str, version: str, variant: str = "", library_version: str = "") -> str:
+    """
+    Cache key for one document/engine/version. library_version is the engine
+    library's version (see engine_version()); variant distinguishes extraction
+    options that change the output (empty for the defaults).
+    """
+    parts = [content_hash, pdf_library.lower(), version]
+    if library_version:
+        parts.append(f"{pdf_library.lower()}-{library_version}")
+    if variant:
+        parts.append(variant)
+    # Keep the key filesystem-safe
+    return "_".join(p.replace("/", "-").replace("\\", "-").replace(" ", "") for p in parts)
+
+
+def key_for_file(pdf_path, pdf_library: str, variant: str = "", content_hash: Optional[str] = None) -> Optional[str]:
+    """
+    Hash pdf_path (a path or an in-memory source) and build its cache key for
+    the current pdflinkcheck and engine library versions. None if unreadable. Pass content_hash
+    when the caller already has the SHA-256 (incremental rescans) to skip
+    reading the file again.
+    """
+    from pdflinkcheck.version_info import get_version_from_pyproject
+    if content_hash is None:
+        try:
+            content_hash = hash_source(pdf_path)
+        except OSError:
+            return None
+    return make_key(content_hash, pdf_library, get_version_from_pyproject(), variant, engine_version(pdf_library))
+
+
+def _entry_path(key: str) -> Path:
+    return CACHE_DIR / f"{key}{CACHE_SUFFIX}"
+
+
+def get(key: str) -> Optional[Dict[str, Any]]:
+    """Return the cached payload for key, or None. A hit marks the entry as recently used."""
+    path = _entry_path(key)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            payload = json.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        # Corrupt or partially written entry: drop it and treat as a miss
+        error_logger.warning(f"Discarding unreadable cache entry {path.name}: {e}")
+        _remove(path)
+        return None
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return payload
+
+
+def put(key: str, payload: Dict[str, Any]) -> Optional[Path]:
+    """
+    Store payload under key (atomic replace), then enforce the size cap.
+    Cache failures are logged and never raised; the analysis result stands on its own.
+    """
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=CACHE_DIR, prefix=".tmp_", suffix=CACHE_SUFFIX)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, separators=(",", ":"), default=str)
+            path = _entry_path(key)
+            os.replace(tmp_name, path)
+        except Exception:
+            _remove(Path(tmp_name))
+            raise
+        evict(get_max_bytes())
+        return path
+    except Exception as e:
+        error_logger.warning(f"Could not write cache entry {key}: {e}")
+        return None
+
+
+def evict(max_bytes: int) -> int:
+    """Delete least recently used entries until the cache fits max_bytes. Returns entries removed."""
+    try:
+        entries = []
+        total = 0
+        with os.scandir(CACHE_DIR) as it:
+            for entry in it:
+                if not entry.name.endswith(CACHE_SUFFIX) or entry.name.startswith(".tmp_"):
+                    continue
+                st = entry.stat()
+                entries.append((st.st_mtime, st.st_size, Path(entry.path)))
+                total += st.st_size
+    except FileNotFoundError:
+        return 0
+
+    removed = 0
+    if total <= max_bytes:
+        return removed
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        if _remove(path):
+            total -= size
+            removed += 1
+    return removed
+
+
+def clear() -> int:
+    """Remove every cache entry (and stray temp files). Returns the number of files removed."""
+    removed = 0
+    if not CACHE_DIR.exists():
+        return removed
+    for path in CACHE_DIR.iterdir():
+        if path.is_file() and path.name.endswith(CACHE_SUFFIX):
+            removed += int(_remove(path))
+    return removed
+
+
+def stats() -> Dict[str, Any]:
+    """Entry count and total size of the cache directory."""
+    count = 0
+    total = 0
+    if CACHE_DIR.exists():
+        for path in CACHE_DIR.glob(f"*{CACHE_SUFFIX}"):
+            if path.name.startswith(".tmp_"):
+                continue
+            count += 1
+            total += path.stat().st_size
+    return {"cache_dir": str(CACHE_DIR), "entries": count, "total_bytes": total, "max_bytes": get_max_bytes()}
+
+
+def _remove(path: Path) -> bool:
+    try:
+        path.unlink()
+        return True
+    except FileNotFoundError:
+        return False
+    except OSError as e:
+        error_logger.warning(f"Could not remove cache entry {path.name}: {e}")
+        return False
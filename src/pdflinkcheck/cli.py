@@ -5,21 +5,30 @@ from __future__ import annotations
 import typer
 from typing import Literal
 from typer.models import OptionInfo
-from rich.console import Console
 from pathlib import Path
-from pdflinkcheck.report import run_report_and_call_exports # Assuming core logic moves here
 from typing import Dict, Optional, Union, List
-import pyhabitat
 import sys
 import os
-from importlib.resources import files
 
 from pdflinkcheck.version_info import get_version_from_pyproject
-from pdflinkcheck.validate import run_validation 
 from pdflinkcheck.environment import is_in_git_repo, assess_default_pdf_library
-from pdflinkcheck.io import get_first_pdf_in_cwd
 
-console = Console() # to be above the tkinter check, in case of console.print
+# Startup budget: the CLI runs thousands of times per CI job. Anything heavy
+# (report and the engines, rich.console, logging via pdflinkcheck.io,
+# pyhabitat) is imported inside the command that needs it.
+# Check with: python benchmarks/startup.py
+
+class _LazyConsole:
+    """rich Console created on first use; importing rich.console is a third of `--version`."""
+    _console = None
+
+    def __getattr__(self, name):
+        if _LazyConsole._console is None:
+            from rich.console import Console
+            _LazyConsole._console = Console()
+        return getattr(_LazyConsole._console, name)
+
+console = _LazyConsole() # to be above the tkinter check, in case of console.print
 
 app = typer.Typer(
     name="pdflinkcheck",
@@ -98,6 +107,7 @@ def docs_command(
         console.print("[yellow]Please use either the --license or --readme flag.[/yellow]")
         return # Typer will automatically show the help message.
 
+    from importlib.resources import files
     if is_in_git_repo():
         """This is too aggressive. But we don't expect it often. Probably worth it."""
         from pdflinkcheck.datacopy import ensure_data_files_for_build
@@ -138,23 +148,32 @@ def tools_command(
         False,
         "--clear-cache",
         is_flag=True,
-        help="Clear the environment caches. \n - pymupdf_is_available() \n - is_in_git_repo() \nMain purpose: Run after adding PyMuPDF to an existing installation where it was previously missing, because pymupdf_is_available() would have been cached as False."
-    )
+        help="Clear the environment caches and the on-disk analysis result cache. \n - pymupdf_is_available() \n - is_in_git_repo() \n - PDFLINKCHECK_HOME/cache \nMain purpose: Run after adding PyMuPDF to an existing installation where it was previously missing, because pymupdf_is_available() would have been cached as False."
+    ),
+    reset_engine_profile: bool = typer.Option(
+        False,
+        "--reset-engine-profile",
+        is_flag=True,
+        help="Delete the engine profile recorded by `bench` and by `--engine auto` runs, so auto goes back to preferring pdfium > pymupdf > pypdf."
+    ),
     ):
     from pdflinkcheck.environment import clear_all_caches
     if clear_cache:
         clear_all_caches()
+        console.print("[green]Caches cleared.[/green]")
+    if reset_engine_profile:
+        from pdflinkcheck.engine_profile import reset
+        if reset():
+            console.print("[green]Engine profile deleted.[/green]")
+        else:
+            console.print("No engine profile to delete.")
 
 @app.command(name="analyze") # Added a command name 'analyze' for clarity
 def analyze_pdf( # Renamed function for clarity
-    pdf_path: Optional[Path] = typer.Argument(
+    pdf_paths: Optional[List[str]] = typer.Argument(
         None, 
-        exists=True, 
-        file_okay=True, 
-        dir_okay=False, 
-        readable=True,
-        resolve_path=True,
-        help="Path to the PDF file to analyze. If omitted, searches current directory."
+        metavar="[PDF_PATHS]...",
+        help="PDF file(s), directories (searched recursively) or glob patterns to analyze. If omitted, searches current directory."
     ), 
     export_format: Optional[Literal["JSON", "TXT", "JSON,TXT", "NONE"]] = typer.Option(
         "JSON,TXT", 
@@ -163,17 +182,65 @@ def analyze_pdf( # Renamed function for clarity
         help="Export format. Use 'None' to suppress file export.",
     ),
 
-    pdf_library: Literal["auto","pdfium","pypdf", "pymupdf"] = typer.Option(
+    pdf_library: Literal["auto","pdfium","pypdf", "pymupdf", "xref"] = typer.Option(
         assess_default_pdf_library(),
         "--engine","-e",
         envvar="PDF_ENGINE",
-        help="PDF parsing library. pypdf (pure Python), pymupdf (fast, AGPL3+ licensed), pdfium (fast, BSD-3 licensed).",
+        help="PDF parsing library. auto (the engine that was fastest on similar documents in `pdflinkcheck bench`, else pdfium > pymupdf > pypdf), pypdf (pure Python), pymupdf (fast, AGPL3+ licensed), pdfium (fast, BSD-3 licensed), xref (triage: counts and classifies links without anchor text). Compare them on your own files with `pdflinkcheck bench`.",
     ),
     print_bool: bool = typer.Option(
         True,
         "--print/--quiet",
         help="Print or do not print the analysis and validation report to console."
-    )
+    ),
+    use_cache: bool = typer.Option(
+        True,
+        "--cache/--no-cache",
+        help="Reuse cached extraction results for unchanged files (keyed by content hash, engine and version)."
+    ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs", "-j",
+        min=0,
+        help="Worker processes. Several PDFs (multiple paths, a directory or a glob) are analyzed in parallel; a single very large PDF is split into page shards (pymupdf, pdfium). 0 uses all CPU cores."
+    ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        help="Batch rescan: skip files whose size, mtime or content hash are unchanged since the last scan (manifest in PDFLINKCHECK_HOME)."
+    ),
+    anchor_text: Literal["none", "fast", "accurate"] = typer.Option(
+        "accurate",
+        "--anchor-text",
+        case_sensitive=False,
+        help="Anchor text extraction: accurate (full text pass), fast (PyMuPDF: only the text around the links; other engines run accurate), none (skip it; validation does not need it)."
+    ),
+    web_links: bool = typer.Option(
+        True,
+        "--web-links/--no-web-links",
+        help="pdfium: detect URLs in the page text (default). --no-web-links reports URI link annotations instead, as the other engines do, and skips the text pass on pages without links."
+    ),
+    low_memory: bool = typer.Option(
+        False,
+        "--low-memory",
+        help="Keep memory flat on documents with thousands of pages: pypdf drops each page's parsed objects after use, pymupdf reopens the document every 500 pages. Same results, somewhat slower."
+    ),
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="Run under cProfile and write a .pstats file next to the JSON/TXT exports in PDFLINKCHECK_HOME. Single-file runs only."
+    ),
+    profile_memory: bool = typer.Option(
+        False,
+        "--profile-memory",
+        help="Also trace allocations (tracemalloc) and write the top allocating lines per stage. Implies --profile; slows the run down."
+    ),
+    via_daemon: Optional[bool] = typer.Option(
+        None,
+        "--via-daemon/--no-daemon",
+        envvar="PDFLINKCHECK_DAEMON",
+        help="Forward the run to a warm `pdflinkcheck daemon`, skipping engine imports. Default: whenever one is running. Single-file runs without --profile only."
+    ),
 ):
     """
     Analyzes the specified PDF file for all internal, external, and unlinked references.
@@ -187,6 +254,15 @@ def analyze_pdf( # Renamed function for clarity
     • Are referenced files available?
     • Are the page numbers referenced by GoTo links within the length of the document?
 
+    Batch mode:
+    • Pass several files, a directory or a glob to analyze many PDFs; use --jobs N to run them in parallel.
+    • Add --incremental to re-analyze only the files that changed since the previous scan.
+
+    Speed:
+    • --anchor-text none skips text extraction, the slowest step of every engine. Use it for validation-only CI runs.
+    • --profile (and --profile-memory) write a cProfile .pstats file (and per-stage allocation summary) for a slow PDF, ready to attach to a bug report.
+    • With `pdflinkcheck daemon` running, single-file runs are served by it with the engines already imported.
+
     """
 
     """
@@ -201,14 +277,30 @@ def analyze_pdf( # Renamed function for clarity
     Code Default: (Lowest priority) It falls back to "pypdf" as defined in typer.Option.
     """
 
-    if pdf_path is None:
+    batch_mode = False
+    if not pdf_paths:
+        from pdflinkcheck.io import get_first_pdf_in_cwd
         pdf_path = get_first_pdf_in_cwd()
         if pdf_path is None:
             console.print("[red]Error: No PDF file provided and none found in current directory.[/red]")
             raise typer.Exit(code=1)
         console.print(f"[dim]No file specified — using: {Path(pdf_path).name}[/dim]")
-
-    pdf_path_str = str(pdf_path)
+    elif len(pdf_paths) == 1 and not incremental and Path(pdf_paths[0]).expanduser().is_file():
+        # A single explicit file keeps the classic single-report behavior
+        # (and skips importing the batch machinery)
+        pdf_path = Path(pdf_paths[0]).expanduser().resolve()
+    else:
+        from pdflinkcheck.batch import expand_pdf_paths
+        try:
+            resolved_paths = expand_pdf_paths(pdf_paths)
+        except FileNotFoundError as e:
+            console.print(f"[red]Error: {e}[/red]")
+            raise typer.Exit(code=1)
+        if not resolved_paths:
+            console.print("[red]Error: No PDF files found in the given paths.[/red]")
+            raise typer.Exit(code=1)
+        batch_mode = True
+        pdf_path = resolved_paths[0]
 
     VALID_FORMATS = ("JSON") # extend later
     requested_formats = [fmt.strip().upper() for fmt in export_format.split(",")]
@@ -224,29 +316,283 @@ def analyze_pdf( # Renamed function for clarity
             typer.echo(f"Warning: No valid formats found in '{export_format}'. Supported: JSON, TXT.")
     
 
+    if profile_memory:
+        profile = True
+    if profile and batch_mode:
+        console.print("[yellow]--profile applies to single-file runs; profile one of the files on its own.[/yellow]")
+
+    if batch_mode:
+        _analyze_batch(resolved_paths, export_formats, pdf_library, print_bool, jobs, use_cache, incremental, anchor_text, web_links, low_memory)
+
+    if via_daemon is not False and not profile:
+        from pdflinkcheck.daemon import analyze_via_daemon, DaemonUnavailable, DaemonError
+        try:
+            result = analyze_via_daemon({
+                "pdf_path": str(Path(pdf_path).resolve()),
+                "export_format": export_formats,
+                "pdf_library": pdf_library,
+                "print_bool": print_bool,
+                "jobs": jobs,
+                "use_cache": use_cache,
+                "anchor_text": anchor_text,
+                "web_links": web_links,
+                "low_memory": low_memory,
+            })
+        except DaemonUnavailable as e:
+            # Auto-detection stays silent; an explicit --via-daemon says why it ran locally
+            if via_daemon:
+                console.print(f"[yellow]Not using the daemon: {e}. Analyzing locally.[/yellow]")
+        except DaemonError as e:
+            console.print("[red]Error: the analysis failed in the daemon:[/red]")
+            console.print(str(e), highlight=False, markup=False)
+            raise typer.Exit(code=1)
+        else:
+            _exit_with_broken_count(result["has_data"], result["broken"])
+
+    from pdflinkcheck.report import run_report_and_call_exports
+
     # The meat and potatoes
     report_results = run_report_and_call_exports(
         pdf_path=str(pdf_path), 
         export_format = export_formats,
         pdf_library = pdf_library,
         print_bool = print_bool,
+        jobs = jobs,
+        use_cache = use_cache,
+        anchor_text = anchor_text,
+        web_links = web_links,
+        low_memory = low_memory,
+        profile = profile,
+        profile_memory = profile_memory,
     )
 
-    if not report_results or not report_results.get("data"):
-        console.print("[yellow]No links or TOC found — nothing to validate.[/yellow]")
+    has_data = bool(report_results and report_results.get("data"))
+    broken_page_count = 0
+    if has_data:
+        validation_results = report_results["data"]["validation"]
+        # Optional: fail on broken links
+        broken_page_count = validation_results["summary-stats"]["broken-page"] + validation_results["summary-stats"]["broken-file"]
+    _exit_with_broken_count(has_data, broken_page_count)
+
+def _exit_with_broken_count(has_data: bool, broken_page_count: int) -> None:
+    """End `analyze` the same way for local and daemon runs: warn about broken links, exit 1 if any."""
+    # typer's styling rather than the rich console: a daemon-served run then never imports rich.console
+    if not has_data:
+        typer.secho("No links or TOC found — nothing to validate.", fg="yellow")
         raise typer.Exit(code=0)
 
-    validation_results = report_results["data"]["validation"]
-    # Optional: fail on broken links
-    broken_page_count = validation_results["summary-stats"]["broken-page"] + validation_results["summary-stats"]["broken-file"]
-    
     if broken_page_count > 0:
-        console.print(f"\n[bold yellow]Warning:[/bold yellow] {broken_page_count} broken link(s) found.")
+        typer.echo("\n" + typer.style("Warning:", fg="yellow", bold=True) + f" {broken_page_count} broken link(s) found.")
     #else:
     #    console.print(f"\n[bold green]Success:[/bold green] No broken links or TOC issues!\n")
 
     raise typer.Exit(code=0 if broken_page_count == 0 else 1)
 
+def _analyze_batch(pdf_paths: List[Path], export_formats: str, pdf_library: str, print_bool: bool, jobs: int, use_cache: bool = True, incremental: bool = False, anchor_text: str = "accurate", web_links: bool = True, low_memory: bool = False) -> None:
+    """Batch mode for `analyze`: stream per-file results, print an aggregate summary, then exit."""
+    from pdflinkcheck.batch import run_batch
+    from pdflinkcheck.manifest import ScanManifest
+    from pdflinkcheck.io import get_friendly_path
+
+    total = len(pdf_paths)
+    completed = 0
+
+    def on_result(result: Dict) -> None:
+        nonlocal completed
+        completed += 1
+        if not print_bool:
+            return
+        name = get_friendly_path(result["pdf_path"])
+        if result.get("error"):
+            console.print(f"[{completed}/{total}] [red]FAILED[/red] {name}: {result['error']}")
+            return
+        broken = result["broken-page"] + result["broken-file"]
+        status = f"[yellow]{broken} broken[/yellow]" if broken else "[green]ok[/green]"
+        if result.get("unchanged"):
+            status += " [dim](unchanged)[/dim]"
+        console.print(f"[{completed}/{total}] {status} {name} ({result['total_links_count']} links, {result['toc_entry_count']} TOC entries)")
+
+    manifest = ScanManifest() if incremental else None
+    try:
+        aggregate = run_batch(
+            pdf_paths,
+            pdf_library=pdf_library,
+            export_format=export_formats,
+            jobs=jobs,
+            use_cache=use_cache,
+            on_result=on_result,
+            manifest=manifest,
+            anchor_text=anchor_text,
+            web_links=web_links,
+            low_memory=low_memory,
+        )
+    finally:
+        if manifest is not None:
+            manifest.close()
+
+    broken_count = aggregate["broken-page"] + aggregate["broken-file"]
+    console.print("\n[bold]Batch summary[/bold]")
+    console.print(f"Files analyzed: {aggregate['files_ok']}/{aggregate['files_total']} (failed: {aggregate['files_failed']})")
+    if incremental:
+        console.print(f"Unchanged since last scan: {aggregate['files_unchanged']}")
+    console.print(f"Total links: {aggregate['total_links_count']}, TOC entries: {aggregate['toc_entry_count']}")
+    console.print(f"Broken references: {broken_count} across {aggregate['files_with_broken_links']} file(s)")
+    if export_formats:
+        from pdflinkcheck.batch import BATCH_REPORTS_DIR
+        console.print(f"Reports: {get_friendly_path(BATCH_REPORTS_DIR)} (mirroring each PDF's directory)")
+    for failure in aggregate["failures"]:
+        console.print(f"[red]Failed:[/red] {get_friendly_path(failure['pdf_path'])}: {failure['error']}")
+
+    failed = broken_count > 0 or aggregate["files_failed"] > 0
+    raise typer.Exit(code=1 if failed else 0)
+
+@app.command(name="bench")
+def bench_command(
+    pdf_paths: Optional[List[str]] = typer.Argument(
+        None,
+        metavar="[PDF_PATHS]...",
+        help="PDF file(s), directories (searched recursively) or glob patterns to benchmark. If omitted, uses the first PDF in the current directory."
+    ),
+    repeat: int = typer.Option(
+        5,
+        "--repeat", "-k",
+        min=1,
+        help="Warm runs per file and engine, after one cold run. Median and p95 are taken over these."
+    ),
+    engines: Optional[str] = typer.Option(
+        None,
+        "--engines", "-e",
+        help="Comma-separated engines to compare (pypdf, pymupdf, pdfium, xref). Default: every installed engine."
+    ),
+    anchor_text: Literal["none", "fast", "accurate"] = typer.Option(
+        "accurate",
+        "--anchor-text",
+        case_sensitive=False,
+        help="Anchor text mode used for every run, as in analyze."
+    ),
+    json_path: Optional[Path] = typer.Option(
+        None,
+        "--json",
+        help="Also write the raw results (every run's wall time) to this JSON file."
+    ),
+    record: bool = typer.Option(
+        True,
+        "--record/--no-record",
+        help="Add the results to the engine profile that `analyze --engine auto` consults (PDFLINKCHECK_HOME/engine_profile.sqlite3)."
+    ),
+):
+    """
+    Compare the PDF engines on your own files: latency, link counts and peak memory.
+
+    Each file and engine pair runs in a fresh process: one cold run (engine import
+    included, what a single CLI call pays), then --repeat warm runs without the cache.
+    Peak memory is the worker's high-water RSS, interpreter included.
+
+    The results also feed the engine profile: afterwards `--engine auto` picks the
+    engine that was fastest on similar documents (size, pages, annotation density,
+    encryption, object streams), skipping engines whose link counts disagreed.
+    """
+    from pdflinkcheck.bench import run_bench, summarize_by_engine, available_engines, TAIL_PERCENTILE
+    from pdflinkcheck.io import get_first_pdf_in_cwd, get_friendly_path
+    from rich.table import Table
+
+    if not pdf_paths:
+        first_pdf = get_first_pdf_in_cwd()
+        if first_pdf is None:
+            console.print("[red]Error: No PDF file provided and none found in current directory.[/red]")
+            raise typer.Exit(code=1)
+        resolved_paths = [Path(first_pdf)]
+    else:
+        from pdflinkcheck.batch import expand_pdf_paths
+        try:
+            resolved_paths = expand_pdf_paths(pdf_paths)
+        except FileNotFoundError as e:
+            console.print(f"[red]Error: {e}[/red]")
+            raise typer.Exit(code=1)
+        if not resolved_paths:
+            console.print("[red]Error: No PDF files found in the given paths.[/red]")
+            raise typer.Exit(code=1)
+
+    engine_list = [e.strip().lower() for e in engines.split(",") if e.strip()] if engines else available_engines()
+    total = len(resolved_paths) * len(engine_list)
+    completed = 0
+
+    def on_result(result: Dict) -> None:
+        nonlocal completed
+        completed += 1
+        status = "[red]failed[/red]" if result["error"] else f"{result['median_s'] * 1000:.1f} ms"
+        console.print(f"[dim][{completed}/{total}] {result['engine']} {get_friendly_path(result['pdf_path'])}:[/dim] {status}")
+
+    try:
+        results = run_bench(resolved_paths, engines=engine_list, repeat=repeat, anchor_text=anchor_text, on_result=on_result)
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(code=1)
+
+    def fmt_ms(seconds: float) -> str:
+        return f"{seconds * 1000:.1f}"
+
+    def fmt_mb(mb: Optional[float]) -> str:
+        return "-" if mb is None else f"{mb:.1f}"
+
+    console.print(f"\n[bold]pdflinkcheck bench[/bold] (anchor text: {anchor_text}, 1 cold + {repeat} warm run(s) per engine)")
+    by_file: Dict[str, List[Dict]] = {}
+    for result in results:
+        by_file.setdefault(result["pdf_path"], []).append(result)
+    for pdf_path, rows in by_file.items():
+        ok = [r for r in rows if not r["error"]]
+        fastest = min(ok, key=lambda r: r["median_s"])["engine"] if ok else None
+        # Engines disagreeing on what they found matters as much as speed
+        link_counts_differ = len({r["links"] for r in ok}) > 1
+        pages = next((r["pages"] for r in ok if r["pages"] is not None), None)
+        table = Table(title=f"{Path(pdf_path).name}" + (f" ({pages} pages)" if pages is not None else ""))
+        for column in ("Engine", "Cold ms", "Median ms", f"p{TAIL_PERCENTILE} ms", "Links", "TOC", "Peak MB"):
+            table.add_column(column, justify="left" if column == "Engine" else "right")
+        for r in rows:
+            if r["error"]:
+                table.add_row(r["engine"], "", "[red]failed[/red]", "", "", "", "")
+                continue
+            median = fmt_ms(r["median_s"])
+            links = str(r["links"])
+            table.add_row(
+                r["engine"],
+                fmt_ms(r["cold_s"]),
+                f"[bold green]{median}[/bold green]" if r["engine"] == fastest and len(ok) > 1 else median,
+                fmt_ms(r["p95_s"]),
+                f"[yellow]{links}[/yellow]" if link_counts_differ else links,
+                str(r["toc_entries"]),
+                fmt_mb(r["peak_rss_mb"]),
+            )
+        console.print(table)
+
+    if len(by_file) > 1:
+        summary = Table(title=f"Per engine, {len(by_file)} files")
+        for column in ("Engine", "Files ok", "Failed", "Cold ms (sum)", "Median ms (sum)", "Links (sum)", "Peak MB (max)"):
+            summary.add_column(column, justify="left" if column == "Engine" else "right")
+        for engine, entry in summarize_by_engine(results).items():
+            summary.add_row(engine, str(entry["files_ok"]), str(entry["files_failed"]), fmt_ms(entry["cold_s"]),
+                            fmt_ms(entry["median_s"]), str(entry["links"]), fmt_mb(entry["peak_rss_mb"]))
+        console.print(summary)
+
+    if any(len({r["links"] for r in rows if not r["error"]}) > 1 for rows in by_file.values()):
+        console.print("[yellow]Link counts in yellow differ between engines for that file; compare the reports before switching engines.[/yellow]")
+
+    for r in results:
+        if r["error"]:
+            console.print(f"[red]Failed:[/red] {r['engine']} on {get_friendly_path(r['pdf_path'])}: {r['error']}")
+
+    if json_path is not None:
+        import json
+        json_path.write_text(json.dumps({"repeat": repeat, "anchor_text": anchor_text, "results": results}, indent=2), encoding="utf-8")
+        console.print(f"Bench results exported: {get_friendly_path(json_path)}")
+
+    if record:
+        from pdflinkcheck.engine_profile import record_bench_results, PROFILE_PATH
+        if record_bench_results(results, anchor_text=anchor_text):
+            console.print(f"Engine profile updated: {get_friendly_path(PROFILE_PATH)} (used by --engine auto)")
+
+    raise typer.Exit(code=1 if any(r["error"] for r in results) else 0)
+
 @app.command(name="serve")
 def serve(
     host: str = typer.Option("0.0.0.0", "--host", "-h", help="Host to bind (use 0.0.0.0 for network access)"),
@@ -283,7 +629,55 @@ def serve(
         console.print("\n[bold yellow]Server stopped.[/bold yellow]")
         raise typer.Exit(code=0)
 
-        
+
+@app.command(name="daemon")
+def daemon_command(
+    idle_timeout: float = typer.Option(0, "--idle-timeout", min=0, help="Exit after this many seconds without a request. 0 keeps running until stopped."),
+    status: bool = typer.Option(False, "--status", is_flag=True, help="Show whether a daemon is running, and its pid, uptime and request count."),
+    stop: bool = typer.Option(False, "--stop", is_flag=True, help="Stop the running daemon."),
+):
+    """
+    Keep the PDF engines imported and serve `analyze` runs from a warm process.
+
+    Listens on a Unix domain socket in PDFLINKCHECK_HOME. While it runs, single-file `pdflinkcheck analyze` calls are forwarded to it (opt out with --no-daemon), which saves the engine imports on every call, e.g. in a pre-commit hook.
+
+    Runs in the foreground; start it in the background or under a service manager.
+    """
+    from pdflinkcheck.daemon import SOCKET_PATH, DaemonUnavailable, daemon_is_supported, daemon_status, stop_daemon, serve as serve_daemon
+    from pdflinkcheck.io import get_friendly_path
+    if not daemon_is_supported():
+        console.print("[red]Error: the daemon needs Unix domain sockets, which this platform does not provide.[/red]")
+        raise typer.Exit(code=1)
+
+    if status or stop:
+        try:
+            info = daemon_status()
+            if stop:
+                stop_daemon()
+        except DaemonUnavailable as e:
+            console.print(f"Not running: {e}.")
+            raise typer.Exit(code=1)
+        if stop:
+            console.print(f"[green]Daemon (pid {info['pid']}) stopping.[/green]")
+        else:
+            console.print(f"Running: pid {info['pid']}, pdflinkcheck {info['version']}, up {info['uptime_s']:.0f} s, "
+                          f"{info['requests']} request(s), engines: {', '.join(info['engines'])}")
+        raise typer.Exit(code=0)
+
+    def on_ready(server):
+        console.print(f"[bold green]pdflinkcheck daemon[/bold green] listening on {get_friendly_path(SOCKET_PATH)} "
+                      f"(engines: {', '.join(server.engines)})")
+        console.print("[dim]Stop with Ctrl+C or `pdflinkcheck daemon --stop`.[/dim]")
+
+    try:
+        serve_daemon(idle_timeout=idle_timeout, log=lambda line: console.print(f"[dim]{line}[/dim]", highlight=False), on_ready=on_ready)
+    except RuntimeError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(code=1)
+    except KeyboardInterrupt:
+        pass
+    console.print("[bold yellow]Daemon stopped.[/bold yellow]")
+
 @app.command(name="gui") 
 def gui_command(
     auto_close: int = typer.Option(0, 
@@ -306,6 +700,7 @@ def gui_command(
         # Typer has successfully converted the command line argument, and auto_close is an int.
         assured_auto_close_value = int(auto_close)
 
+    import pyhabitat
     if not pyhabitat.tkinter_is_available():
         _gui_failure_msg()
         return
@@ -316,6 +711,7 @@ def gui_command(
 
 # --- Helper, consistent gui failure message. --- 
 def _gui_failure_msg():
+    import pyhabitat
     console.print("[bold red]GUI failed to launch[/bold red]")
     console.print("Ensure pdflinkcheck dependecies are installed and the venv is activated (the dependecies are managed by uv).")
     console.print("The dependecies for pdflinkcheck are managed by uv.")
@@ -325,5 +721,9 @@ def _gui_failure_msg():
     pass
 
 if __name__ == "__main__":
+    # Needed for the process pools (batch mode, page sharding) in frozen PyInstaller builds
+    if getattr(sys, "frozen", False):
+        import multiprocessing
+        multiprocessing.freeze_support()
     app()
     
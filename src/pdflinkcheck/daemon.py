@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# src/pdflinkcheck/daemon.py
+from __future__ import annotations
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import time
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from pdflinkcheck.io import PDFLINKCHECK_HOME
+from pdflinkcheck.version_info import get_version_from_pyproject
+
+"""
+Warm analysis daemon (`pdflinkcheck daemon`) and its client.
+
+A one-shot `pdflinkcheck analyze` spends most of its time starting Python and
+importing the engines. The daemon imports them once and then serves analyze
+requests over a Unix domain socket in PDFLINKCHECK_HOME. While it runs,
+`analyze` forwards single-file runs to it and prints the same report:
+
+    pdflinkcheck daemon &                      # or under a service manager
+    pdflinkcheck analyze manual.pdf            # served by the daemon
+    pdflinkcheck analyze manual.pdf --no-daemon
+
+Protocol: one JSON object per line. The client sends a single request,
+{"op": "analyze" | "status" | "stop", "build": build_id(), ...}. For analyze
+the daemon answers {"accepted": true} as soon as it takes the request up,
+then {"stream": "stdout" | "stderr", "text": ...} lines carrying the run's
+console output as it is printed, then a final {"done": true, ...} or
+{"error": ...} line.
+
+Requests are served one at a time in the order they connect: the engines are
+not thread-safe, and the redirected stdout is process-wide. The client only
+talks to a daemon of the same version from the same install (build_id());
+otherwise, or when no daemon accepts the request within ACCEPT_TIMEOUT_S
+(busy with another client's run, or hung), it raises DaemonUnavailable and
+the caller analyzes in-process. The socket is created owner-only (0600).
+Platforms without AF_UNIX (older Windows builds) have no daemon.
+"""
+
+SOCKET_PATH = PDFLINKCHECK_HOME / "daemon.sock"
+
+PROTOCOL_VERSION = 2
+
+# Seconds an analyze client waits to connect and for {"accepted": true}.
+# Once accepted, a run may take as long as it needs.
+ACCEPT_TIMEOUT_S = 5.0
+
+# Analyze request fields, passed to run_report_and_call_exports()
+ANALYZE_FIELDS = ("pdf_path", "export_format", "pdf_library", "print_bool", "jobs", "use_cache", "anchor_text", "web_links", "low_memory")
+
+
+class DaemonUnavailable(Exception):
+    """No compatible daemon is listening; analyze in-process instead."""
+
+
+class DaemonError(Exception):
+    """The daemon accepted the request but the run failed (message: its traceback)."""
+
+
+def daemon_is_supported() -> bool:
+    return hasattr(socket, "AF_UNIX")
+
+
+def build_id() -> Dict[str, Any]:
+    """What client and daemon must agree on: protocol, version and install location."""
+    return {
+        "protocol": PROTOCOL_VERSION,
+        "version": get_version_from_pyproject(),
+        "package_dir": str(Path(__file__).resolve().parent),
+    }
+
+
+# --- Client ---
+
+def _request(message: Dict[str, Any], socket_path: Path, timeout: Optional[float] = None, accept_timeout: Optional[float] = None):
+    """
+    Connect, send one request and yield the reply messages. Raises DaemonUnavailable.
+    accept_timeout bounds the connect and the wait for the first reply (default:
+    timeout); later replies wait up to timeout (None waits forever).
+    """
+    if not daemon_is_supported() or not Path(socket_path).exists():
+        raise DaemonUnavailable("no daemon running")
+    if accept_timeout is None:
+        accept_timeout = timeout
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(accept_timeout)
+    try:
+        try:
+            sock.connect(str(socket_path))
+        except OSError as e:
+            # A stale socket file from a daemon that did not shut down cleanly
+            raise DaemonUnavailable(f"no daemon answering on {socket_path} ({e.strerror or e})") from e
+        with sock.makefile("rwb") as stream:
+            try:
+                stream.write(json.dumps({**message, "build": build_id()}).encode("utf-8") + b"\n")
+                stream.flush()
+                line = stream.readline()
+            except socket.timeout as e:
+                raise DaemonUnavailable(f"the daemon did not take the request within {accept_timeout} s (busy or not responding)") from e
+            sock.settimeout(timeout)
+            while line:
+                reply = json.loads(line)
+                if "mismatch" in reply:
+                    theirs = reply["mismatch"]
+                    raise DaemonUnavailable(f"the daemon runs pdflinkcheck {theirs['version']} from {theirs['package_dir']}")
+                yield reply
+                line = stream.readline()
+    finally:
+        sock.close()
+
+
+def analyze_via_daemon(request: Dict[str, Any], socket_path: Path = SOCKET_PATH, accept_timeout: float = ACCEPT_TIMEOUT_S) -> Dict[str, Any]:
+    """
+    Run one analyze request (ANALYZE_FIELDS; pdf_path absolute) on the daemon,
+    writing its console output to this process's stdout and stderr as it
+    arrives. Returns the final message: {"done": True, "has_data": bool,
+    "broken": int, "seconds": float}.
+
+    Raises:
+        DaemonUnavailable: No compatible daemon accepted the request within
+                           accept_timeout seconds; nothing was printed.
+        DaemonError: The run failed in the daemon.
+    """
+    targets = {"stdout": sys.stdout, "stderr": sys.stderr}
+    message = {"op": "analyze", **{k: request[k] for k in ANALYZE_FIELDS}}
+    for reply in _request(message, socket_path, accept_timeout=accept_timeout):
+        if "stream" in reply:
+            target = targets[reply["stream"]]
+            target.write(reply["text"])
+            target.flush()
+        elif "error" in reply:
+            raise DaemonError(reply["error"])
+        elif reply.get("done"):
+            return reply
+    raise DaemonError("the daemon closed the connection before the run finished")
+
+
+def daemon_status(socket_path: Path = SOCKET_PATH, timeout: Optional[float] = 10.0) -> Dict[str, Any]:
+    """pid, uptime, requests served and preloaded engines. Raises DaemonUnavailable."""
+    return next(_request({"op": "status"}, socket_path, timeout))
+
+
+def stop_daemon(socket_path: Path = SOCKET_PATH, timeout: Optional[float] = 10.0) -> None:
+    """Ask the daemon to exit once its current request is done. Raises DaemonUnavailable."""
+    next(_request({"op": "stop"}, socket_path, timeout))
+
+
+# --- Server ---
+
+class _StreamWriter(io.TextIOBase):
+    """Forwards writes to the client line by line, tagged with the stream name."""
+
+    def __init__(self, send: Callable[[Dict[str, Any]], None], name: str):
+        self._send = send
+        self._name = name
+        self._pending: List[str] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        self._pending.append(text)
+        if "\n" in text:
+            self.flush()
+        return len(text)
+
+    def flush(self) -> None:
+        if self._pending:
+            text = "".join(self._pending)
+            self._pending.clear()
+            self._send({"stream": self._name, "text": text})
+
+
+class _DaemonHandler(socketserver.StreamRequestHandler):
+
+    def send(self, message: Dict[str, Any]) -> None:
+        self.wfile.write(json.dumps(message).encode("utf-8") + b"\n")
+        self.wfile.flush()
+
+    def handle(self) -> None:
+        server: DaemonServer = self.server
+        try:
+            request = json.loads(self.rfile.readline())
+            if request.get("build") != server.build:
+                self.send({"mismatch": server.build})
+            elif request.get("op") == "status":
+                self.send(server.status())
+            elif request.get("op") == "stop":
+                server.stopping = True
+                self.send({"stopping": True})
+            elif request.get("op") == "analyze":
+                self.analyze(request)
+            else:
+                self.send({"error": f"unknown op: {request.get('op')!r}"})
+        except (OSError, ValueError):
+            # Client went away (or sent garbage); nothing to answer
+            pass
+
+    def analyze(self, request: Dict[str, Any]) -> None:
+        from pdflinkcheck.report import run_report_and_call_exports
+        server: DaemonServer = self.server
+        start = time.perf_counter()
+        # Tells the client the run has started; it stops waiting for a busy daemon here
+        self.send({"accepted": True})
+        stdout, stderr = _StreamWriter(self.send, "stdout"), _StreamWriter(self.send, "stderr")
+        try:
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                report = run_report_and_call_exports(**{k: request[k] for k in ANALYZE_FIELDS})
+        except (BrokenPipeError, ConnectionResetError):
+            raise
+        except Exception:
+            stdout.flush()
+            stderr.flush()
+            self.send({"error": traceback.format_exc()})
+            return
+        finally:
+            server.requests += 1
+        stdout.flush()
+        stderr.flush()
+        has_data = bool(report and report.get("data"))
+        broken = 0
+        if has_data:
+            stats = report["data"]["validation"]["summary-stats"]
+            broken = stats["broken-page"] + stats["broken-file"]
+        seconds = round(time.perf_counter() - start, 6)
+        self.send({"done": True, "has_data": has_data, "broken": broken, "seconds": seconds})
+        if server.log:
+            server.log(f"{Path(request['pdf_path']).name} ({request['pdf_library']}): {seconds:.3f} s, {broken} broken")
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    """One request at a time; see the module docstring."""
+
+    def __init__(self, socket_path: Path, log: Optional[Callable[[str], None]] = None):
+        self.build = build_id()
+        self.log = log
+        self.started = time.time()
+        self.requests = 0
+        self.stopping = False
+        self.engines = preload_engines()
+        previous_umask = os.umask(0o177)
+        try:
+            super().__init__(str(socket_path), _DaemonHandler)
+        finally:
+            os.umask(previous_umask)
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "pid": os.getpid(),
+            "version": self.build["version"],
+            "uptime_s": round(time.time() - self.started, 1),
+            "requests": self.requests,
+            "engines": self.engines,
+        }
+
+    def handle_timeout(self) -> None:
+        # Idle timeout elapsed without a request
+        self.stopping = True
+
+
+def preload_engines() -> List[str]:
+    """Import the report pipeline and every installed engine; returns the engine names."""
+    import importlib
+    from pdflinkcheck.environment import pymupdf_is_available, pdfium_is_available
+    import pdflinkcheck.report  # noqa: F401
+    import pdflinkcheck.engine_profile  # noqa: F401
+    engines = ["pypdf", "xref"]
+    if pymupdf_is_available():
+        engines.append("pymupdf")
+    if pdfium_is_available():
+        engines.append("pdfium")
+    for engine in engines:
+        importlib.import_module(f"pdflinkcheck.analysis_{engine}")
+    return engines
+
+
+def serve(socket_path: Path = SOCKET_PATH, idle_timeout: float = 0, log: Optional[Callable[[str], None]] = None,
+          on_ready: Optional[Callable[[DaemonServer], None]] = None) -> None:
+    """
+    Preload the engines and serve requests until stopped (stop_daemon(),
+    SIGTERM, Ctrl+C or idle_timeout seconds without a request; 0 waits
+    forever). Removes the socket file on exit.
+
+    Raises:
+        RuntimeError: If AF_UNIX is unsupported or a daemon already answers on socket_path.
+    """
+    if not daemon_is_supported():
+        raise RuntimeError("The daemon needs Unix domain sockets, which this platform does not provide.")
+    socket_path = Path(socket_path)
+    if socket_path.exists():
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(socket_path))
+        except OSError:
+            # Left behind by a daemon that did not shut down cleanly
+            socket_path.unlink()
+        else:
+            raise RuntimeError(f"A daemon is already running on {socket_path}.")
+        finally:
+            probe.close()
+
+    import signal
+    import threading
+    if hasattr(signal, "SIGTERM") and threading.current_thread() is threading.main_thread():
+        # Exit through the finally below, which removes the socket file
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    with DaemonServer(socket_path, log=log) as server:
+        server.timeout = idle_timeout or None
+        try:
+            if on_ready:
+                on_ready(server)
+            while not server.stopping:
+                server.handle_request()
+        finally:
+            socket_path.unlink(missing_ok=True)
@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# src/pdflinkcheck/engine_profile.py
+from __future__ import annotations
+import os
+import sqlite3
+import statistics
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+from pdflinkcheck.io import PDFLINKCHECK_HOME
+from pdflinkcheck.source import is_path, source_name
+
+"""
+Benchmark-driven engine selection for `--engine auto`.
+
+Without a profile, "auto" prefers pdfium > pymupdf > pypdf. Which engine is
+fastest depends on the documents, though: on a small PDF, importing and
+initializing a native engine can cost more than the whole pypdf run. The
+engine profile records how long each engine took on each class of document,
+and "auto" picks the engine that was fastest on that class.
+
+Document classes ("buckets") come from a cheap probe through the raw xref
+reader (see pdflinkcheck.analysis_xref): file size, page count, annotations
+per page on the first pages, encryption and object streams, plus the
+anchor-text mode. The probe reads the cross-reference data and a handful of
+objects, never page content.
+
+Samples come from two places:
+
+    pdflinkcheck bench *.pdf          one cold and one warm sample per file and engine,
+                                      and which engines disagree on the link count
+    run_report(pdf_library="auto")    the wall time of every run, once a profile exists
+
+"cold" samples include the engine's import and first-use initialization
+(a one-shot CLI call); "warm" samples do not (batch workers, servers, later
+calls in the same process). An engine whose module is already imported is
+ranked by its warm samples, otherwise by its cold ones.
+
+An engine that found a different number of links than the majority of
+engines on any benchmarked file of a class is never chosen for that class,
+however fast: auto must not trade results for speed. The xref engine skips
+anchor text and is never a candidate.
+
+Stored in PDFLINKCHECK_HOME/engine_profile.sqlite3 (stdlib sqlite3). Until
+that file exists, "auto" costs nothing beyond a stat() of it. The newest
+SAMPLES_KEPT samples per class, engine and kind are kept.
+"""
+
+PROFILE_PATH = PDFLINKCHECK_HOME / "engine_profile.sqlite3"
+
+# "auto" candidates, in the order used without profile data
+AUTO_ENGINES = ("pdfium", "pymupdf", "pypdf")
+
+# Module whose presence in sys.modules means the engine is warm
+_ENGINE_MODULES = {"pdfium": "pypdfium2", "pymupdf": "fitz", "pypdf": "pypdf"}
+
+SAMPLES_KEPT = 20
+
+# Pages whose /Annots arrays the probe counts
+PROBE_PAGES = 8
+
+# (upper bound inclusive, label)
+_SIZE_CLASSES = ((100 * 1024, "<=100KB"), (1024 ** 2, "<=1MB"), (10 * 1024 ** 2, "<=10MB"), (100 * 1024 ** 2, "<=100MB"))
+_PAGE_CLASSES = ((4, "1-4"), (32, "5-32"), (256, "33-256"), (2048, "257-2048"))
+_ANNOT_CLASSES = ((0, "none"), (10, "low"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS samples (
+    bucket      TEXT NOT NULL,
+    engine      TEXT NOT NULL,
+    kind        TEXT NOT NULL,
+    seconds     REAL NOT NULL,
+    source      TEXT NOT NULL,
+    recorded_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS samples_by_bucket ON samples (bucket, engine, kind);
+CREATE TABLE IF NOT EXISTS mismatches (
+    bucket          TEXT NOT NULL,
+    engine          TEXT NOT NULL,
+    pdf_name        TEXT NOT NULL,
+    links           INTEGER,
+    reference_links INTEGER,
+    recorded_at     REAL NOT NULL,
+    PRIMARY KEY (bucket, engine, pdf_name)
+);
+"""
+
+
+class AutoChoice(NamedTuple):
+    engine: str
+    bucket: str
+    cold: bool           # The engine was not imported yet when chosen
+    from_profile: bool   # False: no samples for this class, default order used
+
+
+def _classify(value: Optional[float], classes, above: str) -> str:
+    if value is None:
+        return "?"
+    for bound, label in classes:
+        if value <= bound:
+            return label
+    return above
+
+
+def _first_pages(raw, pages_node, limit: int) -> List[Dict[str, Any]]:
+    """Up to limit leaf page dictionaries from the start of the page tree."""
+    from pdflinkcheck.analysis_xref import Ref
+    found: List[Dict[str, Any]] = []
+    stack = [pages_node]
+    seen = set()
+    while stack and len(found) < limit:
+        node_ref = stack.pop()
+        if isinstance(node_ref, Ref):
+            if node_ref.num in seen:
+                continue
+            seen.add(node_ref.num)
+        node = raw.resolve(node_ref)
+        if not isinstance(node, dict):
+            continue
+        kids = raw.resolve(node.get("/Kids"))
+        if isinstance(kids, list) and node.get("/Type") != "/Page":
+            stack.extend(reversed(kids))
+        else:
+            found.append(node)
+    return found
+
+
+def document_features(pdf_path) -> Dict[str, Any]:
+    """
+    Cheap structural features of a PDF (path or in-memory source). Values
+    the probe cannot determine are None. Never raises.
+    """
+    from pdflinkcheck.analysis_xref import RawPdf
+    features: Dict[str, Any] = {
+        "size_bytes": None, "pages": None, "annots_per_page": None, "encrypted": None, "object_streams": None,
+    }
+    try:
+        raw = RawPdf(pdf_path, allow_encrypted=True)
+    except Exception:
+        if is_path(pdf_path):
+            try:
+                features["size_bytes"] = os.stat(pdf_path).st_size
+            except OSError:
+                pass
+        return features
+    try:
+        features["size_bytes"] = len(raw.buf)
+        features["encrypted"] = raw.encrypted
+        features["object_streams"] = raw.uses_object_streams
+        # Encrypted object streams cannot be decoded here; the rest stays None
+        catalog = raw.resolve(raw.trailer["/Root"])
+        pages_node = catalog.get("/Pages")
+        count = raw.resolve(raw.resolve(pages_node).get("/Count"))
+        if isinstance(count, int):
+            features["pages"] = count
+        sampled = _first_pages(raw, pages_node, PROBE_PAGES)
+        if sampled:
+            annots = 0
+            for page in sampled:
+                page_annots = raw.resolve(page.get("/Annots"))
+                if isinstance(page_annots, list):
+                    annots += len(page_annots)
+            features["annots_per_page"] = round(annots / len(sampled), 2)
+    except Exception:
+        pass
+    finally:
+        raw.close()
+    return features
+
+
+def bucket_key(features: Dict[str, Any], anchor_text: str = "accurate") -> str:
+    """The document class of features, e.g. "anchor=accurate;size=<=1MB;pages=5-32;annots=low;encrypted=no;objstm=yes"."""
+    def flag(value: Optional[bool]) -> str:
+        return "?" if value is None else ("yes" if value else "no")
+    return ";".join((
+        f"anchor={anchor_text}",
+        f"size={_classify(features['size_bytes'], _SIZE_CLASSES, '>100MB')}",
+        f"pages={_classify(features['pages'], _PAGE_CLASSES, '>2048')}",
+        f"annots={_classify(features['annots_per_page'], _ANNOT_CLASSES, 'high')}",
+        f"encrypted={flag(features['encrypted'])}",
+        f"objstm={flag(features['object_streams'])}",
+    ))
+
+
+def engine_is_warm(engine: str) -> bool:
+    """True if the engine's library is already imported in this process."""
+    return _ENGINE_MODULES.get(engine) in sys.modules
+
+
+class EngineProfile:
+    """
+    Usage:
+        with EngineProfile() as profile:
+            profile.record_sample(bucket, "pypdf", "cold", 0.21, source="bench")
+            engine = profile.choose(bucket, ["pdfium", "pypdf"])
+    """
+    def __init__(self, profile_path: str | Path = PROFILE_PATH):
+        self.profile_path = Path(profile_path)
+        self.profile_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.profile_path))
+        self._conn.executescript(_SCHEMA)
+
+    def record_sample(self, bucket: str, engine: str, kind: str, seconds: float, source: str = "run") -> None:
+        """Add one "cold" or "warm" timing and drop all but the newest SAMPLES_KEPT of its kind."""
+        if kind not in ("cold", "warm"):
+            raise ValueError(f"Unknown sample kind: {kind!r}. Expected 'cold' or 'warm'.")
+        self._conn.execute(
+            "INSERT INTO samples (bucket, engine, kind, seconds, source, recorded_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (bucket, engine, kind, float(seconds), source, time.time()),
+        )
+        self._conn.execute(
+            "DELETE FROM samples WHERE bucket = ? AND engine = ? AND kind = ? AND rowid NOT IN "
+            "(SELECT rowid FROM samples WHERE bucket = ? AND engine = ? AND kind = ? ORDER BY recorded_at DESC LIMIT ?)",
+            (bucket, engine, kind, bucket, engine, kind, SAMPLES_KEPT),
+        )
+
+    def record_equivalence(self, bucket: str, engine: str, pdf_name: str, links: int, reference_links: int) -> None:
+        """Mark engine as disagreeing on pdf_name when links != reference_links, or clear an earlier mark."""
+        if links == reference_links:
+            self._conn.execute(
+                "DELETE FROM mismatches WHERE bucket = ? AND engine = ? AND pdf_name = ?", (bucket, engine, pdf_name)
+            )
+        else:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO mismatches (bucket, engine, pdf_name, links, reference_links, recorded_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (bucket, engine, pdf_name, links, reference_links, time.time()),
+            )
+
+    def median_seconds(self, bucket: str, engine: str, kind: str) -> Optional[float]:
+        rows = self._conn.execute(
+            "SELECT seconds FROM samples WHERE bucket = ? AND engine = ? AND kind = ?", (bucket, engine, kind)
+        ).fetchall()
+        return statistics.median(row[0] for row in rows) if rows else None
+
+    def mismatched_engines(self, bucket: str) -> List[str]:
+        return [row[0] for row in self._conn.execute("SELECT DISTINCT engine FROM mismatches WHERE bucket = ?", (bucket,))]
+
+    def choose(self, bucket: str, candidates: Iterable[str], warm_engines: Iterable[str] = ()) -> Optional[str]:
+        """
+        The candidate with the lowest median time for bucket, or None without
+        samples. Warm engines are ranked by their warm samples, the others by
+        their cold ones, falling back to the other kind. Engines that
+        disagreed on link counts in this bucket are skipped; ties keep the
+        candidates' order.
+        """
+        warm_engines = set(warm_engines)
+        excluded = set(self.mismatched_engines(bucket))
+        best: Optional[str] = None
+        best_seconds = 0.0
+        for engine in candidates:
+            if engine in excluded:
+                continue
+            kinds = ("warm", "cold") if engine in warm_engines else ("cold", "warm")
+            seconds = None
+            for kind in kinds:
+                seconds = self.median_seconds(bucket, engine, kind)
+                if seconds is not None:
+                    break
+            if seconds is not None and (best is None or seconds < best_seconds):
+                best, best_seconds = engine, seconds
+        return best
+
+    def commit(self) -> None:
+        self._conn.commit()
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self.commit()
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self) -> "EngineProfile":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def auto_candidates() -> List[str]:
+    """AUTO_ENGINES that are installed, in default order."""
+    from pdflinkcheck.environment import pymupdf_is_available, pdfium_is_available
+    available = {"pdfium": pdfium_is_available, "pymupdf": pymupdf_is_available}
+    return [engine for engine in AUTO_ENGINES if engine not in available or available[engine]()]
+
+
+def select_engine(pdf_path, anchor_text: str = "accurate", profile_path: str | Path = PROFILE_PATH) -> Optional[AutoChoice]:
+    """
+    The engine "auto" should use for pdf_path, or None if there is no
+    profile yet (the caller then uses the default order).
+    """
+    profile_path = Path(profile_path)
+    if pdf_path is None or not profile_path.exists():
+        return None
+    # Before the availability checks, which import the engines
+    warm = {engine for engine in AUTO_ENGINES if engine_is_warm(engine)}
+    candidates = auto_candidates()
+    bucket = bucket_key(document_features(pdf_path), anchor_text)
+    try:
+        with EngineProfile(profile_path) as profile:
+            engine = profile.choose(bucket, candidates, warm)
+    except sqlite3.Error as e:
+        print(f"Engine profile unreadable, using the default engine order: {e}", file=sys.stderr)
+        return None
+    if engine is None:
+        return AutoChoice(candidates[0], bucket, candidates[0] not in warm, from_profile=False)
+    return AutoChoice(engine, bucket, engine not in warm, from_profile=True)
+
+
+def learn_from_run(choice: AutoChoice, seconds: float, profile_path: str | Path = PROFILE_PATH) -> None:
+    """Record the wall time of a run whose engine select_engine() chose. Never raises."""
+    try:
+        with EngineProfile(profile_path) as profile:
+            profile.record_sample(choice.bucket, choice.engine, "cold" if choice.cold else "warm", seconds, source="run")
+    except sqlite3.Error as e:
+        print(f"Could not update the engine profile: {e}", file=sys.stderr)
+
+
+def reference_link_count(counts: Iterable[int]) -> int:
+    """The link count most engines agree on; the highest count among ties."""
+    tally = Counter(counts)
+    return max(tally, key=lambda links: (tally[links], links))
+
+
+def record_bench_results(results: List[Dict[str, Any]], anchor_text: str = "accurate", profile_path: str | Path = PROFILE_PATH) -> int:
+    """
+    Add `pdflinkcheck bench` results (see pdflinkcheck.bench.run_bench) to the
+    profile: each successful file and engine pair gives a cold sample, a warm
+    sample (its median) and an equivalence verdict against the other engines.
+    xref results are not recorded. Returns the number of pairs recorded.
+    """
+    by_file: Dict[str, List[Dict[str, Any]]] = {}
+    for result in results:
+        if not result["error"] and result["engine"] in AUTO_ENGINES:
+            by_file.setdefault(result["pdf_path"], []).append(result)
+
+    recorded = 0
+    with EngineProfile(profile_path) as profile:
+        for pdf_path, rows in by_file.items():
+            bucket = bucket_key(document_features(pdf_path), anchor_text)
+            reference = reference_link_count(r["links"] for r in rows)
+            for r in rows:
+                profile.record_sample(bucket, r["engine"], "cold", r["cold_s"], source="bench")
+                profile.record_sample(bucket, r["engine"], "warm", r["median_s"], source="bench")
+                # Compared within this run only: a lone engine has nothing to disagree with
+                if len(rows) > 1:
+                    profile.record_equivalence(bucket, r["engine"], source_name(pdf_path), r["links"], reference)
+                recorded += 1
+    return recorded
+
+
+def reset(profile_path: str | Path = PROFILE_PATH) -> bool:
+    """Delete the profile; "auto" goes back to the default order. True if there was one."""
+    try:
+        Path(profile_path).unlink()
+        return True
+    except FileNotFoundError:
+        return False
@@ -3,6 +3,8 @@
 # pdflinkcheck/environment.py
 from __future__ import annotations
 from functools import cache
+import importlib
+import importlib.util
 import subprocess
 """
 Environment checks.
@@ -14,33 +16,57 @@ Functions:
 Examples:
 - is_in_git_repo() is used when deciding to force load src/pdflinkcheck/data/ files, when CLI docs is called, and if they are not found when called in the GUI,
 - Default to pypdf at load if not pymupdf_is_available(). pymupdf_is_available() is useful for caching a common check in this codebase and setting up explicit logic rather than relying on try/except blocks in each instance. 
+
+The *_is_available() checks look the module up with importlib.util.find_spec()
+instead of importing it. Importing fitz alone takes longer than the rest of
+CLI startup, and the checks run while the CLI builds its options. An
+installed but broken package therefore counts as available and fails with
+ImportError when the engine is actually used.
 """
 
 def clear_all_caches()->None:
-    """Clear every @cache used in pdflinkcheck. Future work: Call from CLI using --clear-cache"""
-    
+    """
+    Clear every @cache used in pdflinkcheck and purge the on-disk result cache
+    (PDFLINKCHECK_HOME/cache, see pdflinkcheck.cache). Called from CLI using `tools --clear-cache`.
+    """
+    importlib.invalidate_caches()  # find_spec() must see packages installed since startup
+    pymupdf_is_available.cache_clear()
+    pdfium_is_available.cache_clear()
+    numpy_is_available.cache_clear()
+    is_in_git_repo.cache_clear()
+
+    from pdflinkcheck import cache as result_cache
+    result_cache.engine_version.cache_clear()
+    result_cache.clear()
+
+def _module_is_installed(name: str) -> bool:
+    """True if the top-level module name can be found, without importing it."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
 @cache
 def pymupdf_is_available() -> bool:
     """Check if pymupdf is available in the current local version of pdflinkcheck."""
-    try:
-        import fitz
-        return True
-    except Exception:
-        # Fails if: the [full] group from [project.optional-dependencies] in pyrpoject.toml was not used when installing pdflink check. Like 
-        # Use: `pipx install pdflinkcheck[full]` or alternative.
-        return False
+    # None if: the [full] group from [project.optional-dependencies] in pyrpoject.toml was not used when installing pdflink check.
+    # Use: `pipx install pdflinkcheck[full]` or alternative.
+    return _module_is_installed("fitz")
 
 @cache
 def pdfium_is_available() -> bool:
     """Check if pdfium2 is available in the current local version of pdflinkcheck."""
-    try:
-        import pypdfium2
-        return True
-    except Exception:
-        # Fails if: the [full] group from [project.optional-dependencies] in pyrpoject.toml was not used when installing pdflink check. Like 
-        # Use: `pipx install pdflinkcheck[pdfium]` or alternative.
-        return False
+    # None if: the [pdfium] group from [project.optional-dependencies] in pyrpoject.toml was not used when installing pdflink check.
+    # Use: `pipx install pdflinkcheck[pdfium]` or alternative.
+    return _module_is_installed("pypdfium2")
+
 
+@cache
+def numpy_is_available() -> bool:
+    """Check if numpy is available, for the optional batched anchor text backend."""
+    # Not a dependency of pdflinkcheck. Absent on most Termux installs, which is fine;
+    # pdflinkcheck.spatial falls back to pure Python.
+    return _module_is_installed("numpy")
 
 
 @cache
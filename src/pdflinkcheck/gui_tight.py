@@ -260,6 +260,7 @@ class PDFLinkCheckerApp(tk.Tk):
                 pdf_path=pdf_path_str,
                 export_format=export_format,
                 pdf_library=pdf_library,
+                use_cache=True,
             )
             self.current_report_text = report_results.get("text", "")
             self.current_report_data = report_results.get("data", {})
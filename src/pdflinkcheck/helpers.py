@@ -20,6 +20,32 @@ def debug_head(label: str, data: Any, n: int = 3):
         print(data)
 
 
+# anchor_text= modes shared by every engine:
+#   "none"      skip text extraction; link_text is ANCHOR_TEXT_SKIPPED
+#   "fast"      only the text around the links, on FAST_ANCHOR_TEXT_ENGINES
+#   "accurate"  full per-page text pass (default)
+ANCHOR_TEXT_MODES = ("none", "fast", "accurate")
+ANCHOR_TEXT_SKIPPED = "N/A: Anchor Text Skipped"
+
+# Engines with a cheaper text pass for "fast"; pypdf and pdfium already read
+# each page's text in one pass, so "fast" runs "accurate" there
+FAST_ANCHOR_TEXT_ENGINES = ("pymupdf",)
+
+
+def check_anchor_text_mode(anchor_text: str) -> str:
+    if anchor_text not in ANCHOR_TEXT_MODES:
+        raise ValueError(f"Invalid anchor_text mode: {anchor_text!r}. Use one of {ANCHOR_TEXT_MODES}.")
+    return anchor_text
+
+
+def effective_anchor_text_mode(anchor_text: str, pdf_library: str) -> str:
+    """The mode pdf_library actually runs: "fast" is "accurate" outside FAST_ANCHOR_TEXT_ENGINES."""
+    check_anchor_text_mode(anchor_text)
+    if anchor_text == "fast" and pdf_library not in FAST_ANCHOR_TEXT_ENGINES:
+        return "accurate"
+    return anchor_text
+
+
 class PageRef:
     """
     A simple translator to handle the 0-to-1 index conversion 
@@ -112,17 +112,24 @@ def export_report_data(
 def export_report_json(
     report_data: Dict[str, Any], 
     pdf_filename: str, 
-    pdf_library: str
+    pdf_library: str,
+    output_dir: Optional[Path] = None,
+    announce: bool = True,
 ) -> Path:
-    """Exports structured dictionary results to a .json file."""
+    """
+    Exports structured dictionary results to a .json file in output_dir
+    (default PDFLINKCHECK_HOME). announce=False skips the "exported" line.
+    """
     
     base_name = Path(pdf_filename).stem
-    output_path = PDFLINKCHECK_HOME / f"{base_name}_{pdf_library}_report.json"
+    output_path = Path(output_dir or PDFLINKCHECK_HOME) / f"{base_name}_{pdf_library}_report.json"
 
     try:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
         with open(output_path, 'w', encoding='utf-8') as f:
             json.dump(report_data, f, indent=4)
-        print(f"\nJSON report exported: {get_friendly_path(output_path)}")
+        if announce:
+            print(f"\nJSON report exported: {get_friendly_path(output_path)}")
         return output_path
     except Exception as e:
         error_logger.error(f"JSON export failed: {e}", exc_info=True)
@@ -131,21 +138,69 @@ def export_report_json(
 def export_report_txt(
     report_text: str, 
     pdf_filename: str, 
-    pdf_library: str
+    pdf_library: str,
+    output_dir: Optional[Path] = None,
+    announce: bool = True,
 ) -> Path:
-    """Exports the formatted string buffer to a .txt file."""
+    """
+    Exports the formatted string buffer to a .txt file in output_dir
+    (default PDFLINKCHECK_HOME). announce=False skips the "exported" line.
+    """
     #pdf_filename = implement_non_redundant_naming(pdf_filename)
     base_name = Path(pdf_filename).stem
-    output_path = PDFLINKCHECK_HOME / f"{base_name}_{pdf_library}_report.txt"
+    output_path = Path(output_dir or PDFLINKCHECK_HOME) / f"{base_name}_{pdf_library}_report.txt"
 
     try:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
         output_path.write_text(report_text, encoding='utf-8')
-        print(f"\nTXT report exported: {get_friendly_path(output_path)}")
+        if announce:
+            print(f"\nTXT report exported: {get_friendly_path(output_path)}")
         return output_path
     except Exception as e:
         error_logger.error(f"TXT export failed: {e}", exc_info=True)
         raise RuntimeError(f"TXT export failed: {e}")
 
+def export_profile_stats(
+    profiler: Any,
+    pdf_filename: str,
+    pdf_library: str
+) -> Path:
+    """Dumps a cProfile.Profile to a .pstats file (read it with `python -m pstats` or snakeviz)."""
+    base_name = Path(pdf_filename).stem
+    output_path = PDFLINKCHECK_HOME / f"{base_name}_{pdf_library}_profile.pstats"
+
+    try:
+        profiler.dump_stats(str(output_path))
+        print(f"\nProfile exported: {get_friendly_path(output_path)}")
+        return output_path
+    except Exception as e:
+        error_logger.error(f"Profile export failed: {e}", exc_info=True)
+        raise RuntimeError(f"Profile export failed: {e}")
+
+def export_memory_profile(
+    memory: Dict[str, Any],
+    pdf_filename: str,
+    pdf_library: str
+) -> Path:
+    """Writes the per-stage tracemalloc summary (timing.Recorder.memory_metadata()) to a .txt file."""
+    base_name = Path(pdf_filename).stem
+    output_path = PDFLINKCHECK_HOME / f"{base_name}_{pdf_library}_profile_memory.txt"
+
+    lines = []
+    for stage, entry in memory.items():
+        lines.append(f"## {stage} (peak {entry['peak_kib']} KiB)")
+        for row in entry["top"]:
+            lines.append(f"{row['size_kib']:>12} KiB {row['count']:>8}  {row['location']}")
+        lines.append("")
+
+    try:
+        output_path.write_text("\n".join(lines), encoding='utf-8')
+        print(f"\nMemory profile exported: {get_friendly_path(output_path)}")
+        return output_path
+    except Exception as e:
+        error_logger.error(f"Memory profile export failed: {e}", exc_info=True)
+        raise RuntimeError(f"Memory profile export failed: {e}")
+
 # --- helpers ---
 def get_friendly_path(full_path: str) -> str:
     p = Path(full_path).resolve()
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# src/pdflinkcheck/linktable.py
+from __future__ import annotations
+from array import array
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+"""
+Compact columnar storage for link records.
+
+A link dict costs several hundred bytes: the dict itself, a four-item rect
+list, and its own copy of every URL and type string. Catalog tools that keep
+hundreds of thousands of links resident pay for that per link. LinkTable
+stores the same records by column instead:
+
+    page        array('l')    source page index
+    type        array('H')    code into a per-table list of type names
+    rect        array('d')    four floats per row, plus a flag byte per row
+                              (missing rect, tuple vs list, int components)
+    other keys  list          one list per key and key layout, strings
+                              interned per table
+
+Each row also remembers its key layout (which keys, in which order), so
+to_dicts() rebuilds dicts identical to what the engine produced. Convert at
+the export boundary (JSON/TXT export, the report dict); keep the table for
+anything long-lived.
+
+Usage:
+    table = LinkTable.from_links(pdflinkcheck.iter_links(path, engine="pymupdf"))
+    table.count_by_type()                 # {"External (URI)": 812, ...}
+    external = table.to_dicts("External (URI)")
+"""
+
+# Known link types. Codes are stable; unknown types are appended per table.
+LINK_TYPES: Tuple[str, ...] = (
+    'External (URI)',
+    'Internal (GoTo/Dest)',
+    'Internal (Resolved Action)',
+    'Remote (GoToR)',
+    'Other Action',
+)
+
+# Column kinds used in a row layout
+_PAGE, _TYPE, _RECT, _OBJ = 0, 1, 2, 3
+
+# Rect flag bits: bits 0-3 mark int components, then "no rect" and "was a tuple"
+_RECT_NONE = 1 << 4
+_RECT_TUPLE = 1 << 5
+_NO_RECT = (0.0, 0.0, 0.0, 0.0)
+
+
+def _rect_flags(value: Any) -> Optional[int]:
+    """Flag byte for a rect the float column can hold, or None to keep it as an object."""
+    if value is None:
+        return _RECT_NONE
+    kind = type(value)
+    if (kind is not list and kind is not tuple) or len(value) != 4:
+        return None
+    flags = _RECT_TUPLE if kind is tuple else 0
+    # Exact types only: subclasses (bool, numpy scalars) would not round-trip
+    for bit, v in enumerate(value):
+        if type(v) is not float:
+            if type(v) is not int:
+                return None
+            flags |= 1 << bit
+    return flags
+
+
+# Column kind of each fixed key; everything else is an object column
+_FIXED_KINDS = {'page': _PAGE, 'type': _TYPE, 'rect': _RECT}
+
+
+def _demote(keys: Tuple[str, ...], kinds: Tuple[int, ...], key: str) -> Tuple[int, ...]:
+    """kinds with key moved to an object column (its value does not fit the array column)."""
+    return tuple(_OBJ if k == key else kind for k, kind in zip(keys, kinds))
+
+
+class LinkTable:
+    """Append-only column store of link records. See module docstring."""
+    __slots__ = (
+        "_count", "_page", "_type", "_rect", "_rect_flags", "_row_layout", "_row_pos",
+        "_layouts", "_layout_ids", "_layout_typed", "_layout_columns", "_layout_getters",
+        "_key_kinds", "_type_names", "_type_codes", "_strings",
+    )
+
+    def __init__(self):
+        self._count = 0
+        self._page = array('l')
+        self._type = array('H')
+        self._rect = array('d')
+        self._rect_flags = array('B')
+        self._row_layout = array('H')
+        # Position of each row inside its layout's object columns
+        self._row_pos = array('L')
+        self._layouts: List[Tuple[Tuple[str, int], ...]] = []
+        self._layout_ids: Dict[Tuple[Tuple[str, ...], Tuple[int, ...]], int] = {}
+        self._layout_typed: List[bool] = []
+        # Per layout: one dense list per object key, and a getter for those keys
+        self._layout_columns: List[List[List[Any]]] = []
+        self._layout_getters: List[Callable[[Dict[str, Any]], Tuple[Any, ...]]] = []
+        self._key_kinds: Dict[Tuple[str, ...], Tuple[int, ...]] = {}
+        self._type_names: List[str] = list(LINK_TYPES)
+        self._type_codes: Dict[str, int] = {name: i for i, name in enumerate(LINK_TYPES)}
+        self._strings: Dict[str, str] = {}
+
+    @classmethod
+    def from_links(cls, links: Iterable[Dict[str, Any]]) -> "LinkTable":
+        """Build a table from link dicts (a list, or a generator such as iter_links())."""
+        table = cls()
+        table.extend(links)
+        return table
+
+    def __len__(self) -> int:
+        return self._count
+
+    def extend(self, links: Iterable[Dict[str, Any]]) -> None:
+        for link in links:
+            self.append(link)
+
+    def append(self, link: Dict[str, Any]) -> None:
+        keys = tuple(link)
+        kinds = self._key_kinds.get(keys)
+        if kinds is None:
+            kinds = self._key_kinds[keys] = tuple(_FIXED_KINDS.get(key, _OBJ) for key in keys)
+
+        page = type_code = 0
+        rect_flags = _RECT_NONE
+        rect = _NO_RECT
+        # page/type/rect only go to their array columns when the values fit
+        if _PAGE in kinds:
+            page = link['page']
+            if type(page) is not int:
+                page, kinds = 0, _demote(keys, kinds, 'page')
+        if _TYPE in kinds:
+            name = link['type']
+            if type(name) is str:
+                type_code = self._type_codes.get(name)
+                if type_code is None:
+                    type_code = self._type_code(name)
+            else:
+                kinds = _demote(keys, kinds, 'type')
+        if _RECT in kinds:
+            value = link['rect']
+            flags = _rect_flags(value)
+            if flags is None:
+                kinds = _demote(keys, kinds, 'rect')
+            else:
+                rect_flags = flags
+                if value is not None:
+                    rect = value
+
+        layout_id = self._layout_ids.get((keys, kinds))
+        if layout_id is None:
+            layout_id = self._add_layout(keys, kinds)
+        columns = self._layout_columns[layout_id]
+        strings = self._strings
+        for column, value in zip(columns, self._layout_getters[layout_id](link)):
+            column.append(strings.setdefault(value, value) if type(value) is str else value)
+
+        self._page.append(page)
+        self._type.append(type_code)
+        self._rect.extend(rect)
+        self._rect_flags.append(rect_flags)
+        self._row_layout.append(layout_id)
+        self._row_pos.append(len(columns[0]) - 1 if columns else 0)
+        self._count += 1
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """Rebuild row index as the original link dict."""
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("LinkTable index out of range")
+        layout_id = self._row_layout[index]
+        columns = iter(self._layout_columns[layout_id])
+        pos = self._row_pos[index]
+        link: Dict[str, Any] = {}
+        for key, kind in self._layouts[layout_id]:
+            if kind == _OBJ:
+                link[key] = next(columns)[pos]
+            elif kind == _PAGE:
+                link[key] = self._page[index]
+            elif kind == _TYPE:
+                link[key] = self._type_names[self._type[index]]
+            else:
+                link[key] = self._load_rect(index)
+        return link
+
+    __getitem__ = row
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for i in range(self._count):
+            yield self.row(i)
+
+    def type_of(self, index: int) -> Optional[str]:
+        """Link type of a row without rebuilding the dict."""
+        if self._layout_typed[self._row_layout[index]]:
+            return self._type_names[self._type[index]]
+        return None
+
+    def count_by_type(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for i in range(self._count):
+            link_type = self.type_of(i)
+            counts[link_type] = counts.get(link_type, 0) + 1
+        return counts
+
+    def rows_by_type(self) -> Dict[Optional[str], List[int]]:
+        """Row indices grouped by link type, in row order (one pass, no dicts built)."""
+        groups: Dict[Optional[str], List[int]] = {}
+        for i in range(self._count):
+            groups.setdefault(self.type_of(i), []).append(i)
+        return groups
+
+    def to_dicts(self, link_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Convert to the engine dict schema, optionally only rows of one link type."""
+        if link_type is None:
+            return list(self)
+        return [self.row(i) for i in range(self._count) if self.type_of(i) == link_type]
+
+    def nbytes(self) -> int:
+        """Approximate bytes held by the columns (excluding the interned strings themselves)."""
+        arrays = (self._page, self._type, self._rect, self._rect_flags, self._row_layout, self._row_pos)
+        total = sum(a.itemsize * len(a) for a in arrays)
+        total += sum(8 * len(column) for columns in self._layout_columns for column in columns)
+        return total
+
+    def __repr__(self) -> str:
+        keys = {key: None for layout in self._layouts for key, kind in layout if kind == _OBJ}
+        return f"LinkTable(rows={self._count}, columns={['page', 'type', 'rect', *keys]})"
+
+    # --- internals ---
+
+    def _type_code(self, name: str) -> int:
+        code = self._type_codes.get(name)
+        if code is None:
+            code = len(self._type_names)
+            self._type_names.append(name)
+            self._type_codes[name] = code
+        return code
+
+    def _add_layout(self, keys: Tuple[str, ...], kinds: Tuple[int, ...]) -> int:
+        layout_id = self._layout_ids[(keys, kinds)] = len(self._layouts)
+        self._layouts.append(tuple(zip(keys, kinds)))
+        self._layout_typed.append(_TYPE in kinds)
+        obj_keys = [key for key, kind in zip(keys, kinds) if kind == _OBJ]
+        self._layout_columns.append([[] for _ in obj_keys])
+        if len(obj_keys) > 1:
+            getter = itemgetter(*obj_keys)
+        elif obj_keys:
+            key = obj_keys[0]
+            getter = lambda link: (link[key],)
+        else:
+            getter = lambda link: ()
+        self._layout_getters.append(getter)
+        return layout_id
+
+    def _load_rect(self, index: int):
+        flags = self._rect_flags[index]
+        if flags & _RECT_NONE:
+            return None
+        values = self._rect[index * 4:index * 4 + 4].tolist()
+        if flags & 0xF:
+            values = [int(v) if flags & (1 << bit) else v for bit, v in enumerate(values)]
+        return tuple(values) if flags & _RECT_TUPLE else values
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# src/pdflinkcheck/manifest.py
+from __future__ import annotations
+import json
+import os
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from pdflinkcheck.io import PDFLINKCHECK_HOME
+
+"""
+Scan manifest for incremental corpus rescans.
+
+For every (PDF path, engine, mode) the manifest records the last-seen mtime,
+size and SHA-256, the pdflinkcheck version that produced the result, and the
+per-file batch summary. A rescan (`pdflinkcheck analyze DIR --incremental`)
+then works in three tiers. The mode (scan_mode()) is the anchor-text mode and
+export format: a summary from a run with other options, or with exports that
+were never written, is not reused.
+
+1. stat() every file. Same mtime, size and version: reuse the stored summary.
+2. Stat changed: hash the file. Same hash: reuse the summary, refresh the stat.
+3. Hash changed or new file: analyze it and store the new summary.
+
+Stored in PDFLINKCHECK_HOME/manifest.sqlite3 (stdlib sqlite3). Only the
+parent process writes to it; batch workers just return results.
+"""
+
+MANIFEST_PATH = PDFLINKCHECK_HOME / "manifest.sqlite3"
+
+# Bumped when the files table changes. An older manifest is dropped: it only
+# saves work, and the next scan re-analyzes every file once.
+SCHEMA_VERSION = 2
+
+# Rows written between commits. Keeps a 40k-file scan from paying one fsync per file.
+COMMIT_EVERY = 200
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path        TEXT NOT NULL,
+    engine      TEXT NOT NULL,
+    mode        TEXT NOT NULL,
+    version     TEXT NOT NULL,
+    mtime_ns    INTEGER NOT NULL,
+    size        INTEGER NOT NULL,
+    sha256      TEXT NOT NULL,
+    summary     TEXT NOT NULL,
+    scanned_at  REAL NOT NULL,
+    PRIMARY KEY (path, engine, mode)
+)
+"""
+
+
+def scan_mode(anchor_text: str = "accurate", export_format: str = "JSON", web_links: bool = True) -> str:
+    """Manifest key part for the run options that change a file's summary."""
+    mode = f"anchor_text={anchor_text};export={export_format.upper() or 'NONE'}"
+    return mode if web_links else f"{mode};web_links=False"
+
+
+@dataclass
+class ManifestEntry:
+    path: str
+    engine: str
+    mode: str
+    version: str
+    mtime_ns: int
+    size: int
+    sha256: str
+    summary: Dict[str, Any]
+    scanned_at: float
+
+    def stat_matches(self, st: os.stat_result, version: str) -> bool:
+        """True if the file looks untouched since this entry was recorded."""
+        return self.version == version and self.mtime_ns == st.st_mtime_ns and self.size == st.st_size
+
+
+class ScanManifest:
+    """
+    Usage:
+        with ScanManifest() as manifest:
+            mode = scan_mode("accurate", "JSON")
+            entry = manifest.lookup(path, "pypdf", mode)
+            ...
+            manifest.record(path, "pypdf", mode, version, st, sha256, summary)
+    """
+    def __init__(self, manifest_path: str | Path = MANIFEST_PATH):
+        self.manifest_path = Path(manifest_path)
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.manifest_path))
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            self._conn.execute("DROP TABLE IF EXISTS files")
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._conn.execute(_SCHEMA)
+        self._uncommitted = 0
+
+    def lookup(self, pdf_path: str, pdf_library: str, mode: str) -> Optional[ManifestEntry]:
+        row = self._conn.execute(
+            "SELECT path, engine, mode, version, mtime_ns, size, sha256, summary, scanned_at "
+            "FROM files WHERE path = ? AND engine = ? AND mode = ?",
+            (str(pdf_path), pdf_library, mode),
+        ).fetchone()
+        if row is None:
+            return None
+        try:
+            summary = json.loads(row[7])
+        except ValueError:
+            return None
+        return ManifestEntry(row[0], row[1], row[2], row[3], row[4], row[5], row[6], summary, row[8])
+
+    def record(self, pdf_path: str, pdf_library: str, mode: str, version: str, st: os.stat_result, sha256: str, summary: Dict[str, Any]) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO files (path, engine, mode, version, mtime_ns, size, sha256, summary, scanned_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (str(pdf_path), pdf_library, mode, version, st.st_mtime_ns, st.st_size, sha256,
+             json.dumps(summary, default=str), time.time()),
+        )
+        self._uncommitted += 1
+        if self._uncommitted >= COMMIT_EVERY:
+            self.commit()
+
+    def forget(self, pdf_path: str, pdf_library: Optional[str] = None) -> None:
+        if pdf_library is None:
+            self._conn.execute("DELETE FROM files WHERE path = ?", (str(pdf_path),))
+        else:
+            self._conn.execute("DELETE FROM files WHERE path = ? AND engine = ?", (str(pdf_path), pdf_library))
+        self._uncommitted += 1
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+
+    def commit(self) -> None:
+        self._conn.commit()
+        self._uncommitted = 0
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self.commit()
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self) -> "ScanManifest":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
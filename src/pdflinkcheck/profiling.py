@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# src/pdflinkcheck/profiling.py
+from __future__ import annotations
+import cProfile
+import tracemalloc
+from typing import Dict, Any, Optional
+
+from pdflinkcheck import timing
+from pdflinkcheck.io import export_profile_stats, export_memory_profile
+
+"""
+Reproducible profiles of one run_report() call (`analyze --profile`).
+
+RunProfile wraps the run in the timing.Recorder that fills
+metadata["timings"] and, on request, in cProfile and tracemalloc:
+
+    with RunProfile(profile=True, profile_memory=True) as run_profile:
+        report_results = ...
+    run_profile.attach(report_results)
+
+attach() writes the artifacts to PDFLINKCHECK_HOME next to the JSON/TXT
+exports and records their paths in metadata["profile"]:
+
+    <name>_<engine>_profile.pstats        cProfile stats (python -m pstats, snakeviz)
+    <name>_<engine>_profile_memory.txt    top allocating lines per stage (tracemalloc)
+
+Both profilers slow the run down (tracemalloc several times over), so the
+timings of a profiled run are only comparable with each other.
+"""
+
+# Source lines kept per stage in the memory profile
+MEMORY_TOP = 10
+
+
+class RunProfile:
+    """timing.Recorder for one run, optionally under cProfile and tracemalloc."""
+
+    def __init__(self, profile: bool = False, profile_memory: bool = False, memory_top: int = MEMORY_TOP):
+        self.profiler: Optional[cProfile.Profile] = cProfile.Profile() if profile else None
+        self.profile_memory = profile_memory
+        self.recorder = timing.Recorder(memory_top=memory_top if profile_memory else 0, profiler=self.profiler)
+        self._started_tracing = False
+
+    def __enter__(self) -> "RunProfile":
+        if self.profile_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        self.recorder.__enter__()
+        if self.profiler is not None:
+            self.profiler.enable()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if self.profiler is not None:
+            self.profiler.disable()
+        self.recorder.__exit__(exc_type, exc, tb)
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def attach(self, report_results: Dict[str, Any]) -> None:
+        """Add timings, counters and (when profiling) the exported artifact paths to report_results["metadata"]."""
+        metadata = report_results.setdefault("metadata", {})
+        self.recorder.attach(metadata)
+        if self.profiler is None and not self.recorder.memory:
+            return
+
+        pdf_name = metadata.get("pdf_name") or "report"
+        pdf_library = metadata.get("library_used") or ""
+        profile_paths = {}
+        if self.profiler is not None:
+            profile_paths["pstats"] = str(export_profile_stats(self.profiler, pdf_name, pdf_library))
+        if self.recorder.memory:
+            profile_paths["memory"] = str(export_memory_profile(metadata["memory"], pdf_name, pdf_library))
+        metadata["profile"] = profile_paths
@@ -3,16 +3,22 @@
 # pdflinkcheck/report.py
 from __future__ import annotations
 import sys
+import time
 from pathlib import Path
 from typing import Optional, Dict, Any
 import pyhabitat
-import copy
 
 from pdflinkcheck.io import error_logger, export_report_json, export_report_txt, get_first_pdf_in_cwd, get_friendly_path, LOG_FILE_PATH
 from pdflinkcheck.environment import pymupdf_is_available, pdfium_is_available
 from pdflinkcheck.validate import run_validation
 from pdflinkcheck.security import compute_risk
-from pdflinkcheck.helpers import debug_head, PageRef
+from pdflinkcheck.session import open_session, resolve_pdf_library
+from pdflinkcheck.source import is_path, source_name
+from pdflinkcheck import cache as result_cache
+from pdflinkcheck import timing
+from pdflinkcheck.profiling import RunProfile
+from pdflinkcheck.helpers import debug_head, PageRef, check_anchor_text_mode, effective_anchor_text_mode
+from pdflinkcheck.linktable import LinkTable
 
 
 SEP_COUNT=28
@@ -35,26 +41,44 @@ EMPTY_VALIDATION = {
     }
 
 
-def run_report_and_call_exports(pdf_path: str = None, export_format: str = "JSON", pdf_library: str = "pypdf", print_bool:bool=True) -> Dict[str, Any]:
-    # The meat and potatoes
-    report_results = run_report(
-        pdf_path=str(pdf_path), 
-        pdf_library = pdf_library,
-        print_bool=print_bool,
-    )
-    # 2. Initialize file path tracking
-    output_path_json = None
-    output_path_txt = None
+def run_report_and_call_exports(pdf_path: str = None, export_format: str = "JSON", pdf_library: str = "pypdf", print_bool:bool=True, jobs: int = 1, use_cache: bool = False, anchor_text: str = "accurate", pdf_name: Optional[str] = None, profile: bool = False, profile_memory: bool = False, output_dir: Optional[Path] = None, announce_exports: bool = True, content_hash: Optional[str] = None, web_links: bool = True, low_memory: bool = False) -> Dict[str, Any]:
+    # output_dir: where the JSON/TXT reports go (default PDFLINKCHECK_HOME).
+    # announce_exports=False skips the per-file "exported" lines (batch mode).
+    # In-memory sources (bytes, file objects, mmap) are passed through untouched
+    in_memory = pdf_path is not None and not is_path(pdf_path)
+    # One recorder (and profile) spans the report and the export, see pdflinkcheck.profiling
+    with RunProfile(profile=profile, profile_memory=profile_memory) as run_profile:
+        # The meat and potatoes
+        report_results = run_report(
+            pdf_path=pdf_path if in_memory else str(pdf_path), 
+            pdf_name=pdf_name,
+            pdf_library = pdf_library,
+            print_bool=print_bool,
+            jobs=jobs,
+            # A profiled cache hit would only profile the cache lookup
+            use_cache=use_cache and not (profile or profile_memory),
+            anchor_text=anchor_text,
+            content_hash=content_hash,
+            web_links=web_links,
+            low_memory=low_memory,
+        )
+        # 2. Initialize file path tracking
+        output_path_json = None
+        output_path_txt = None
     
-    if export_format:
-        report_data_dict = report_results["data"]
-        report_buffer_str = report_results["text"]
+        if in_memory:
+            pdf_path = pdf_name or source_name(pdf_path)
+        if export_format:
+            report_data_dict = report_results["data"]
+            report_buffer_str = report_results["text"]
         
-        if "JSON" in export_format.upper():
-            output_path_json = export_report_json(report_data_dict, pdf_path, pdf_library)
+            with timing.stage("export"):
+                if "JSON" in export_format.upper():
+                    output_path_json = export_report_json(report_data_dict, pdf_path, pdf_library, output_dir, announce_exports)
         
-        if "TXT" in export_format.upper():
-            output_path_txt = export_report_txt(report_buffer_str, pdf_path, pdf_library)
+                if "TXT" in export_format.upper():
+                    output_path_txt = export_report_txt(report_buffer_str, pdf_path, pdf_library, output_dir, announce_exports)
+    run_profile.attach(report_results)
 
     # 4. Inject the file info into the results dictionary
     report_results["files"] = {
@@ -64,7 +88,7 @@ def run_report_and_call_exports(pdf_path: str = None, export_format: str = "JSON
     return report_results
     
 
-def run_report(pdf_path: str = None, pdf_library: str = "pypdf", print_bool:bool=True) -> Dict[str, Any]:
+def run_report(pdf_path: str = None, pdf_library: str = "pypdf", print_bool:bool=True, jobs: int = 1, use_cache: bool = False, anchor_text: str = "accurate", pdf_name: Optional[str] = None, profile: bool = False, profile_memory: bool = False, content_hash: Optional[str] = None, web_links: bool = True, low_memory: bool = False) -> Dict[str, Any]:
     """
     Core high-level PDF link analysis logic. 
     
@@ -73,17 +97,67 @@ def run_report(pdf_path: str = None, pdf_library: str = "pypdf", print_bool:bool
     prints a comprehensive, user-friendly report to the console.
 
     Args:   
-        pdf_path: The file system path (str) to the target PDF document.
+        pdf_path: The file system path (str) to the target PDF document, or the
+                  document itself: bytes, BytesIO, an open binary file or an
+                  mmap (see pdflinkcheck.source). In-memory documents are
+                  never written to disk; with use_cache=True their extracted
+                  links are.
+        pdf_name: Display name for an in-memory document (report text,
+                  metadata, relative GoToR checks). Defaults to the file
+                  object's name, or "memory.pdf".
+        jobs: Worker processes for page-sharded link extraction of very large
+              documents (pymupdf, pdfium). 1 stays in-process; 0 uses all cores.
+        use_cache: Reuse extraction results cached under PDFLINKCHECK_HOME/cache
+                   for an unchanged file, and store new ones (see
+                   pdflinkcheck.cache). Off by default for library callers;
+                   the CLI and the GUI turn it on.
+        anchor_text: "accurate" (default) runs the engine's full text pass,
+                     "fast" only the text around the links (PyMuPDF; the
+                     other engines run "accurate"), and "none" skips text extraction
+                     (link_text becomes "N/A: Anchor Text Skipped"). Validation
+                     does not use anchor text, so "none" is the choice for CI.
+        profile: Run under cProfile and write <name>_<engine>_profile.pstats
+                 to PDFLINKCHECK_HOME (see pdflinkcheck.profiling). Profiled
+                 runs skip the cache.
+        profile_memory: Trace allocations with tracemalloc and write the top
+                        allocating lines per stage to <name>_<engine>_profile_memory.txt.
+        content_hash: SHA-256 of pdf_path if the caller already computed it
+                      (incremental rescans), so the cache lookup does not
+                      read the file a second time.
+        web_links: pdfium only. True (default) detects URLs in the page text;
+                   False reports URI link annotations instead, which skips
+                   the text pass on pages without links (and on every page
+                   with anchor_text="none").
+        low_memory: Keep resident memory flat on multi-thousand-page
+                    documents (pypdf, pymupdf; see DocumentSession.extract_links()).
+                    Same results, somewhat slower; cached like a normal run.
 
     Returns:
         A dictionary containing the structured results of the analysis:
         'external_links', 'internal_links', and 'toc'.
+        metadata["timings"] holds wall and CPU seconds per stage and
+        metadata["counters"] the pages, annotations, text extractions and
+        objects the engine processed (see pdflinkcheck.timing), and
+        metadata["profile"] the paths of profile artifacts, if any.
 
     To Do:
         Aggregate print strings into a str for TXT export.
         Modularize.
     """
+    if timing.active() is not None:
+        # The caller's recorder (e.g. run_report_and_call_exports()) attaches timings and profiles
+        return _run_report(pdf_path, pdf_library, print_bool, jobs, use_cache, anchor_text, pdf_name, content_hash, web_links, low_memory)
+    # A profiled cache hit would only profile the cache lookup
+    use_cache = use_cache and not (profile or profile_memory)
+    with RunProfile(profile=profile, profile_memory=profile_memory) as run_profile:
+        report_results = _run_report(pdf_path, pdf_library, print_bool, jobs, use_cache, anchor_text, pdf_name, content_hash, web_links, low_memory)
+    run_profile.attach(report_results)
+    return report_results
+
 
+def _run_report(pdf_path: str = None, pdf_library: str = "pypdf", print_bool:bool=True, jobs: int = 1, use_cache: bool = False, anchor_text: str = "accurate", pdf_name: Optional[str] = None, content_hash: Optional[str] = None, web_links: bool = True, low_memory: bool = False) -> Dict[str, Any]:
+    """run_report() inside the caller's timing.Recorder."""
+    run_start = time.perf_counter()
     report_buffer = []
     report_buffer_overview = []
 
@@ -96,20 +170,23 @@ def run_report(pdf_path: str = None, pdf_library: str = "pypdf", print_bool:bool
         
 
     # Expected: "pypdf" or "PyMuPDF" pr "rust"
-    allowed_libraries = ("pypdf", "pymupdf", "pdfium", "auto")
+    allowed_libraries = ("pypdf", "pymupdf", "pdfium", "xref", "auto")
     pdf_library = pdf_library.lower()
 
     # AUTO MODE
+    #from pdflinkcheck.ffi import rust_available # defunct
+    #if rust_available():
+    #    pdf_library = "rust"
+    check_anchor_text_mode(anchor_text)
+    # "auto" consults the engine profile when there is one (see pdflinkcheck.engine_profile)
+    auto_choice = None
     if pdf_library == "auto":
-        #from pdflinkcheck.ffi import rust_available # defunct
-        #if rust_available():
-        #    pdf_library = "rust"
-        if pdfium_is_available():
-            pdf_library = "pdfium"
-        elif pymupdf_is_available():
-            pdf_library = "pymupdf"
-        else:
-            pdf_library = "pypdf"
+        from pdflinkcheck import engine_profile
+        with timing.stage("engine_select"):
+            auto_choice = engine_profile.select_engine(pdf_path, anchor_text=anchor_text)
+    pdf_library = auto_choice.engine if auto_choice is not None else resolve_pdf_library(pdf_library)
+    requested_anchor_text = anchor_text
+    anchor_text = effective_anchor_text_mode(anchor_text, pdf_library)
 
     """
     # RUST ENGINE
@@ -131,35 +208,61 @@ def run_report(pdf_path: str = None, pdf_library: str = "pypdf", print_bool:bool
         extracted_links = rust_data.get("links", [])
         structural_toc = rust_data.get("toc", [])
     """
-    # PDFium ENGINE
-    if pdf_library in allowed_libraries and pdf_library == "pdfium":
-        from pdflinkcheck.analysis_pdfium import analyze_pdf as analyze_pdf_pdfium
-        data = analyze_pdf_pdfium(pdf_path) or {"links": [], "toc": []}
-        extracted_links = data.get("links", [])
-        structural_toc = data.get("toc", [])
-        
-    # pypdf ENGINE
-    elif pdf_library in allowed_libraries and pdf_library == "pypdf":
-        from pdflinkcheck.analysis_pypdf import (extract_links_pypdf as extract_links, extract_toc_pypdf as extract_toc)
-        extracted_links = extract_links(pdf_path)
-        structural_toc = extract_toc(pdf_path) 
-
     # PyMuPDF Engine
-    elif pdf_library in allowed_libraries and pdf_library == "pymupdf":
-        if not pymupdf_is_available():
-            print("PyMuPDF was explicitly requested as the PDF Engine")
-            print("Switch the PDF library to 'pypdf' instead, or install PyMuPDF. ")
-            print("To install PyMuPDF locally, try: `uv sync --extra full` OR `pip install .[full]`")
-            if pyhabitat.on_termux():
-                print(f"pyhabitat.on_termux() = {pyhabitat.on_termux()}")
-                print("PyMuPDF is not expected to work on Termux. Use pypdf.")
-            print("\n")
-            #return    
-            raise ImportError("The 'fitz' module (PyMuPDF) is required but not installed.")
-        from pdflinkcheck.analysis_pymupdf import (extract_links_pymupdf as extract_links, extract_toc_pymupdf as extract_toc)
-        extracted_links = extract_links(pdf_path)
-        structural_toc = extract_toc(pdf_path) 
+    if pdf_library == "pymupdf" and not pymupdf_is_available():
+        print("PyMuPDF was explicitly requested as the PDF Engine")
+        print("Switch the PDF library to 'pypdf' instead, or install PyMuPDF. ")
+        print("To install PyMuPDF locally, try: `uv sync --extra full` OR `pip install .[full]`")
+        if pyhabitat.on_termux():
+            print(f"pyhabitat.on_termux() = {pyhabitat.on_termux()}")
+            print("PyMuPDF is not expected to work on Termux. Use pypdf.")
+        print("\n")
+        #return    
+        raise ImportError("The 'fitz' module (PyMuPDF) is required but not installed.")
+
+    # Cached extraction (links, TOC, page count), keyed by content hash, engine and version.
+    # Validation and the text report below are always rebuilt for the current path.
+    # Each anchor-text mode caches separately; "accurate" keeps the original key.
+    variant_parts = [] if anchor_text == "accurate" else [f"anchor_text={anchor_text}"]
+    if pdf_library == "pdfium" and not web_links:
+        variant_parts.append("web_links=False")
+    cache_variant = ";".join(variant_parts)
+    with timing.stage("cache"):
+        cache_key = result_cache.key_for_file(pdf_path, pdf_library, cache_variant, content_hash) if use_cache and pdf_path is not None else None
+        cached = result_cache.get(cache_key) if cache_key else None
+
+    # Links are held in a columnar LinkTable; dicts are rebuilt only for the
+    # report sections that are exported (see pdflinkcheck.linktable)
+    if cached is not None:
+        extracted_links = LinkTable.from_links(cached["links"])
+        structural_toc = cached["toc"]
+        total_pages = cached["total_pages"]
+    else:
+        # pypdf, PyMuPDF and PDFium ENGINES
+        # One open document serves links, TOC and the page count used by validation.
+        with timing.stage("open"):
+            session = open_session(pdf_path, pdf_library)
+        with session:
+            # Anchor text is timed separately, inside the engine's page loop
+            with timing.stage("page_iteration"):
+                extracted_links = session.extract_link_table(jobs=jobs, anchor_text=anchor_text, web_links=web_links, low_memory=low_memory)
+            with timing.stage("toc"):
+                structural_toc = session.extract_toc()
+            total_pages = session.page_count
+        if cache_key:
+            with timing.stage("cache"):
+                result_cache.put(cache_key, {
+                    # JSON entries hold dicts, so a cache miss builds them once here
+                    "links": extracted_links.to_dicts(),
+                    "toc": structural_toc,
+                    "total_pages": total_pages,
+                })
     
+    # From here on pdf_path is only used for display and relative file checks
+    in_memory = pdf_path is not None and not is_path(pdf_path)
+    if in_memory:
+        pdf_path = pdf_name or source_name(pdf_path)
+
     log("\n--- Starting Analysis ... ---\n")
     if pdf_path is None:
         log("pdf_path is None")
@@ -189,133 +292,145 @@ def run_report(pdf_path: str = None, pdf_library: str = "pypdf", print_bool:bool
         return empty_report
         
     try:
-        log(f"Target file: {get_friendly_path(pdf_path)}")
+        log(f"Target file: {pdf_path} (in memory)" if in_memory else f"Target file: {get_friendly_path(pdf_path)}")
         log(f"PDF Engine: {pdf_library}")
-
-        toc_entry_count = len(structural_toc)
-        str_structural_toc = get_structural_toc(structural_toc)
+        if requested_anchor_text != anchor_text:
+            log(f"Anchor text: {anchor_text} ({pdf_library} has no {requested_anchor_text} mode)")
+        elif anchor_text != "accurate":
+            log(f"Anchor text: {anchor_text}")
+        if pdf_library == "pdfium" and not web_links:
+            log("Web links: URI link annotations (no URL detection in the page text)")
+
+        with timing.stage("render"):
+            toc_entry_count = len(structural_toc)
+            str_structural_toc = get_structural_toc(structural_toc)
         
-        # check the structure, that it matches
-        if False:
-            print(f"pdf_library={pdf_library}")
-            debug_head("TOC", structural_toc, n=3)
-            debug_head("Links", list(extracted_links), n=3)
+            # check the structure, that it matches
+            if False:
+                print(f"pdf_library={pdf_library}")
+                debug_head("TOC", structural_toc, n=3)
+                debug_head("Links", extracted_links.to_dicts()[:3], n=3)
         
-        # THIS HITS
-
-        if not extracted_links and not structural_toc:
-            log(f"\nNo hyperlinks or structural TOC found in {Path(pdf_path).name}.")
-            log("(This is common for scanned/image-only PDFs.)")
-
-            empty_result = {
-                "data": {
-                    "external_links": [],
-                    "internal_links": [],
-                    "toc": []
-                },
-                "text": "\n".join(report_buffer),
-                "metadata": {
-                    "pdf_name": Path(pdf_path).name,
-                    "library_used": pdf_library,
-                    "link_counts": {
-                        "toc_entry_count": 0,
-                        "interal_goto_links_count": 0,
-                        "interal_resolve_action_links_count": 0,
-                        "total_internal_links_count": 0,
-                        "external_uri_links_count": 0,
-                        "other_links_count": 0,
-                        "total_links_count": 0
+            # THIS HITS
+
+            if not extracted_links and not structural_toc:
+                log(f"\nNo hyperlinks or structural TOC found in {Path(pdf_path).name}.")
+                log("(This is common for scanned/image-only PDFs.)")
+
+                empty_result = {
+                    "data": {
+                        "external_links": [],
+                        "internal_links": [],
+                        "toc": []
+                    },
+                    "text": "\n".join(report_buffer),
+                    "metadata": {
+                        "pdf_name": Path(pdf_path).name,
+                        "library_used": pdf_library,
+                        "link_counts": {
+                            "toc_entry_count": 0,
+                            "interal_goto_links_count": 0,
+                            "interal_resolve_action_links_count": 0,
+                            "total_internal_links_count": 0,
+                            "external_uri_links_count": 0,
+                            "other_links_count": 0,
+                            "total_links_count": 0
+                        }
                     }
                 }
-            }
-            return empty_result
+                return empty_result
             
-        # 3. Separate the lists based on the 'type' key
-        external_uri_links = [link for link in extracted_links if link['type'] == 'External (URI)']
-        goto_links = [link for link in extracted_links if link['type'] == 'Internal (GoTo/Dest)']
-        resolved_action_links = [link for link in extracted_links if link['type'] == 'Internal (Resolved Action)']
-        other_links = [link for link in extracted_links if link['type'] not in ['External (URI)', 'Internal (GoTo/Dest)', 'Internal (Resolved Action)']]
-
-        interal_resolve_action_links_count = len(resolved_action_links)
-        interal_goto_links_count = len(goto_links) 
-        total_internal_links_count = interal_goto_links_count + interal_resolve_action_links_count
-
-        external_uri_links_count = len(external_uri_links)
-        other_links_count = len(other_links)
-
-        total_links_count = len(extracted_links)
-
-        # --- ANALYSIS SUMMARY (Using your print logic) ---
-        log("\n" + "=" * SEP_COUNT, overview = True)
-        log(f"--- Link Analysis Results for {Path(pdf_path).name} ---", overview = True)
-        log(f"Total active links: {total_links_count} (External: {external_uri_links_count}, Internal Jumps: {total_internal_links_count}, Other: {other_links_count})",overview = True)
-        log(f"Total **structural TOC entries (bookmarks)** found: {toc_entry_count}",overview = True)
-        log("=" * SEP_COUNT,overview = True)
-
-        # --- Section 1: TOC ---
-        log(str_structural_toc)
-
-        # --- Section 2: ACTIVE INTERNAL JUMPS ---
-        log("\n" + "=" * SEP_COUNT)
-        log(f"## Active Internal Jumps (GoTo & Resolved Actions) - {total_internal_links_count} found")
-        log("=" * SEP_COUNT)
-        log("{:<5} | {:<5} | {:<40} | {}".format("Idx", "Page", "Anchor Text", "Jumps To Page"))
-        log("-" * SEP_COUNT)
+            # 3. Separate the rows based on the link type (one pass over the type column).
+            # External and internal links are exported, so only they become dicts;
+            # other links are printed straight from the table.
+            rows_by_type = extracted_links.rows_by_type()
+            external_uri_links = [extracted_links.row(i) for i in rows_by_type.pop('External (URI)', [])]
+            goto_links = [extracted_links.row(i) for i in rows_by_type.pop('Internal (GoTo/Dest)', [])]
+            resolved_action_links = [extracted_links.row(i) for i in rows_by_type.pop('Internal (Resolved Action)', [])]
+            other_rows = sorted(i for rows in rows_by_type.values() for i in rows)
+
+            interal_resolve_action_links_count = len(resolved_action_links)
+            interal_goto_links_count = len(goto_links) 
+            total_internal_links_count = interal_goto_links_count + interal_resolve_action_links_count
+
+            external_uri_links_count = len(external_uri_links)
+            other_links_count = len(other_rows)
+
+            total_links_count = len(extracted_links)
+
+            # --- ANALYSIS SUMMARY (Using your print logic) ---
+            log("\n" + "=" * SEP_COUNT, overview = True)
+            log(f"--- Link Analysis Results for {Path(pdf_path).name} ---", overview = True)
+            log(f"Total active links: {total_links_count} (External: {external_uri_links_count}, Internal Jumps: {total_internal_links_count}, Other: {other_links_count})",overview = True)
+            log(f"Total **structural TOC entries (bookmarks)** found: {toc_entry_count}",overview = True)
+            log("=" * SEP_COUNT,overview = True)
+
+            # --- Section 1: TOC ---
+            log(str_structural_toc)
+
+            # --- Section 2: ACTIVE INTERNAL JUMPS ---
+            log("\n" + "=" * SEP_COUNT)
+            log(f"## Active Internal Jumps (GoTo & Resolved Actions) - {total_internal_links_count} found")
+            log("=" * SEP_COUNT)
+            log("{:<5} | {:<5} | {:<40} | {}".format("Idx", "Page", "Anchor Text", "Jumps To Page"))
+            log("-" * SEP_COUNT)
         
-        all_internal = goto_links + resolved_action_links
-        #If links were found: all_internal is a list with dictionaries. It evaluates to True.
-        # If NO links were found: all_internal is an empty list []. It evaluates to False.
-        if all_internal:
-            for i, link in enumerate(all_internal, 1):
-                link_text = link.get('link_text', 'N/A')
-
-                # Convert source and destination indices to human strings
-                src_page = PageRef.from_index(link['page']).human
-                dest_page = PageRef.from_index(link['destination_page']).human
-
-                log("{:<5} | {:<5} | {:<40} | {}".format(
-                    i, 
-                    src_page, 
-                    link_text[:40], 
-                    dest_page
-                ))
-
-
-        else:
-            log(" No internal GoTo or Resolved Action links found.")
-        log("-" * SEP_COUNT)
+            all_internal = goto_links + resolved_action_links
+            #If links were found: all_internal is a list with dictionaries. It evaluates to True.
+            # If NO links were found: all_internal is an empty list []. It evaluates to False.
+            if all_internal:
+                for i, link in enumerate(all_internal, 1):
+                    link_text = link.get('link_text', 'N/A')
+
+                    # Convert source and destination indices to human strings
+                    src_page = PageRef.from_index(link['page']).human
+                    dest_page = PageRef.from_index(link['destination_page']).human
+
+                    log("{:<5} | {:<5} | {:<40} | {}".format(
+                        i, 
+                        src_page, 
+                        link_text[:40], 
+                        dest_page
+                    ))
+
+
+            else:
+                log(" No internal GoTo or Resolved Action links found.")
+            log("-" * SEP_COUNT)
         
-        # --- Section 3: ACTIVE URI LINKS ---
-        log("\n" + "=" * SEP_COUNT)
-        log(f"## Active URI Links (External) - {len(external_uri_links)} found") 
-        log("{:<5} | {:<5} | {:<40} | {}".format("Idx", "Page", "Anchor Text", "Target URI/Action"))
-        log("=" * SEP_COUNT)
+            # --- Section 3: ACTIVE URI LINKS ---
+            log("\n" + "=" * SEP_COUNT)
+            log(f"## Active URI Links (External) - {len(external_uri_links)} found") 
+            log("{:<5} | {:<5} | {:<40} | {}".format("Idx", "Page", "Anchor Text", "Target URI/Action"))
+            log("=" * SEP_COUNT)
         
-        if external_uri_links:
-            for i, link in enumerate(external_uri_links, 1):
-                target = link.get('url') or link.get('remote_file') or link.get('target')
-                link_text = link.get('link_text', 'N/A')
-                log("{:<5} | {:<5} | {:<40} | {}".format(i, link['page'], link_text[:40], target))
-
-        else: 
-            log(" No external links found.")
-        log("-" * SEP_COUNT)
-
-        # --- Section 4: OTHER LINKS ---
-        log("\n" + "=" * SEP_COUNT)
-        log(f"## Other Links  - {len(other_links)} found") 
-        log("{:<5} | {:<5} | {:<40} | {}".format("Idx", "Page", "Anchor Text", "Target Action"))
-        log("=" * SEP_COUNT)
+            if external_uri_links:
+                for i, link in enumerate(external_uri_links, 1):
+                    target = link.get('url') or link.get('remote_file') or link.get('target')
+                    link_text = link.get('link_text', 'N/A')
+                    log("{:<5} | {:<5} | {:<40} | {}".format(i, link['page'], link_text[:40], target))
+
+            else: 
+                log(" No external links found.")
+            log("-" * SEP_COUNT)
+
+            # --- Section 4: OTHER LINKS ---
+            log("\n" + "=" * SEP_COUNT)
+            log(f"## Other Links  - {other_links_count} found") 
+            log("{:<5} | {:<5} | {:<40} | {}".format("Idx", "Page", "Anchor Text", "Target Action"))
+            log("=" * SEP_COUNT)
         
-        if other_links:
-            for i, link in enumerate(other_links, 1):
-                target = link.get('url') or link.get('remote_file') or link.get('target')
-                link_text = link.get('link_text', 'N/A')
-                log("{:<5} | {:<5} | {:<40} | {}".format(i, link['page'], link_text[:40], target))
-
-        else: 
-            log(" No 'Other' links found.")
-        log("-" * SEP_COUNT)
+            if other_rows:
+                for i, link in enumerate(map(extracted_links.row, other_rows), 1):
+                    target = link.get('url') or link.get('remote_file') or link.get('target')
+                    link_text = link.get('link_text', 'N/A')
+                    log("{:<5} | {:<5} | {:<40} | {}".format(i, link['page'], link_text[:40], target))
+
+            else: 
+                log(" No 'Other' links found.")
+            log("-" * SEP_COUNT)
+            # The sections hold every link that is exported; the table is not needed past here
+            del extracted_links, rows_by_type, other_rows
         
         # Return the collected data for potential future JSON/other output
         report_data_dict =  {
@@ -325,7 +440,9 @@ def run_report(pdf_path: str = None, pdf_library: str = "pypdf", print_bool:bool
             "validation": EMPTY_VALIDATION.copy()
         }
 
-        intermediate_report_results = {
+        # Built once: validation and risk results are attached to this same dict below,
+        # and every section shares the engine's link records rather than copies.
+        report_results = {
             "data": report_data_dict, # The structured JSON-ready dict
             "text": "",
             "metadata": {                  # Helpful for the GUI/Logs
@@ -345,26 +462,33 @@ def run_report(pdf_path: str = None, pdf_library: str = "pypdf", print_bool:bool
 
         log("\n--- Analysis Complete ---")
 
-        validation_results = run_validation(report_results=intermediate_report_results,
-                                            pdf_path=pdf_path,
-                                            pdf_library=pdf_library)
+        with timing.stage("validation"):
+            validation_results = run_validation(report_results=report_results,
+                                                pdf_path=pdf_path,
+                                                pdf_library=pdf_library,
+                                                total_pages=total_pages)
         log(validation_results.get("summary-txt",""), overview = True)
 
-        # CRITICAL: Re-assign to report_results so it's available for the final return
-        report_results = copy.deepcopy(intermediate_report_results)
-
         # --- Offline Risk Analysis (Security Layer) ---
-        risk_results = compute_risk(report_results)
+        with timing.stage("risk"):
+            risk_results = compute_risk(report_results)
         report_results["data"]["risk"] = risk_results
         
         # Final aggregation of the buffer into one string, after the last call to log()
-        report_buffer_str = "\n".join(report_buffer)
-        report_buffer_overview_str = "\n".join(report_buffer_overview)
+        with timing.stage("render"):
+            report_buffer_str = "\n".join(report_buffer)
+            report_buffer_overview_str = "\n".join(report_buffer_overview)
 
         report_results["data"]["validation"].update(validation_results)
         #report_results["text"].update(report_buffer_str)      # The human-readable string
         report_results["text"] = report_buffer_str
 
+        if auto_choice is not None:
+            report_results["metadata"]["engine_profile"] = {"bucket": auto_choice.bucket, "from_profile": auto_choice.from_profile}
+            if cached is None:
+                # A cache hit says nothing about the engine's speed
+                engine_profile.learn_from_run(auto_choice, time.perf_counter() - run_start)
+
         # 5. Export Report 
         #if export_format:
         #    # Assuming export_to will hold the output format string (e.g., "JSON")
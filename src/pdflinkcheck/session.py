@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# src/pdflinkcheck/session.py
+from __future__ import annotations
+import sys
+from typing import TYPE_CHECKING, Dict, Any, Iterator, List, Optional
+
+from pdflinkcheck.environment import pymupdf_is_available, pdfium_is_available
+from pdflinkcheck import timing
+from pdflinkcheck.source import is_path, release_buffers
+
+if TYPE_CHECKING:
+    from pdflinkcheck.linktable import LinkTable
+
+"""
+One open document per run.
+
+run_report() used to open the PDF once for links, again for the TOC, and a
+third time in run_validation() just to count pages. On network shares the
+repeated parse of a large file dominates wall time. A DocumentSession opens
+the file once with the chosen engine and serves link extraction, TOC
+extraction and the page count from that single handle.
+
+Usage:
+    with open_session(pdf_path, "pypdf") as session:
+        links = session.extract_links()
+        toc = session.extract_toc()
+        total_pages = session.page_count
+
+pdf_path may also be the document itself: bytes, BytesIO, an open binary
+file or an mmap (see pdflinkcheck.source). Nothing is written to disk.
+
+For streaming, iter_links(pdf_path, engine) yields link records page by page
+without building the full list, so memory stays flat on documents with
+hundreds of thousands of annotations.
+
+Engine modules are imported lazily, so importing this module does not pull in
+pypdf, fitz or pypdfium2.
+"""
+
+
+class DocumentSession:
+    """
+    Base class. Subclasses open the document in _open() and delegate to the
+    *_from_reader / *_from_doc functions of their analysis module.
+    """
+    engine: str = ""
+
+    def __init__(self, pdf_path: str):
+        self.pdf_path = pdf_path
+        self.doc = self._open(pdf_path)
+        self._page_count: Optional[int] = None
+
+    def _open(self, pdf_path: str):
+        raise NotImplementedError
+
+    @property
+    def shard_path(self) -> Optional[str]:
+        """Path page-shard workers can reopen, or None for an in-memory document."""
+        return str(self.pdf_path) if is_path(self.pdf_path) else None
+
+    def _count_pages(self) -> int:
+        raise NotImplementedError
+
+    def extract_links(self, jobs: int = 1, anchor_text: str = "accurate", web_links: bool = True, low_memory: bool = False) -> List[Dict[str, Any]]:
+        """
+        jobs > 1 (or 0 for all cores) enables page-sharded extraction for very large
+        documents on engines that support it (pymupdf, pdfium). See pdflinkcheck.sharding.
+        anchor_text: "accurate" (default), "fast", or "none" to skip text extraction
+        (see pdflinkcheck.helpers.ANCHOR_TEXT_MODES).
+        web_links: pdfium only. True (default) detects URLs in the page text; False
+        reports URI link annotations instead and skips the text pass on pages
+        without links (see analysis_pdfium.iter_links_from_doc()).
+        low_memory: Keep resident memory flat on multi-thousand-page documents:
+        pypdf drops each page's parsed objects once its links are emitted,
+        PyMuPDF reopens the document every LOW_MEMORY_REOPEN_EVERY pages.
+        pdfium and xref already stay flat and ignore it.
+        """
+        raise NotImplementedError
+
+    def iter_links(self, anchor_text: str = "accurate", web_links: bool = True, low_memory: bool = False) -> Iterator[Dict[str, Any]]:
+        """Yield link records page by page, in the same order as extract_links()."""
+        raise NotImplementedError
+
+    def extract_link_table(self, jobs: int = 1, anchor_text: str = "accurate", web_links: bool = True, low_memory: bool = False) -> "LinkTable":
+        """
+        The links as a compact columnar LinkTable (see pdflinkcheck.linktable).
+        Same options as extract_links(). Single-process runs stream straight
+        from iter_links(), so the full list of link dicts never exists.
+        """
+        from pdflinkcheck.linktable import LinkTable
+        if jobs == 1:
+            return LinkTable.from_links(self.iter_links(anchor_text=anchor_text, web_links=web_links, low_memory=low_memory))
+        return LinkTable.from_links(self.extract_links(jobs=jobs, anchor_text=anchor_text, web_links=web_links, low_memory=low_memory))
+
+    def extract_toc(self) -> List[Dict[str, Any]]:
+        raise NotImplementedError
+
+    @property
+    def page_count(self) -> Optional[int]:
+        """Total pages, or None if the engine could not determine it. Cached."""
+        if self._page_count is None:
+            try:
+                self._page_count = self._count_pages()
+            except Exception as e:
+                print(f"Could not determine page count: {e}")
+                return None
+        return self._page_count
+
+    def close(self) -> None:
+        if self.doc is not None:
+            doc = self.doc
+            try:
+                doc.close()
+            finally:
+                self.doc = None
+                release_buffers(doc)
+
+    def __enter__(self) -> "DocumentSession":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        if not is_path(self.pdf_path):
+            return f"{type(self).__name__}(<{type(self.pdf_path).__name__}>)"
+        return f"{type(self).__name__}(pdf_path={self.pdf_path!r})"
+
+
+class PypdfSession(DocumentSession):
+    engine = "pypdf"
+
+    def _open(self, pdf_path: str):
+        from pdflinkcheck.analysis_pypdf import open_reader
+        return open_reader(pdf_path)
+
+    def _count_pages(self) -> int:
+        return len(self.doc.pages)
+
+    def extract_links(self, jobs: int = 1, anchor_text: str = "accurate", web_links: bool = True, low_memory: bool = False) -> List[Dict[str, Any]]:
+        # pypdf extraction is single-process; jobs and web_links are accepted for a uniform interface.
+        from pdflinkcheck.analysis_pypdf import extract_links_from_reader
+        return extract_links_from_reader(self.doc, anchor_text=anchor_text, low_memory=low_memory)
+
+    def iter_links(self, anchor_text: str = "accurate", web_links: bool = True, low_memory: bool = False) -> Iterator[Dict[str, Any]]:
+        from pdflinkcheck.analysis_pypdf import iter_links_from_reader
+        return iter_links_from_reader(self.doc, anchor_text=anchor_text, low_memory=low_memory)
+
+    def extract_toc(self) -> List[Dict[str, Any]]:
+        from pdflinkcheck.analysis_pypdf import extract_toc_from_reader
+        return extract_toc_from_reader(self.doc)
+
+    def close(self) -> None:
+        if self.doc is not None:
+            # Objects the reader parsed and still caches (see pdflinkcheck.timing)
+            timing.count("objects_resolved", len(self.doc.resolved_objects))
+        super().close()
+
+
+class XrefSession(DocumentSession):
+    """
+    Triage engine: links straight from the cross-reference table, no anchor
+    text (see pdflinkcheck.analysis_xref). TOC comes from the pypdf outline.
+    """
+    engine = "xref"
+
+    def _open(self, pdf_path: str):
+        from pdflinkcheck.analysis_xref import open_xref_document
+        return open_xref_document(pdf_path)
+
+    def _count_pages(self) -> int:
+        return self.doc.page_count
+
+    def extract_links(self, jobs: int = 1, anchor_text: str = "accurate", web_links: bool = True, low_memory: bool = False) -> List[Dict[str, Any]]:
+        # The xref scan never extracts text; anchor_text, web_links and low_memory are accepted for a uniform interface.
+        from pdflinkcheck.analysis_xref import RawPdf, PypdfObjectScan, RAW_SCAN_ERRORS
+        try:
+            return list(self.iter_links())
+        except RAW_SCAN_ERRORS:
+            if not isinstance(self.doc, RawPdf):
+                raise
+            # Damage the raw scanner could not get past: redo it through pypdf
+            self.doc.close()
+            self.doc = PypdfObjectScan(self.pdf_path)
+            self._page_count = None
+            return list(self.iter_links())
+
+    def iter_links(self, anchor_text: str = "accurate", web_links: bool = True, low_memory: bool = False) -> Iterator[Dict[str, Any]]:
+        from pdflinkcheck.analysis_xref import iter_links_from_document
+        return iter_links_from_document(self.doc)
+
+    def extract_link_table(self, jobs: int = 1, anchor_text: str = "accurate", web_links: bool = True, low_memory: bool = False) -> "LinkTable":
+        # Through extract_links(): a damaged file is rescanned through pypdf from the start
+        from pdflinkcheck.linktable import LinkTable
+        return LinkTable.from_links(self.extract_links(jobs=jobs, anchor_text=anchor_text, web_links=web_links, low_memory=low_memory))
+
+    def extract_toc(self) -> List[Dict[str, Any]]:
+        from pdflinkcheck.analysis_pypdf import extract_toc_from_reader, open_reader
+        reader = getattr(self.doc, "reader", None)
+        if reader is not None:
+            return extract_toc_from_reader(reader)
+        reader = open_reader(self.pdf_path)
+        try:
+            return extract_toc_from_reader(reader)
+        finally:
+            release_buffers(reader)
+
+
+class PymupdfSession(DocumentSession):
+    engine = "pymupdf"
+
+    def _open(self, pdf_path: str):
+        from pdflinkcheck.analysis_pymupdf import open_doc
+        return open_doc(pdf_path)
+
+    def _count_pages(self) -> int:
+        return self.doc.page_count
+
+    def extract_links(self, jobs: int = 1, anchor_text: str = "accurate", web_links: bool = True, low_memory: bool = False) -> List[Dict[str, Any]]:
+        # PyMuPDF reports URI link annotations; web_links is accepted for a uniform interface.
+        from pdflinkcheck.analysis_pymupdf import extract_links_from_doc
+        from pdflinkcheck.sharding import should_shard
+        if self._reopens(low_memory) and not (self.shard_path and should_shard(self.page_count, jobs)):
+            # Page shards already get short-lived documents of their own
+            return list(self.iter_links(anchor_text=anchor_text, low_memory=True))
+        return extract_links_from_doc(self.doc, pdf_path=self.shard_path, jobs=jobs, anchor_text=anchor_text)
+
+    def iter_links(self, anchor_text: str = "accurate", web_links: bool = True, low_memory: bool = False) -> Iterator[Dict[str, Any]]:
+        from pdflinkcheck.analysis_pymupdf import iter_links_from_doc, iter_links_reopening
+        if self._reopens(low_memory):
+            # The session's own document stays open (TOC, page count) but reads no pages
+            return iter_links_reopening(self.pdf_path, self.page_count, anchor_text=anchor_text)
+        return iter_links_from_doc(self.doc, anchor_text=anchor_text)
+
+    def _reopens(self, low_memory: bool) -> bool:
+        from pdflinkcheck.analysis_pymupdf import LOW_MEMORY_REOPEN_EVERY
+        return low_memory and (self.page_count or 0) > LOW_MEMORY_REOPEN_EVERY
+
+    def extract_toc(self) -> List[Dict[str, Any]]:
+        from pdflinkcheck.analysis_pymupdf import analyze_toc_fitz
+        try:
+            return analyze_toc_fitz(self.doc)
+        except Exception as e:
+            print(f"An error occurred: {e}", file=sys.stderr)
+            return []
+
+
+class PdfiumSession(DocumentSession):
+    engine = "pdfium"
+
+    def _open(self, pdf_path: str):
+        from pdflinkcheck.analysis_pdfium import open_doc
+        return open_doc(pdf_path)
+
+    def _count_pages(self) -> int:
+        return len(self.doc)
+
+    def extract_links(self, jobs: int = 1, anchor_text: str = "accurate", web_links: bool = True, low_memory: bool = False) -> List[Dict[str, Any]]:
+        from pdflinkcheck.analysis_pdfium import extract_links_from_doc
+        return extract_links_from_doc(self.doc, pdf_path=self.shard_path, jobs=jobs, anchor_text=anchor_text, web_links=web_links)
+
+    def iter_links(self, anchor_text: str = "accurate", web_links: bool = True, low_memory: bool = False) -> Iterator[Dict[str, Any]]:
+        from pdflinkcheck.analysis_pdfium import iter_links_from_doc
+        return iter_links_from_doc(self.doc, anchor_text=anchor_text, web_links=web_links)
+
+    def extract_toc(self) -> List[Dict[str, Any]]:
+        from pdflinkcheck.analysis_pdfium import extract_toc_from_doc
+        return extract_toc_from_doc(self.doc)
+
+
+SESSION_CLASSES = {
+    "pypdf": PypdfSession,
+    "pymupdf": PymupdfSession,
+    "pdfium": PdfiumSession,
+    "xref": XrefSession,
+}
+
+
+def resolve_pdf_library(pdf_library: str, pdf_path=None) -> str:
+    """
+    Lower-case the engine name and turn "auto" into the best installed engine:
+    the engine profile's pick for pdf_path when there is a profile (see
+    pdflinkcheck.engine_profile), otherwise pdfium > pymupdf > pypdf.
+    """
+    pdf_library = pdf_library.lower()
+    if pdf_library == "auto":
+        if pdf_path is not None:
+            from pdflinkcheck.engine_profile import select_engine
+            choice = select_engine(pdf_path)
+            if choice is not None:
+                return choice.engine
+        if pdfium_is_available():
+            return "pdfium"
+        if pymupdf_is_available():
+            return "pymupdf"
+        return "pypdf"
+    return pdf_library
+
+
+def open_session(pdf_path: str, pdf_library: str = "pypdf") -> DocumentSession:
+    """
+    Open pdf_path once with the requested engine ("pypdf", "pymupdf", "pdfium", "xref" or "auto").
+    The caller closes the session, preferably with a `with` block.
+    """
+    pdf_library = resolve_pdf_library(pdf_library, pdf_path)
+    if pdf_library not in SESSION_CLASSES:
+        raise ValueError(f"Unknown PDF engine: {pdf_library!r}. Expected one of {tuple(SESSION_CLASSES)}.")
+    if pdf_library == "pymupdf" and not pymupdf_is_available():
+        raise ImportError("The 'fitz' module (PyMuPDF) is required but not installed.")
+    if pdf_library == "pdfium" and not pdfium_is_available():
+        raise ImportError(
+            "pypdfium2 is not installed. "
+            "\nInstall it with: \n\tpip install pdflinkcheck[pdfium] \n\t OR \n\t uv sync --extra pdfium"
+        )
+    return SESSION_CLASSES[pdf_library](pdf_path)
+
+
+def iter_links(pdf_path: str, engine: str = "pypdf", anchor_text: str = "accurate", web_links: bool = True, low_memory: bool = False) -> Iterator[Dict[str, Any]]:
+    """
+    Yield normalized link records from pdf_path as each page is processed.
+
+    Same records, in the same order, as the engine's extract_links(), but
+    nothing is accumulated: consumers can start work on page 1 while later
+    pages are still unread. The document is closed when the generator is
+    exhausted or closed early (break, or .close()).
+
+    Example:
+        for link in iter_links("manual.pdf", engine="pymupdf"):
+            if link["type"] == "External (URI)":
+                check(link["url"])
+    """
+    with open_session(pdf_path, engine) as session:
+        yield from session.iter_links(anchor_text=anchor_text, web_links=web_links, low_memory=low_memory)
+
+
+def extract_link_table(pdf_path: str, engine: str = "pypdf", anchor_text: str = "accurate", web_links: bool = True, low_memory: bool = False) -> "LinkTable":
+    """
+    Extract the links of pdf_path straight into a LinkTable, without ever
+    holding the full list of link dicts. Convert with table.to_dicts() where
+    the dict schema is needed (exports, the report).
+    """
+    with open_session(pdf_path, engine) as session:
+        return session.extract_link_table(anchor_text=anchor_text, web_links=web_links, low_memory=low_memory)
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# src/pdflinkcheck/sharding.py
+from __future__ import annotations
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Tuple
+
+from pdflinkcheck import timing
+
+"""
+Page-sharded link extraction for a single very large PDF.
+
+The page range is split into contiguous shards. Each worker process opens
+the document itself, extracts links for its slice, and the parent stitches
+the slices back together in page order, so the output is identical to a
+single-process run.
+
+Small documents are not worth the process start-up and re-open cost; below
+SHARD_MIN_PAGES the caller should stay single-process (see should_shard()).
+
+Each worker counts its own work (pages_loaded, annotations_seen, ...) and
+returns the counters with its links; the parent adds them to the active
+timing.Recorder. Worker stage times are not merged: they ran in parallel, in
+other processes, and the parent already times the page loop as a whole.
+"""
+
+# Documents shorter than this are always extracted in-process.
+SHARD_MIN_PAGES = 2000
+
+# Shards per worker. More shards than workers evens out pages of uneven cost
+# (a 500-link index page next to 50 blank ones).
+SHARDS_PER_JOB = 4
+
+
+def resolve_jobs(jobs: int) -> int:
+    """1 means in-process; 0 or less means one worker per CPU core."""
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def should_shard(page_count: int, jobs: int, min_pages: int = SHARD_MIN_PAGES) -> bool:
+    return resolve_jobs(jobs) > 1 and page_count >= min_pages
+
+
+def plan_shards(page_count: int, jobs: int) -> List[Tuple[int, int]]:
+    """
+    Split range(page_count) into contiguous (start, stop) slices, in page order.
+    """
+    jobs = resolve_jobs(jobs)
+    shard_count = max(1, min(page_count, jobs * SHARDS_PER_JOB))
+    size, extra = divmod(page_count, shard_count)
+    shards = []
+    start = 0
+    for i in range(shard_count):
+        stop = start + size + (1 if i < extra else 0)
+        if stop > start:
+            shards.append((start, stop))
+        start = stop
+    return shards
+
+
+def run_sharded(
+    shard_fn: Callable[[str, int, int], List[Dict[str, Any]]],
+    pdf_path: str,
+    page_count: int,
+    jobs: int,
+) -> List[Dict[str, Any]]:
+    """
+    Run shard_fn(pdf_path, start, stop) over every shard in a process pool and
+    concatenate the results in page order.
+
+    shard_fn must be a module-level function (picklable) that opens pdf_path
+    itself. Exceptions from workers propagate to the caller.
+    """
+    jobs = resolve_jobs(jobs)
+    shards = plan_shards(page_count, jobs)
+    with ProcessPoolExecutor(max_workers=min(jobs, len(shards))) as pool:
+        futures = [pool.submit(_run_shard, shard_fn, pdf_path, start, stop) for start, stop in shards]
+        merged: List[Dict[str, Any]] = []
+        for future in futures:
+            links, counters = future.result()
+            merged.extend(links)
+            for name, n in counters.items():
+                timing.count(name, n)
+    return merged
+
+
+def _run_shard(
+    shard_fn: Callable[[str, int, int], List[Dict[str, Any]]],
+    pdf_path: str,
+    start: int,
+    stop: int,
+) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    """Worker: run one shard under its own Recorder; return its links and counters."""
+    with timing.Recorder() as recorder:
+        links = shard_fn(pdf_path, start, stop)
+    return links, recorder.counters
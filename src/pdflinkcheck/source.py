@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# src/pdflinkcheck/source.py
+from __future__ import annotations
+import io
+import mmap
+import os
+from typing import IO, Union
+
+"""
+PDF input sources: a path, or a document that is already in memory.
+
+run_report(), open_session() and the engine extractors accept any of
+
+    str / os.PathLike       a file on disk (the classic input)
+    bytes, bytearray        e.g. an HTTP upload body
+    memoryview
+    mmap.mmap               zero-copy view of a large local file
+    io.BytesIO, open binary file objects (seekable)
+
+and never write the document to a temporary file. Each engine gets the
+form it reads without copying where it can:
+
+    open_stream()   seekable binary stream        pypdf, pypdfium2
+    read_buffer()   bytes / bytearray / mmap      xref scanner, PyMuPDF (stream=)
+
+Streams are read from offset 0 regardless of their current position.
+"""
+
+PdfSource = Union[str, os.PathLike, bytes, bytearray, memoryview, mmap.mmap, IO[bytes]]
+
+# Display name for in-memory documents without a name of their own
+MEMORY_PDF_NAME = "memory.pdf"
+
+
+def is_path(source) -> bool:
+    return isinstance(source, (str, os.PathLike))
+
+
+def source_name(source, default: str = MEMORY_PDF_NAME) -> str:
+    """A path for display: the path itself, an open file's name, or default."""
+    if is_path(source):
+        return str(source)
+    name = getattr(source, "name", None)
+    if isinstance(name, str) and name:
+        return name
+    return default
+
+
+class BufferReader(io.RawIOBase):
+    """
+    Seekable read-only stream over a bytes-like object (mmap, memoryview,
+    bytearray) that reads straight from the buffer instead of copying it.
+    """
+    def __init__(self, buffer):
+        self._view = memoryview(buffer).cast("B")
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        view = self._view
+        n = max(0, min(len(b), len(view) - self._pos))
+        b[:n] = view[self._pos:self._pos + n]
+        self._pos += n
+        return n
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            pos = offset
+        elif whence == io.SEEK_CUR:
+            pos = self._pos + offset
+        elif whence == io.SEEK_END:
+            pos = len(self._view) + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if pos < 0:
+            raise ValueError(f"Negative seek position {pos}")
+        self._pos = pos
+        return pos
+
+    def tell(self) -> int:
+        return self._pos
+
+    def close(self) -> None:
+        # Release the view so the caller can close its mmap
+        if not self.closed:
+            self._view.release()
+        super().close()
+
+
+def open_stream(source) -> IO[bytes]:
+    """Seekable binary stream over an in-memory source, positioned at 0. The caller keeps ownership of source."""
+    if isinstance(source, bytes):
+        return io.BytesIO(source)  # Shares the bytes until written to
+    if isinstance(source, (bytearray, memoryview, mmap.mmap)):
+        return BufferReader(source)
+    if hasattr(source, "read") and hasattr(source, "seek"):
+        source.seek(0)
+        return source
+    raise TypeError(f"Unsupported PDF source: {type(source).__name__}")
+
+
+def read_buffer(source) -> Union[bytes, bytearray, mmap.mmap]:
+    """
+    The document as one bytes-like object supporting find()/rfind() and
+    slicing to bytes. bytes, bytearray and mmap are returned as they are;
+    BytesIO and other file objects are read (BytesIO.getvalue() does not copy
+    an unmodified buffer).
+    """
+    if isinstance(source, (bytes, bytearray, mmap.mmap)):
+        return source
+    if isinstance(source, memoryview):
+        return source.tobytes()
+    if isinstance(source, io.BytesIO):
+        return source.getvalue()
+    if hasattr(source, "read") and hasattr(source, "seek"):
+        source.seek(0)
+        return source.read()
+    raise TypeError(f"Unsupported PDF source: {type(source).__name__}")
+
+
+def release_buffers(doc) -> None:
+    """
+    Drop the views a closed engine document still holds on an in-memory
+    source (PdfReader.stream, fitz.Document.stream), so the caller can close
+    its mmap right away instead of after garbage collection.
+    """
+    stream = getattr(doc, "stream", None)
+    if isinstance(stream, BufferReader):
+        stream.close()
+    elif isinstance(stream, memoryview):
+        # Only created by pdflinkcheck.analysis_pymupdf.open_doc() for mmap sources
+        doc.stream = None
+        try:
+            stream.release()
+        except BufferError:
+            pass
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# src/pdflinkcheck/spatial.py
+from __future__ import annotations
+from bisect import bisect_left, bisect_right
+from math import floor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from pdflinkcheck.environment import numpy_is_available
+
+try:
+    if numpy_is_available():
+        import numpy as np
+    else:
+        np = None
+except ImportError:
+    np = None
+
+"""
+Engine-agnostic spatial lookup for word boxes on a single page.
+
+The anchor text step asks the same question for every link on a page:
+"which words intersect this (expanded) rect?". Testing every word against
+every link is O(links x words). WordGrid buckets the words of one page
+into a uniform grid once, so each link only tests the words in the cells
+its rect touches.
+
+For pages with thousands of links (index pages, parts catalogs), the
+match_*_to_rects() functions resolve every link rect of a page in one
+batch. With numpy installed they use a single broadcast comparison;
+without it (e.g. Termux) they fall back to WordGrid / PointIndex.
+
+This portion of the codebase is MIT licensed. It does not rely on any AGPL-licensed code.
+"""
+
+# Cell edge length in PDF points. Roughly one line of body text tall and a
+# few words wide, so a typical link rect touches only a handful of cells.
+DEFAULT_CELL_SIZE = 24.0
+
+# Words spanning more cells than this (rotated banners, corrupt boxes) are
+# kept in a side list that every query checks, instead of flooding the grid.
+MAX_CELLS_PER_WORD = 64
+
+# Anchor text search tolerance around a link rect, shared by the engines.
+# 10 points horizontal to catch wide characters/kerning,
+# 3 points vertical to stay within the line.
+ANCHOR_H_TOL = 10
+ANCHOR_V_TOL = 3
+
+# Upper bound on the rects x boxes boolean mask built per numpy batch,
+# so a catalog page with 5,000 links and 20,000 words stays near 4 MB.
+NUMPY_MASK_BUDGET = 4_000_000
+
+Rect = Tuple[float, float, float, float]
+
+
+def expand_rect(rect: Sequence[float], h_tol: float = ANCHOR_H_TOL, v_tol: float = ANCHOR_V_TOL) -> Rect:
+    """Grow an (x0, y0, x1, y1) box by h_tol left/right and v_tol top/bottom."""
+    return (rect[0] - h_tol, rect[1] - v_tol, rect[2] + h_tol, rect[3] + v_tol)
+
+
+def rects_intersect(a: Sequence[float], b: Sequence[float]) -> bool:
+    """
+    Strict intersection test for two (x0, y0, x1, y1) boxes.
+    Matches fitz.Rect.intersects(): empty boxes never intersect, and
+    boxes that only share an edge do not intersect.
+    """
+    if a[0] >= a[2] or a[1] >= a[3] or b[0] >= b[2] or b[1] >= b[3]:
+        return False
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+class WordGrid:
+    """
+    Uniform grid index over the word boxes of one page.
+
+    Args:
+        words: Sequence of word tuples whose first four items are the box
+               (x0, y0, x1, y1) and whose fifth item is the word text,
+               e.g. the output of PyMuPDF's page.get_text("words").
+        cell_size: Grid cell edge length in points.
+
+    query() returns word indices in their original order, so joined
+    anchor text reads exactly as a linear scan would produce it.
+    """
+    def __init__(self, words: Sequence[Sequence], cell_size: float = DEFAULT_CELL_SIZE):
+        self.words = words
+        self.cell_size = float(cell_size)
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+        self._oversize: List[int] = []
+
+        for i, w in enumerate(words):
+            x0, y0, x1, y1 = w[0], w[1], w[2], w[3]
+            if x0 >= x1 or y0 >= y1:
+                # Empty boxes can never intersect anything; leave them out.
+                continue
+            c0, r0, c1, r1 = self._cell_span(x0, y0, x1, y1)
+            if (c1 - c0 + 1) * (r1 - r0 + 1) > MAX_CELLS_PER_WORD:
+                self._oversize.append(i)
+                continue
+            for r in range(r0, r1 + 1):
+                for c in range(c0, c1 + 1):
+                    self._cells.setdefault((c, r), []).append(i)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def _cell_span(self, x0: float, y0: float, x1: float, y1: float) -> Tuple[int, int, int, int]:
+        size = self.cell_size
+        return floor(x0 / size), floor(y0 / size), floor(x1 / size), floor(y1 / size)
+
+    def query(self, rect: Sequence[float]) -> List[int]:
+        """Indices of words strictly intersecting rect (x0, y0, x1, y1), in original order."""
+        x0, y0, x1, y1 = rect[0], rect[1], rect[2], rect[3]
+        if x0 >= x1 or y0 >= y1:
+            return []
+
+        c0, r0, c1, r1 = self._cell_span(x0, y0, x1, y1)
+        candidates = set(self._oversize)
+        if (c1 - c0 + 1) * (r1 - r0 + 1) > len(self._cells):
+            # Query rect is larger than the populated grid; walk the cells instead.
+            for (c, r), bucket in self._cells.items():
+                if c0 <= c <= c1 and r0 <= r <= r1:
+                    candidates.update(bucket)
+        else:
+            for r in range(r0, r1 + 1):
+                for c in range(c0, c1 + 1):
+                    bucket = self._cells.get((c, r))
+                    if bucket:
+                        candidates.update(bucket)
+
+        words = self.words
+        return [i for i in sorted(candidates) if rects_intersect(words[i], rect)]
+
+    def texts_in(self, rect: Sequence[float]) -> List[str]:
+        """Word texts strictly intersecting rect, in original order."""
+        return [self.words[i][4] for i in self.query(rect)]
+
+
+class PointIndex:
+    """
+    Sorted-by-y index over text insertion points (x, y) of one page.
+
+    Used by the pypdf engines, whose visitor yields points rather than boxes.
+    query() uses closed bounds and returns indices in original order.
+    """
+    def __init__(self, points: Sequence[Sequence[float]]):
+        self.points = points
+        self._order = sorted(range(len(points)), key=lambda i: points[i][1])
+        self._ys = [points[i][1] for i in self._order]
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def query(self, rect: Sequence[float]) -> List[int]:
+        """Indices of points with x0 <= x <= x1 and y0 <= y <= y1, in original order."""
+        x0, y0, x1, y1 = rect[0], rect[1], rect[2], rect[3]
+        lo = bisect_left(self._ys, y0)
+        hi = bisect_right(self._ys, y1)
+        points = self.points
+        return sorted(i for i in self._order[lo:hi] if x0 <= points[i][0] <= x1)
+
+
+def _numpy_chunks(n_rects: int, n_items: int):
+    step = max(1, NUMPY_MASK_BUDGET // max(1, n_items))
+    for start in range(0, n_rects, step):
+        yield start, min(start + step, n_rects)
+
+
+def _split_valid(rects: Sequence[Optional[Sequence[float]]]) -> Tuple[List[int], List[Sequence[float]]]:
+    positions = [i for i, r in enumerate(rects) if r is not None]
+    return positions, [rects[i] for i in positions]
+
+
+def _use_numpy(backend: str) -> bool:
+    if backend == "numpy":
+        if np is None:
+            raise ImportError("numpy backend requested, but numpy is not installed.")
+        return True
+    if backend == "python":
+        return False
+    if backend == "auto":
+        return np is not None
+    raise ValueError(f"Unknown backend: {backend!r}. Use 'auto', 'numpy' or 'python'.")
+
+
+def match_boxes_to_rects(
+    boxes: Sequence[Sequence],
+    rects: Sequence[Optional[Sequence[float]]],
+    backend: str = "auto",
+) -> List[List[int]]:
+    """
+    For every rect, the indices of boxes strictly intersecting it (see rects_intersect()).
+
+    Args:
+        boxes: Word tuples whose first four items are (x0, y0, x1, y1).
+        rects: Search rects, already expanded. None entries match nothing.
+        backend: "auto" (numpy when installed), "numpy" or "python".
+
+    Returns:
+        One list of box indices per rect, each in original box order.
+    """
+    results: List[List[int]] = [[] for _ in rects]
+    positions, valid = _split_valid(rects)
+    if not boxes or not valid:
+        return results
+
+    if not _use_numpy(backend):
+        grid = WordGrid(boxes)
+        for pos, rect in zip(positions, valid):
+            results[pos] = grid.query(rect)
+        return results
+
+    b = np.array([w[:4] for w in boxes], dtype=float)
+    r = np.array(valid, dtype=float)
+    b_ok = (b[:, 0] < b[:, 2]) & (b[:, 1] < b[:, 3])
+    r_ok = (r[:, 0] < r[:, 2]) & (r[:, 1] < r[:, 3])
+    for start, stop in _numpy_chunks(len(r), len(b)):
+        rc = r[start:stop]
+        mask = (
+            (b[None, :, 0] < rc[:, None, 2])
+            & (rc[:, None, 0] < b[None, :, 2])
+            & (b[None, :, 1] < rc[:, None, 3])
+            & (rc[:, None, 1] < b[None, :, 3])
+            & b_ok[None, :]
+            & r_ok[start:stop, None]
+        )
+        for offset, row in enumerate(mask):
+            results[positions[start + offset]] = np.flatnonzero(row).tolist()
+    return results
+
+
+def match_points_to_rects(
+    points: Sequence[Sequence[float]],
+    rects: Sequence[Optional[Sequence[float]]],
+    backend: str = "auto",
+) -> List[List[int]]:
+    """
+    For every rect, the indices of points (x, y) inside it, bounds inclusive.
+
+    Args:
+        points: (x, y) pairs, e.g. text insertion points from a pypdf visitor.
+        rects: Search rects, already expanded and normalized. None entries match nothing.
+        backend: "auto" (numpy when installed), "numpy" or "python".
+
+    Returns:
+        One list of point indices per rect, each in original point order.
+    """
+    results: List[List[int]] = [[] for _ in rects]
+    positions, valid = _split_valid(rects)
+    if not points or not valid:
+        return results
+
+    if not _use_numpy(backend):
+        index = PointIndex(points)
+        for pos, rect in zip(positions, valid):
+            results[pos] = index.query(rect)
+        return results
+
+    p = np.array([pt[:2] for pt in points], dtype=float)
+    r = np.array(valid, dtype=float)
+    for start, stop in _numpy_chunks(len(r), len(p)):
+        rc = r[start:stop]
+        mask = (
+            (rc[:, None, 0] <= p[None, :, 0])
+            & (p[None, :, 0] <= rc[:, None, 2])
+            & (rc[:, None, 1] <= p[None, :, 1])
+            & (p[None, :, 1] <= rc[:, None, 3])
+        )
+        for offset, row in enumerate(mask):
+            results[positions[start + offset]] = np.flatnonzero(row).tolist()
+    return results
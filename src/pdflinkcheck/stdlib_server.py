@@ -5,9 +5,7 @@ from __future__ import annotations
 import http.server
 import socketserver
 import json
-import tempfile
 import shutil
-import os
 from pathlib import Path
 import email  # This replaces cgi for multipart parsing
 
@@ -116,18 +114,16 @@ class PDFLinkCheckHandler(http.server.SimpleHTTPRequestHandler):
             self._send_json_error("No PDF file uploaded", 400)
             return
 
-        # Save uploaded file to temp
-        tmp_path = None
+        # Analyze the uploaded bytes in memory. No export and no result cache,
+        # so nothing derived from the upload is written to disk.
         try:
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
-                tmp_file.write(file_item)
-                tmp_path = tmp_file.name
-
             result = run_report_and_call_exports(
-                pdf_path=tmp_path,
+                pdf_path=file_item,
                 export_format="",
                 pdf_library=pdf_library,
-                print_bool=False
+                print_bool=False,
+                use_cache=False,
+                pdf_name=file_filename,
             )
             
             total_links_count = result.get("metadata",{}).get("link_counts",{}).get("total_links_count", 0)
@@ -144,9 +140,6 @@ class PDFLinkCheckHandler(http.server.SimpleHTTPRequestHandler):
 
         except Exception as e:
             self._send_json_error(f"Analysis failed: {str(e)}", 500)
-        finally:
-            if tmp_path and os.path.exists(tmp_path):
-                os.unlink(tmp_path)
 
     def _send_json(self, data, status=200):
         self.send_response(status)
@@ -48,13 +48,10 @@ from __future__ import annotations
 import http.server
 import socketserver
 import json
-import tempfile
-import os
 import email
 import signal
 import threading
 from dataclasses import dataclass
-from typing import Optional
 
 try:
     from pdflinkcheck.report import run_report_and_call_exports
@@ -483,37 +480,30 @@ class APIHandler(http.server.BaseHTTPRequestHandler):
     # -------- Business Logic --------
 
     def _process_pdf(self, upload: UploadRequest) -> dict:
-        tmp_path: Optional[str] = None
-
-        try:
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-                tmp.write(upload.pdf_bytes)
-                tmp_path = tmp.name
-
-            result = run_report_and_call_exports(
-                pdf_path=tmp_path,
-                export_format="",
-                pdf_library=upload.pdf_library,
-                print_bool=False,
-            )
-
-            link_count = (
-                result.get("metadata", {})
-                .get("link_counts", {})
-                .get("total_links_count", 0)
-            )
+        # The upload is analyzed from memory: no temporary file, no export and
+        # no result cache entry
+        result = run_report_and_call_exports(
+            pdf_path=upload.pdf_bytes,
+            export_format="",
+            pdf_library=upload.pdf_library,
+            print_bool=False,
+            use_cache=False,
+            pdf_name=upload.filename,
+        )
 
-            return {
-                "filename": upload.filename,
-                "pdf_library_used": upload.pdf_library,
-                "total_links_count": link_count,
-                "data": result["data"],
-                "text_report": result["text"],
-            }
+        link_count = (
+            result.get("metadata", {})
+            .get("link_counts", {})
+            .get("total_links_count", 0)
+        )
 
-        finally:
-            if tmp_path and os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+        return {
+            "filename": upload.filename,
+            "pdf_library_used": upload.pdf_library,
+            "total_links_count": link_count,
+            "data": result["data"],
+            "text_report": result["text"],
+        }
 
 
 # =========================
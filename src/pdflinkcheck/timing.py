@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# src/pdflinkcheck/timing.py
+from __future__ import annotations
+import contextvars
+import time
+import tracemalloc
+from contextlib import nullcontext
+from typing import Dict, Any, List, Optional
+
+"""
+Per-stage timings and work counters for one run_report() call.
+
+run_report() opens a Recorder; code anywhere below it marks stages and
+bumps counters through the module-level helpers, without a recorder being
+threaded through every engine signature:
+
+    with timing.stage("anchor_text"):
+        texts = get_anchor_texts(page, rects)
+    timing.count("text_extractions")
+
+Both are no-ops when no Recorder is active (library calls outside
+run_report()), so the engines pay one ContextVar lookup per call.
+
+Stages nest. Each stage is recorded exclusive of the stages opened inside
+it ("page_iteration" excludes "anchor_text"), so the stage times add up to
+the run total apart from untimed glue (mostly the engine import on first
+use). Re-entering a stage accumulates. Wall time is time.perf_counter(),
+CPU time is time.process_time() (all threads of this process).
+
+Recorder.attach() writes report metadata["timings"] and metadata["counters"]:
+
+    "timings": {"stages": {"open": {"wall_s": 0.012, "cpu_s": 0.011, "calls": 1}, ...},
+                "total": {"wall_s": 0.41, "cpu_s": 0.40}},
+    "counters": {"pages_loaded": 120, "annotations_seen": 310, ...}
+
+Stages recorded by run_report(): engine_select (--engine auto only), cache,
+open, page_iteration, anchor_text, toc, validation, risk, render, plus export
+in run_report_and_call_exports().
+A cache hit skips open through toc. Counters only cover what the engine can
+see: PyMuPDF and pdfium do not expose objects_resolved. Page-shard workers
+run in other processes; their counters are added to the parent's Recorder
+(see sharding.run_sharded()), but their stages are not, so sharded runs
+report their page loop as page_iteration wall time only.
+
+Recorder(memory_top=N) while tracemalloc is tracing (run_report(profile_memory=True))
+also snapshots the heap around each top-level stage and keeps the N source
+lines that allocated the most, plus the stage's peak traced memory. Nested
+stages are folded into their top-level stage, so anchor_text allocations
+show up under page_iteration; snapshots are too slow to take per page.
+"""
+
+_active: contextvars.ContextVar[Optional["Recorder"]] = contextvars.ContextVar("pdflinkcheck_timing", default=None)
+
+_NULL_STAGE = nullcontext()
+
+# Counter names used by the engines, in report order
+COUNTERS = ("pages_loaded", "annotations_seen", "text_extractions", "objects_resolved")
+
+# Allocations by the profiling machinery itself are not interesting. Skipped
+# after compare_to(): Snapshot.filter_traces() is pure Python and takes
+# minutes on a heap with millions of live blocks.
+_IGNORED_FILES = frozenset((
+    tracemalloc.__file__,
+    __file__,
+    "<frozen importlib._bootstrap>",
+    "<frozen importlib._bootstrap_external>",
+    "<unknown>",
+))
+
+
+class Recorder:
+    """Collects stage timings and counters while active (use as a context manager)."""
+
+    def __init__(self, memory_top: int = 0, profiler: Any = None):
+        self.stages: Dict[str, List[float]] = {}  # name -> [wall, cpu, calls]
+        self.counters: Dict[str, int] = {}
+        self.total_wall = 0.0
+        self.total_cpu = 0.0
+        self.memory_top = memory_top
+        self.memory: Dict[str, Dict[str, Any]] = {}  # name -> {"peak": bytes, "lines": {location: [size, count]}}
+        self.profiler = profiler  # cProfile.Profile paused while taking snapshots
+        self._stack: List[List[Any]] = []  # [wall_start, cpu_start, child_wall, child_cpu, snapshot]
+        self._token = None
+
+    def __enter__(self) -> "Recorder":
+        self._token = _active.set(self)
+        self._t0 = (time.perf_counter(), time.process_time())
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.total_wall += time.perf_counter() - self._t0[0]
+        self.total_cpu += time.process_time() - self._t0[1]
+        _active.reset(self._token)
+        self._token = None
+
+    def begin(self) -> None:
+        snapshot = None
+        if self.memory_top and not self._stack and tracemalloc.is_tracing():
+            snapshot = self._snapshot()
+            tracemalloc.reset_peak()
+        self._stack.append([time.perf_counter(), time.process_time(), 0.0, 0.0, snapshot])
+
+    def end(self, name: str) -> None:
+        wall_start, cpu_start, child_wall, child_cpu, snapshot = self._stack.pop()
+        wall = time.perf_counter() - wall_start
+        cpu = time.process_time() - cpu_start
+        if snapshot is not None:
+            self._record_memory(name, snapshot)
+        if self._stack:
+            parent = self._stack[-1]
+            parent[2] += wall
+            parent[3] += cpu
+        entry = self.stages.setdefault(name, [0.0, 0.0, 0])
+        entry[0] += wall - child_wall
+        entry[1] += cpu - child_cpu
+        entry[2] += 1
+
+    def _snapshot(self) -> "tracemalloc.Snapshot":
+        if self.profiler is not None:
+            self.profiler.disable()
+        try:
+            return tracemalloc.take_snapshot()
+        finally:
+            if self.profiler is not None:
+                self.profiler.enable()
+
+    def _record_memory(self, name: str, before: "tracemalloc.Snapshot") -> None:
+        peak = tracemalloc.get_traced_memory()[1]
+        after = self._snapshot()
+        if self.profiler is not None:
+            self.profiler.disable()
+        try:
+            stats = after.compare_to(before, "lineno")
+        finally:
+            if self.profiler is not None:
+                self.profiler.enable()
+        entry = self.memory.setdefault(name, {"peak": 0, "lines": {}})
+        entry["peak"] = max(entry["peak"], peak)
+        lines = entry["lines"]
+        for stat in stats:
+            frame = stat.traceback[0]
+            if stat.size_diff <= 0 or frame.filename in _IGNORED_FILES:
+                continue
+            location = f"{frame.filename}:{frame.lineno}"
+            size, count = lines.get(location, (0, 0))
+            lines[location] = (size + stat.size_diff, count + stat.count_diff)
+
+    def memory_metadata(self) -> Dict[str, Any]:
+        """Per top-level stage: peak traced KiB and the memory_top lines that allocated the most."""
+        result = {}
+        for name, entry in self.memory.items():
+            top = sorted(entry["lines"].items(), key=lambda item: item[1][0], reverse=True)[:self.memory_top]
+            result[name] = {
+                "peak_kib": round(entry["peak"] / 1024, 1),
+                "top": [
+                    {"location": location, "size_kib": round(size / 1024, 1), "count": count}
+                    for location, (size, count) in top
+                ],
+            }
+        return result
+
+    def as_metadata(self) -> Dict[str, Any]:
+        return {
+            "stages": {
+                name: {"wall_s": round(wall, 6), "cpu_s": round(cpu, 6), "calls": calls}
+                for name, (wall, cpu, calls) in self.stages.items()
+            },
+            "total": {"wall_s": round(self.total_wall, 6), "cpu_s": round(self.total_cpu, 6)},
+        }
+
+    def counters_metadata(self) -> Dict[str, int]:
+        known = {name: self.counters[name] for name in COUNTERS if name in self.counters}
+        known.update((name, n) for name, n in self.counters.items() if name not in known)
+        return known
+
+    def attach(self, metadata: Dict[str, Any]) -> None:
+        """Set metadata["timings"] and metadata["counters"] (and metadata["memory"] when tracked) from this recorder."""
+        metadata["timings"] = self.as_metadata()
+        metadata["counters"] = self.counters_metadata()
+        if self.memory:
+            metadata["memory"] = self.memory_metadata()
+
+
+class _Stage:
+    __slots__ = ("recorder", "name")
+
+    def __init__(self, recorder: Recorder, name: str):
+        self.recorder = recorder
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.recorder.begin()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.recorder.end(self.name)
+
+
+def active() -> Optional[Recorder]:
+    return _active.get()
+
+
+def stage(name: str):
+    """Context manager timing one stage of the active Recorder; a shared no-op without one."""
+    recorder = _active.get()
+    if recorder is None:
+        return _NULL_STAGE
+    return _Stage(recorder, name)
+
+
+def count(name: str, n: int = 1) -> None:
+    """Add n to a counter of the active Recorder, if any."""
+    recorder = _active.get()
+    if recorder is not None:
+        recorder.counters[name] = recorder.counters.get(name, 0) + n
@@ -4,7 +4,7 @@
 from __future__ import annotations
 import sys
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from pdflinkcheck.io import get_friendly_path
 from pdflinkcheck.environment import pymupdf_is_available
@@ -19,11 +19,23 @@ START_INDEX = 0
 # We will add +1 only for the HUMAN REASON strings.
 
 
+def _issue_record(link: Dict[str, Any], status: str, reason: Optional[str]) -> Dict[str, Any]:
+    """
+    Issue entry for a problem link: a shallow copy carrying its validation result.
+    Only problem links are copied; the link record itself is never modified, so
+    the report's link lists keep sharing the engine's dicts.
+    """
+    issue = dict(link)
+    issue["validation"] = {"status": status, "reason": reason}
+    return issue
+
+
 def run_validation(
     report_results: Dict[str, Any],
     pdf_path: str,
     pdf_library: str = "pypdf",
-    check_external: bool = False
+    check_external: bool = False,
+    total_pages: Optional[int] = None
 ) -> Dict[str, Any]:
     """
     Validates links during run_report() using a partial completion of the data dict.
@@ -33,6 +45,7 @@ def run_validation(
         pdf_path: Path to the original PDF (needed for relative file checks and page count)
         pdf_library: Engine used ("pypdf" or "pymupdf")
         check_external: Whether to validate HTTP URLs (requires network + requests)
+        total_pages: Page count from an open DocumentSession. If omitted, the PDF is opened to count pages.
 
     Returns:
         Validation summary stats with valid/broken counts and detailed issues
@@ -49,7 +62,9 @@ def run_validation(
 
     # Get total page count (critical for internal validation)
     try:
-        if pymupdf_is_available() and pdf_library == "pymupdf":
+        if total_pages is not None:
+            pass # Already known from the session that extracted the links
+        elif pymupdf_is_available() and pdf_library == "pymupdf":
             import fitz
             doc = fitz.open(pdf_path)
             total_pages = doc.page_count
@@ -154,9 +169,6 @@ def run_validation(
             status = "unknown-link"
             reason = "Other/unsupported link type"
             
-        link_with_val = link.copy()
-        link_with_val["validation"] = {"status": status, "reason": reason}
-
         if status == "valid":
             valid_count += 1
         elif status =="file-found":
@@ -169,13 +181,13 @@ def run_validation(
             unknown_link_count += 1
         elif status == "broken-page":
             broken_page_count += 1
-            issues.append(link_with_val)
+            issues.append(_issue_record(link, status, reason))
         elif status == "broken-file":
             broken_file_count += 1
-            issues.append(link_with_val)
+            issues.append(_issue_record(link, status, reason))
         elif status == "no-destinstion-page":
             no_destination_page_count += 1
-            issues.append(link_with_val)
+            issues.append(_issue_record(link, status, reason))
 
     # Validate TOC entries
     for entry in toc:
@@ -3,6 +3,7 @@
 # src/pdflinkcheck/version_info.py
 from __future__ import annotations
 import re
+from functools import cache
 from pathlib import Path
 import sys
 
@@ -63,7 +64,9 @@ def find_pyproject(start: Path) -> Path | None:
     return None
 
 
+@cache
 def get_version_from_pyproject() -> str:
+    """Version from pyproject.toml, read once per process (CLI help text and --version both ask)."""
     pyproject = find_pyproject(Path(__file__))
     if not pyproject or not pyproject.exists():
         print("ERROR: pyproject.toml missing.", file=sys.stderr)
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# ./tests/conftest.py
+from __future__ import annotations
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+"""
+Shared fixtures.
+
+write_corpus_pdf builds documents with the benchmark corpus generator
+(benchmarks/corpus.py): real text lines, URI, GoTo and named links, and
+optional outlines, object streams and incremental updates.
+"""
+
+CORPUS_PY = Path(__file__).resolve().parents[1] / "benchmarks" / "corpus.py"
+
+
+def _load_corpus():
+    spec = importlib.util.spec_from_file_location("corpus", CORPUS_PY)
+    corpus = importlib.util.module_from_spec(spec)
+    # dataclasses look the module up in sys.modules
+    sys.modules["corpus"] = corpus
+    spec.loader.exec_module(corpus)
+    return corpus
+
+
+@pytest.fixture(scope="session")
+def write_corpus_pdf(tmp_path_factory):
+    """write_corpus_pdf(name, pages, links_per_page, **case) -> (path, summary); summary["links"] is the link count."""
+    corpus = _load_corpus()
+    directory = tmp_path_factory.mktemp("corpus")
+
+    def write(name: str, pages: int, links_per_page: int, **case):
+        data, summary = corpus.build_pdf(corpus.CorpusCase(name, pages=pages, links_per_page=links_per_page, **case))
+        path = directory / f"{name}.pdf"
+        path.write_bytes(data)
+        return path, summary
+
+    return write
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# ./tests/test_batch.py
+from __future__ import annotations
+import json
+
+import pytest
+
+from pdflinkcheck import batch
+
+"""
+Batch mode: path expansion and per-file report locations.
+
+expand_pdf_paths() turns files, directories and globs into a sorted,
+de-duplicated list of PDFs. Reports of same-named PDFs from different
+directories must land in different places, so workers never overwrite each
+other.
+"""
+
+
+@pytest.fixture
+def tree(tmp_path, write_corpus_pdf):
+    small, _ = write_corpus_pdf("batch_small", 1, 2, text_lines=3)
+    large, _ = write_corpus_pdf("batch_large", 3, 4, text_lines=3)
+    (tmp_path / "a" / "deep").mkdir(parents=True)
+    (tmp_path / "b").mkdir()
+    (tmp_path / "a" / "manual.pdf").write_bytes(small.read_bytes())
+    (tmp_path / "b" / "manual.pdf").write_bytes(large.read_bytes())
+    (tmp_path / "a" / "deep" / "SCAN.PDF").write_bytes(small.read_bytes())
+    (tmp_path / "a" / "notes.txt").write_text("not a pdf")
+    return tmp_path
+
+
+@pytest.fixture
+def reports_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "reports"
+    monkeypatch.setattr(batch, "BATCH_REPORTS_DIR", directory)
+    return directory
+
+
+def test_directories_are_searched_recursively(tree):
+    assert batch.expand_pdf_paths([tree / "a"]) == [
+        (tree / "a" / "deep" / "SCAN.PDF").resolve(),
+        (tree / "a" / "manual.pdf").resolve(),
+    ]
+
+
+def test_inputs_are_deduplicated_in_order(tree):
+    paths = batch.expand_pdf_paths([tree / "b" / "manual.pdf", str(tree / "*" / "manual.pdf"), tree / "b"])
+    assert paths == [(tree / "b" / "manual.pdf").resolve(), (tree / "a" / "manual.pdf").resolve()]
+
+
+def test_recursive_glob(tree):
+    assert len(batch.expand_pdf_paths([str(tree / "**" / "*.pdf")])) == 2
+
+
+@pytest.mark.parametrize("item", ["missing.pdf", "*.nomatch"])
+def test_missing_inputs_raise(tree, item):
+    with pytest.raises(FileNotFoundError):
+        batch.expand_pdf_paths([tree / item])
+
+
+def test_same_name_gets_separate_report_dirs(tree, reports_dir):
+    a = batch.batch_output_dir(tree / "a" / "manual.pdf")
+    b = batch.batch_output_dir(tree / "b" / "manual.pdf")
+    assert a != b
+    assert a.is_relative_to(reports_dir) and b.is_relative_to(reports_dir)
+
+
+def test_batch_reports_do_not_collide(tree, reports_dir):
+    paths = batch.expand_pdf_paths([tree / "a" / "manual.pdf", tree / "b" / "manual.pdf"])
+    results = list(batch.iter_batch_results(paths, export_format="JSON"))
+
+    assert [r["error"] for r in results] == [None, None]
+    exports = {r["pdf_path"]: r["export_path_json"] for r in results}
+    assert len(set(exports.values())) == 2
+    for pdf_path, export_path in exports.items():
+        with open(export_path, encoding="utf-8") as f:
+            # Each report still describes its own PDF (neither was overwritten)
+            assert json.load(f)["validation"]["pdf_path"] == pdf_path
+
+
+def test_parallel_batch_matches_serial(tree):
+    paths = batch.expand_pdf_paths([tree])
+    serial = batch.run_batch(paths, export_format="", jobs=1)
+    parallel = batch.run_batch(paths, export_format="", jobs=2)
+    assert serial == parallel
+    assert serial["files_ok"] == 3
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# ./tests/test_cache.py
+from __future__ import annotations
+import os
+
+import pytest
+
+from pdflinkcheck import cache as result_cache
+from pdflinkcheck import report
+from pdflinkcheck.report import run_report
+
+"""
+Extraction cache: misses store, hits skip the engine, keys track versions and
+options, and the size cap evicts the least recently used entries.
+
+Every test runs against its own cache directory.
+"""
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "cache"
+    monkeypatch.setattr(result_cache, "CACHE_DIR", directory)
+    return directory
+
+
+@pytest.fixture(scope="module")
+def cache_pdf(write_corpus_pdf):
+    path, _ = write_corpus_pdf("cache", 3, 5, text_lines=6)
+    return str(path)
+
+
+def _report(pdf_path, **kwargs):
+    return run_report(pdf_path, "pypdf", print_bool=False, **kwargs)
+
+
+def _no_engine(*args, **kwargs):
+    raise AssertionError("the document was opened on a cache hit")
+
+
+def test_default_run_does_not_cache(cache_pdf):
+    _report(cache_pdf)
+    assert result_cache.stats()["entries"] == 0
+
+
+def test_miss_then_hit(cache_pdf, monkeypatch):
+    first = _report(cache_pdf, use_cache=True)
+    assert result_cache.stats()["entries"] == 1
+
+    monkeypatch.setattr(report, "open_session", _no_engine)
+    second = _report(cache_pdf, use_cache=True)
+    assert second["data"] == first["data"]
+    assert second["metadata"]["link_counts"] == first["metadata"]["link_counts"]
+
+
+def test_options_that_change_output_miss(cache_pdf, monkeypatch):
+    _report(cache_pdf, use_cache=True)
+    _report(cache_pdf, use_cache=True, anchor_text="none")
+    assert result_cache.stats()["entries"] == 2
+
+    # pypdf has no fast mode: "fast" shares the "accurate" entry
+    monkeypatch.setattr(report, "open_session", _no_engine)
+    _report(cache_pdf, use_cache=True, anchor_text="fast")
+    assert result_cache.stats()["entries"] == 2
+
+
+def test_key_tracks_engine_library_version(cache_pdf):
+    content_hash = result_cache.hash_file(cache_pdf)
+    old = result_cache.make_key(content_hash, "pypdf", "1.0.0", library_version="6.0.0")
+    new = result_cache.make_key(content_hash, "pypdf", "1.0.0", library_version="6.1.0")
+    assert old != new
+    installed = result_cache.engine_version("pypdf")
+    assert installed
+    assert f"pypdf-{installed}" in result_cache.key_for_file(cache_pdf, "pypdf")
+
+
+def test_eviction_drops_least_recently_used(cache_dir):
+    payload = {"links": ["x" * 1000], "toc": [], "total_pages": 1}
+    for i, key in enumerate(["a", "b", "c"]):
+        path = result_cache.put(key, payload)
+        os.utime(path, (1000 + i, 1000 + i))
+    entry_size = (cache_dir / "a.json").stat().st_size
+
+    # Reading "a" makes it the most recently used
+    assert result_cache.get("a") == payload
+    removed = result_cache.evict(2 * entry_size)
+    assert removed == 1
+    assert result_cache.get("b") is None
+    assert result_cache.get("a") == payload
+    assert result_cache.get("c") == payload
+
+
+def test_unreadable_entry_is_a_miss(cache_dir):
+    cache_dir.mkdir()
+    (cache_dir / "broken.json").write_text("{not json", encoding="utf-8")
+    assert result_cache.get("broken") is None
+    assert not (cache_dir / "broken.json").exists()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# ./tests/test_daemon.py
+from __future__ import annotations
+import functools
+import socket
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from pdflinkcheck import daemon
+
+"""
+Warm daemon client: served runs, and every way the client falls back.
+
+A daemon from another build, a missing socket, a stale socket file and a
+daemon that never takes the request all raise DaemonUnavailable quickly, and
+`analyze` then runs in-process.
+"""
+
+pytestmark = pytest.mark.skipif(not daemon.daemon_is_supported(), reason="needs AF_UNIX sockets")
+
+
+@pytest.fixture
+def socket_dir():
+    # AF_UNIX paths are limited to ~100 bytes; pytest's tmp_path can be longer
+    with tempfile.TemporaryDirectory(prefix="plc") as directory:
+        yield Path(directory)
+
+
+@pytest.fixture
+def running_daemon(socket_dir):
+    socket_path = socket_dir / "daemon.sock"
+    ready = threading.Event()
+    thread = threading.Thread(
+        target=daemon.serve, kwargs={"socket_path": socket_path, "on_ready": lambda server: ready.set()}, daemon=True,
+    )
+    thread.start()
+    assert ready.wait(60), "daemon did not start"
+    yield socket_path
+    try:
+        daemon.stop_daemon(socket_path)
+    except daemon.DaemonUnavailable:
+        pass
+    thread.join(10)
+
+
+@pytest.fixture
+def silent_socket(socket_dir):
+    """A socket that accepts connections and never answers (a hung daemon)."""
+    socket_path = socket_dir / "hung.sock"
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(str(socket_path))
+    listener.listen(1)
+    yield socket_path
+    listener.close()
+
+
+@pytest.fixture
+def sample_pdf(write_corpus_pdf):
+    path, _ = write_corpus_pdf("daemon", 2, 3, text_lines=3)
+    return str(path)
+
+
+def _request(pdf_path):
+    return {
+        "pdf_path": pdf_path, "export_format": "", "pdf_library": "pypdf", "print_bool": False, "jobs": 1,
+        "use_cache": False, "anchor_text": "accurate", "web_links": True, "low_memory": False,
+    }
+
+
+def test_served_run(running_daemon, sample_pdf):
+    result = daemon.analyze_via_daemon(_request(sample_pdf), running_daemon)
+    assert result["done"] is True and result["has_data"] is True
+    assert daemon.daemon_status(running_daemon)["requests"] == 1
+
+
+def test_build_mismatch_is_unavailable(running_daemon, sample_pdf, monkeypatch):
+    # The running daemon keeps its own build; the client now claims another version
+    client_build = {**daemon.build_id(), "version": "0.0.0"}
+    monkeypatch.setattr(daemon, "build_id", lambda: client_build)
+    with pytest.raises(daemon.DaemonUnavailable, match="the daemon runs pdflinkcheck"):
+        daemon.analyze_via_daemon(_request(sample_pdf), running_daemon)
+
+
+def test_missing_and_stale_sockets_are_unavailable(socket_dir, sample_pdf):
+    with pytest.raises(daemon.DaemonUnavailable, match="no daemon running"):
+        daemon.analyze_via_daemon(_request(sample_pdf), socket_dir / "none.sock")
+
+    stale = socket_dir / "stale.sock"
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(str(stale))
+    listener.close()  # the file stays, nobody listens
+    with pytest.raises(daemon.DaemonUnavailable, match="no daemon answering"):
+        daemon.analyze_via_daemon(_request(sample_pdf), stale)
+
+
+def test_silent_daemon_times_out(silent_socket, sample_pdf):
+    start = time.monotonic()
+    with pytest.raises(daemon.DaemonUnavailable, match="did not take the request"):
+        daemon.analyze_via_daemon(_request(sample_pdf), silent_socket, accept_timeout=0.2)
+    assert time.monotonic() - start < 5
+
+
+def test_cli_falls_back_to_in_process_run(silent_socket, sample_pdf, monkeypatch):
+    typer_testing = pytest.importorskip("typer.testing")
+    from pdflinkcheck.cli import app
+
+    monkeypatch.setattr(
+        daemon, "analyze_via_daemon",
+        functools.partial(daemon.analyze_via_daemon, socket_path=silent_socket, accept_timeout=0.2),
+    )
+    result = typer_testing.CliRunner().invoke(
+        app, ["analyze", sample_pdf, "--via-daemon", "--engine", "pypdf", "--format", "NONE", "--no-cache"],
+    )
+    assert "Not using the daemon" in result.output
+    assert "Analyzing locally" in result.output
+    assert "Link Analysis Results" in result.output
+    assert result.exit_code in (0, 1)  # 1 only flags broken links
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# ./tests/test_linktable.py
+from __future__ import annotations
+
+from pdflinkcheck.linktable import LinkTable
+
+"""
+LinkTable round-trips link records exactly.
+
+to_dicts() must rebuild what the engine produced: key order, tuple or list
+rects, int rect components, missing keys, and values that do not fit the
+array columns (a non-int page, an unknown type, a malformed rect).
+"""
+
+LINKS = [
+    {'page': 0, 'rect': [10.0, 55.0, 100.0, 70.0], 'link_text': 'Intro', 'type': 'Internal (GoTo/Dest)', 'destination_page': 3},
+    {'page': 1, 'rect': (1, 2.5, 3, 4.0), 'link_text': 'Site', 'type': 'External (URI)', 'url': 'https://example.com'},
+    {'page': 1, 'rect': None, 'type': 'External (URI)', 'url': 'https://example.com', 'link_text': 'Site again'},
+    {'type': 'Launch', 'page': 2, 'rect': [0, 0, 0, 0], 'target': 'app.exe'},
+    {'page': '3', 'rect': [1.0, 2.0], 'type': None, 'link_text': 'odd'},
+    {'page': True, 'rect': [True, 0.0, 1.0, 2.0], 'type': 'Remote (GoToR)', 'remote_file': 'other.pdf'},
+    {'link_text': 'no page, no type'},
+    {},
+]
+
+
+def _assert_same(rebuilt, links):
+    assert rebuilt == links
+    for got, want in zip(rebuilt, links):
+        assert list(got) == list(want)
+        for key in want:
+            assert type(got[key]) is type(want[key]), key
+        if isinstance(want.get('rect'), (list, tuple)):
+            assert [type(v) for v in got['rect']] == [type(v) for v in want['rect']]
+
+
+def test_round_trip():
+    table = LinkTable.from_links(iter(LINKS))
+    assert len(table) == len(LINKS)
+    _assert_same(table.to_dicts(), LINKS)
+    _assert_same([table[i] for i in range(-len(LINKS), 0)], LINKS)
+
+
+def test_type_queries():
+    table = LinkTable.from_links(LINKS)
+    assert table.type_of(1) == 'External (URI)'
+    assert table.type_of(6) is None
+    assert table.count_by_type() == {
+        'Internal (GoTo/Dest)': 1, 'External (URI)': 2, 'Launch': 1,
+        None: 3, 'Remote (GoToR)': 1,
+    }
+    assert table.rows_by_type()['External (URI)'] == [1, 2]
+    assert table.to_dicts('External (URI)') == LINKS[1:3]
+
+
+def test_strings_are_interned():
+    first, second = ''.join(['https://', 'example.com']), ''.join(['https://', 'example.com'])
+    assert first is not second
+    table = LinkTable.from_links([{'url': first}, {'url': second}])
+    assert table[0]['url'] is table[1]['url']
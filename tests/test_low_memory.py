@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# ./tests/test_low_memory.py
+from __future__ import annotations
+
+import pytest
+from pypdf import PdfWriter
+from pypdf.generic import ArrayObject, DictionaryObject, NameObject, NumberObject
+
+from pdflinkcheck.analysis_pypdf import build_named_dest_index, iter_links_from_reader, open_reader
+
+"""
+pypdf low_memory mode evicts every page it resolved.
+
+After a low_memory pass, the reader's object cache is back to what the
+page map and named destinations needed, whether a page had annotations or
+not and whether the consumer read every link or stopped early. The records
+are the same as without low_memory.
+"""
+
+
+@pytest.fixture(scope="module")
+def mixed_pdf(tmp_path_factory):
+    writer = PdfWriter()
+    for i in range(6):
+        writer.add_blank_page(612, 792)
+        if i % 2:
+            continue  # odd pages have no /Annots
+        annot = DictionaryObject({
+            NameObject("/Type"): NameObject("/Annot"),
+            NameObject("/Subtype"): NameObject("/Link"),
+            NameObject("/Rect"): ArrayObject([NumberObject(72), NumberObject(700), NumberObject(200), NumberObject(712)]),
+            NameObject("/Dest"): ArrayObject([writer.pages[0].indirect_reference, NameObject("/Fit")]),
+        })
+        writer.pages[i][NameObject("/Annots")] = ArrayObject([writer._add_object(annot)])
+    path = tmp_path_factory.mktemp("low_memory") / "mixed.pdf"
+    writer.write(str(path))
+    return str(path)
+
+
+def _baseline(reader):
+    obj_id_to_page = {page.indirect_reference.idnum: i for i, page in enumerate(reader.pages)}
+    build_named_dest_index(reader, obj_id_to_page)
+    return len(reader.resolved_objects)
+
+
+def test_low_memory_evicts_every_page(mixed_pdf):
+    reader = open_reader(mixed_pdf)
+    baseline = _baseline(reader)
+    links = list(iter_links_from_reader(reader, low_memory=True))
+    assert len(reader.resolved_objects) == baseline
+    assert links == list(iter_links_from_reader(open_reader(mixed_pdf)))
+    assert len(links) == 3
+
+
+def test_low_memory_evicts_when_closed_early(mixed_pdf):
+    reader = open_reader(mixed_pdf)
+    baseline = _baseline(reader)
+    links = iter_links_from_reader(reader, low_memory=True)
+    next(links)
+    links.close()
+    assert len(reader.resolved_objects) == baseline
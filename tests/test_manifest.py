@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# ./tests/test_manifest.py
+from __future__ import annotations
+import os
+
+import pytest
+
+from pdflinkcheck import batch
+from pdflinkcheck.manifest import ScanManifest, scan_mode
+
+"""
+Incremental rescans (`analyze DIR --incremental`) through the scan manifest.
+
+Unchanged files are answered from the manifest without analysis; a touched
+but byte-identical file is hashed, not analyzed; changed content, another
+engine or another mode (anchor text, export format, web links) is analyzed
+again. Failures are not recorded, so they are retried.
+"""
+
+
+@pytest.fixture
+def pdfs(tmp_path, write_corpus_pdf):
+    paths = []
+    for i in range(2):
+        source, _ = write_corpus_pdf(f"manifest_{i}", 2 + i, 3, text_lines=3)
+        path = tmp_path / "docs" / f"doc{i}.pdf"
+        path.parent.mkdir(exist_ok=True)
+        path.write_bytes(source.read_bytes())
+        paths.append(str(path))
+    return paths
+
+
+@pytest.fixture
+def manifest(tmp_path):
+    with ScanManifest(tmp_path / "manifest.sqlite3") as manifest:
+        yield manifest
+
+
+@pytest.fixture
+def reports_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "reports"
+    monkeypatch.setattr(batch, "BATCH_REPORTS_DIR", directory)
+    return directory
+
+
+@pytest.fixture
+def analyzed(monkeypatch):
+    """Paths that reached analyze_one(), in order."""
+    calls = []
+    analyze_one = batch.analyze_one
+
+    def counting(pdf_path, *args):
+        calls.append(pdf_path)
+        return analyze_one(pdf_path, *args)
+
+    monkeypatch.setattr(batch, "analyze_one", counting)
+    return calls
+
+
+def _scan(pdfs, manifest, **options):
+    options.setdefault("export_format", "")
+    return {r["pdf_path"]: r for r in batch.iter_batch_results(pdfs, manifest=manifest, **options)}
+
+
+def test_unchanged_files_are_not_analyzed(pdfs, manifest, analyzed):
+    first = _scan(pdfs, manifest)
+    assert analyzed == pdfs
+    assert len(manifest) == 2
+
+    second = _scan(pdfs, manifest)
+    assert analyzed == pdfs
+    for path in pdfs:
+        assert second[path]["unchanged"] is True
+        assert second[path]["total_links_count"] == first[path]["total_links_count"]
+
+
+def test_touched_file_is_hashed_not_analyzed(pdfs, manifest, analyzed):
+    _scan(pdfs, manifest)
+    st = os.stat(pdfs[0])
+    os.utime(pdfs[0], ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+    result = _scan(pdfs, manifest)[pdfs[0]]
+    assert result["unchanged"] is True
+    assert analyzed == pdfs
+    # The new stat is stored, so the next scan skips the hash too
+    entry = manifest.lookup(pdfs[0], "pypdf", scan_mode("accurate", ""))
+    assert entry.stat_matches(os.stat(pdfs[0]), entry.version)
+
+
+def test_changed_content_is_analyzed(pdfs, manifest, analyzed):
+    _scan(pdfs, manifest)
+    with open(pdfs[1], "ab") as f:
+        f.write(b"\n% appended\n")
+
+    result = _scan(pdfs, manifest)
+    assert analyzed == pdfs + [pdfs[1]]
+    assert "unchanged" not in result[pdfs[1]]
+
+
+@pytest.mark.parametrize("options", [
+    {"anchor_text": "none"},
+    {"export_format": "TXT"},
+    {"web_links": False},
+    {"pdf_library": "xref"},
+])
+def test_other_modes_are_analyzed(pdfs, manifest, analyzed, options, reports_dir):
+    _scan(pdfs, manifest)
+    result = _scan(pdfs, manifest, **options)
+    assert analyzed == pdfs + pdfs
+    assert not any(r.get("unchanged") for r in result.values())
+    # Both entries are kept: switching back is answered from the manifest
+    _scan(pdfs, manifest)
+    assert analyzed == pdfs + pdfs
+
+
+def test_failures_are_retried(pdfs, manifest, analyzed, tmp_path):
+    broken = tmp_path / "docs" / "broken.pdf"
+    broken.write_bytes(b"%PDF-1.7\nnot really a pdf\n")
+    paths = pdfs + [str(broken)]
+
+    assert _scan(paths, manifest)[str(broken)]["error"]
+    assert len(manifest) == 2
+    _scan(paths, manifest)
+    assert analyzed.count(str(broken)) == 2
+
+
+def test_scan_mode_distinguishes_options():
+    modes = {
+        scan_mode("accurate", "JSON"),
+        scan_mode("none", "JSON"),
+        scan_mode("accurate", "TXT"),
+        scan_mode("accurate", ""),
+        scan_mode("accurate", "JSON", web_links=False),
+    }
+    assert len(modes) == 5
+    assert scan_mode("accurate", "json") == scan_mode("accurate", "JSON")
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# ./tests/test_named_destinations.py
+from __future__ import annotations
+
+import pytest
+from pypdf import PdfWriter
+from pypdf.generic import ArrayObject, DictionaryObject, NameObject, NumberObject, TextStringObject
+
+from pdflinkcheck import iter_links
+from pdflinkcheck.analysis_pypdf import build_named_dest_index, open_reader
+from pdflinkcheck.analysis_xref import RawPdf
+
+"""
+Named destinations resolve to page indexes (pypdf and xref engines).
+
+The document has both catalog styles: a PDF 1.1 /Dests dictionary and a
+PDF 1.2 /Names /Dests tree with /Kids, a dict-valued entry and a kid that
+points back at the tree root. Links name their targets as strings, as name
+objects with and without the leading slash, and through GoTo actions.
+"""
+
+
+def _build(path):
+    writer = PdfWriter()
+    for _ in range(5):
+        writer.add_blank_page(612, 792)
+
+    def page_dest(index):
+        return ArrayObject([writer.pages[index].indirect_reference, NameObject("/Fit")])
+
+    # /Names /Dests tree: root -> [leaf_a, leaf_b, root (a loop)]
+    leaf_a = writer._add_object(DictionaryObject({
+        NameObject("/Names"): ArrayObject([TextStringObject("intro"), page_dest(1)]),
+    }))
+    leaf_b = writer._add_object(DictionaryObject({
+        NameObject("/Names"): ArrayObject([
+            TextStringObject("results"), DictionaryObject({NameObject("/D"): page_dest(2)}),
+            TextStringObject("gone"), ArrayObject([NumberObject(99), NameObject("/Fit")]),
+        ]),
+    }))
+    tree = writer._add_object(DictionaryObject())
+    tree.get_object()[NameObject("/Kids")] = ArrayObject([leaf_a, leaf_b, tree])
+    writer._root_object[NameObject("/Names")] = DictionaryObject({NameObject("/Dests"): tree})
+
+    # /Dests dictionary
+    writer._root_object[NameObject("/Dests")] = writer._add_object(DictionaryObject({
+        NameObject("/Chap3"): page_dest(3),
+    }))
+
+    def link(page, y, dest=None, goto=None):
+        annot = DictionaryObject({
+            NameObject("/Type"): NameObject("/Annot"),
+            NameObject("/Subtype"): NameObject("/Link"),
+            NameObject("/Rect"): ArrayObject([NumberObject(72), NumberObject(y), NumberObject(200), NumberObject(y + 12)]),
+        })
+        if dest is not None:
+            annot[NameObject("/Dest")] = dest
+        if goto is not None:
+            annot[NameObject("/A")] = DictionaryObject({NameObject("/S"): NameObject("/GoTo"), NameObject("/D"): goto})
+        page_obj = writer.pages[page]
+        if "/Annots" not in page_obj:
+            page_obj[NameObject("/Annots")] = ArrayObject()
+        page_obj["/Annots"].append(writer._add_object(annot))
+
+    link(0, 700, dest=TextStringObject("intro"))
+    link(0, 680, dest=NameObject("/results"))
+    link(0, 660, dest=NameObject("/Chap3"))
+    link(0, 640, dest=TextStringObject("Chap3"))
+    link(0, 620, goto=TextStringObject("results"))
+    link(0, 600, dest=TextStringObject("nosuch"))
+    link(0, 580, dest=TextStringObject("gone"))
+    link(0, 560, dest=page_dest(4))
+    writer.write(str(path))
+    return path
+
+
+EXPECTED_INDEX = {"intro": 1, "results": 2, "/Chap3": 3}
+
+EXPECTED_TARGETS = [
+    ('Internal (GoTo/Dest)', 1),
+    ('Internal (GoTo/Dest)', 2),
+    ('Internal (GoTo/Dest)', 3),
+    ('Internal (GoTo/Dest)', 3),
+    ('Internal (GoTo/Dest)', 2),
+    ('Other Action', 'Unknown'),
+    ('Other Action', 'Unknown'),
+    ('Internal (GoTo/Dest)', 4),
+]
+
+
+@pytest.fixture(scope="module")
+def named_pdf(tmp_path_factory):
+    return str(_build(tmp_path_factory.mktemp("named") / "named.pdf"))
+
+
+def _obj_id_to_page(reader):
+    return {page.indirect_reference.idnum: i for i, page in enumerate(reader.pages)}
+
+
+def test_index_flattens_both_catalog_styles(named_pdf):
+    reader = open_reader(named_pdf)
+    assert build_named_dest_index(reader, _obj_id_to_page(reader)) == EXPECTED_INDEX
+
+
+def test_raw_index_matches_pypdf(named_pdf):
+    raw = RawPdf(named_pdf)
+    obj_id_to_page = {num: i for i, (num, _) in enumerate(raw.pages())}
+    assert raw.named_destinations(obj_id_to_page) == EXPECTED_INDEX
+
+
+@pytest.mark.parametrize("engine", ["pypdf", "xref"])
+def test_named_links_resolve(named_pdf, engine):
+    links = list(iter_links(named_pdf, engine, anchor_text="none"))
+    assert [(link['type'], link['target']) for link in links] == EXPECTED_TARGETS
+    resolved = [link for link in links if link['type'] == 'Internal (GoTo/Dest)']
+    assert all(link['destination_page'] == link['target'] for link in resolved)
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# ./tests/test_sharding.py
+from __future__ import annotations
+import functools
+
+import pytest
+
+from pdflinkcheck import sharding, timing
+
+"""
+Page-sharded extraction matches a single-process run: same links in page
+order, and the workers' counters reach the parent's Recorder.
+"""
+
+
+@pytest.fixture(scope="module")
+def sharded_pdf(write_corpus_pdf):
+    path, _ = write_corpus_pdf("sharding", 9, 4, text_lines=4)
+    return str(path)
+
+
+@pytest.mark.parametrize("engine", ["pymupdf", "pdfium"])
+def test_sharded_run_matches_in_process(sharded_pdf, engine):
+    if engine == "pymupdf":
+        pytest.importorskip("fitz")
+        from pdflinkcheck import analysis_pymupdf as module
+        open_doc = module.open_doc
+    else:
+        pdfium = pytest.importorskip("pypdfium2")
+        from pdflinkcheck import analysis_pdfium as module
+        open_doc = pdfium.PdfDocument
+
+    doc = open_doc(sharded_pdf)
+    try:
+        page_count = len(doc)
+        with timing.Recorder() as single:
+            expected = module.extract_links_from_doc(doc)
+    finally:
+        doc.close()
+
+    shard_fn = functools.partial(module._extract_links_shard, anchor_text="accurate")
+    with timing.Recorder() as sharded:
+        links = sharding.run_sharded(shard_fn, sharded_pdf, page_count, jobs=2)
+
+    assert len(sharding.plan_shards(page_count, 2)) > 1
+    assert links == expected
+    assert sharded.counters == single.counters
+    assert sharded.counters["pages_loaded"] == page_count
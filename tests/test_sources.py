@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# ./tests/test_sources.py
+from __future__ import annotations
+import io
+import mmap
+
+import pytest
+
+from pdflinkcheck import cache as result_cache
+from pdflinkcheck.environment import pdfium_is_available, pymupdf_is_available
+from pdflinkcheck.report import run_report
+
+"""
+In-memory sources (bytes, BytesIO, mmap) report exactly what the path does.
+
+Each engine analyzes a generated document from its path and from every
+in-memory form. The report data must match, and the cache must hash the
+buffer to the same key as the file.
+"""
+
+ENGINES = [
+    "pypdf",
+    "xref",
+    pytest.param("pdfium", marks=pytest.mark.skipif(not pdfium_is_available(), reason="pypdfium2 not installed")),
+    pytest.param("pymupdf", marks=pytest.mark.skipif(not pymupdf_is_available(), reason="PyMuPDF not installed")),
+]
+
+
+@pytest.fixture(scope="module")
+def source_pdf(write_corpus_pdf):
+    path, _ = write_corpus_pdf("sources", 4, 6, text_lines=8)
+    return path
+
+
+def _sources(path):
+    data = path.read_bytes()
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        yield "bytes", data
+        yield "BytesIO", io.BytesIO(data)
+        yield "mmap", mapped
+    finally:
+        mapped.close()
+
+
+def _report(pdf_source, engine, name):
+    return run_report(pdf_source, engine, print_bool=False, use_cache=False, pdf_name=name)
+
+
+def _comparable(data):
+    # Validation names the document by its location, which a buffer does not have
+    validation = {k: v for k, v in data["validation"].items() if k not in ("pdf_path", "summary-txt")}
+    return {**data, "validation": validation}
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_in_memory_sources_match_path(source_pdf, engine):
+    expected = _report(str(source_pdf), engine, source_pdf.name)
+    assert expected["metadata"]["link_counts"]["total_links_count"] > 0
+    for label, pdf_source in _sources(source_pdf):
+        result = _report(pdf_source, engine, source_pdf.name)
+        assert _comparable(result["data"]) == _comparable(expected["data"]), label
+        assert result["metadata"]["link_counts"] == expected["metadata"]["link_counts"], label
+
+
+def test_in_memory_sources_share_the_file_cache_key(source_pdf):
+    expected = result_cache.key_for_file(str(source_pdf), "pypdf")
+    for label, pdf_source in _sources(source_pdf):
+        assert result_cache.key_for_file(pdf_source, "pypdf") == expected, label
+
+
+def test_uncached_in_memory_run_writes_nothing(source_pdf, tmp_path, monkeypatch):
+    # The HTTP servers analyze uploads this way
+    monkeypatch.setattr(result_cache, "CACHE_DIR", tmp_path / "cache")
+    _report(source_pdf.read_bytes(), "pypdf", source_pdf.name)
+    assert not (tmp_path / "cache").exists()
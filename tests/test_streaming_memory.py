@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# ./tests/test_streaming_memory.py
+from __future__ import annotations
+import os
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from pdflinkcheck import iter_links
+from pdflinkcheck.environment import pdfium_is_available, pymupdf_is_available
+
+"""
+Streaming extraction keeps memory flat.
+
+iter_links() over a large generated document (benchmarks/corpus.py) must not
+accumulate link records, pages, text pages or annotation handles: peak
+Python allocations and resident memory growth stay under fixed limits however
+many links go by. Holding the 15000 records alone would take well over
+PEAK_PYTHON_MB.
+
+pdfium and PyMuPDF are checked. pypdf and xref keep the parsed object table
+for the whole document by design, so their memory grows with the file.
+"""
+
+PAGES = 1500
+LINKS_PER_PAGE = 10
+
+# Python allocations alive at once during a pass (tracemalloc peak)
+PEAK_PYTHON_MB = 4
+# Resident memory growth over a pass (engine-native pages and handles)
+RSS_GROWTH_MB = 8
+
+ENGINES = [
+    pytest.param("pdfium", marks=pytest.mark.skipif(not pdfium_is_available(), reason="pypdfium2 not installed")),
+    pytest.param("pymupdf", marks=pytest.mark.skipif(not pymupdf_is_available(), reason="PyMuPDF not installed")),
+]
+
+
+def _rss_mb() -> float:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
+@pytest.fixture(scope="module")
+def large_pdf(write_corpus_pdf):
+    path, summary = write_corpus_pdf("streaming_large", PAGES, LINKS_PER_PAGE, text_lines=5)
+    return path, summary["links"]
+
+
+@pytest.fixture(scope="module")
+def small_pdf(write_corpus_pdf):
+    path, _ = write_corpus_pdf("streaming_small", 10, LINKS_PER_PAGE, text_lines=5)
+    return path
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_streaming_peak_python_memory(engine, large_pdf, small_pdf):
+    pdf_path, expected_links = large_pdf
+    # Engine imports and first-use caches are not part of the pass
+    sum(1 for _ in iter_links(small_pdf, engine))
+
+    tracemalloc.start()
+    try:
+        count = sum(1 for _ in iter_links(pdf_path, engine))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert count == expected_links
+    assert peak / (1024 * 1024) < PEAK_PYTHON_MB
+
+
+@pytest.mark.skipif(not Path("/proc/self/statm").exists(), reason="needs /proc (Linux)")
+@pytest.mark.parametrize("engine", ENGINES)
+def test_streaming_rss_growth(engine, large_pdf, small_pdf):
+    pdf_path, expected_links = large_pdf
+    sum(1 for _ in iter_links(small_pdf, engine))
+
+    baseline = highest = _rss_mb()
+    count = 0
+    for count, _ in enumerate(iter_links(pdf_path, engine), start=1):
+        if count % 500 == 0:
+            highest = max(highest, _rss_mb())
+
+    assert count == expected_links
+    assert highest - baseline < RSS_GROWTH_MB
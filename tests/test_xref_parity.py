@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# ./tests/test_xref_parity.py
+from __future__ import annotations
+
+import pytest
+from pypdf import PdfWriter
+from pypdf.generic import ArrayObject, DictionaryObject, NameObject, NullObject, NumberObject, TextStringObject
+
+from pdflinkcheck import iter_links
+from pdflinkcheck.analysis_xref import RawPdf, open_xref_document
+from pdflinkcheck.helpers import ANCHOR_TEXT_SKIPPED
+
+"""
+The xref engine classifies links exactly like pypdf with anchor_text="none".
+
+The document mixes URI, GoTo, named, GoToR and degenerate destinations: an
+empty or null /Dest with no /A, and an empty /Dest whose /A carries the /D.
+"""
+
+
+def _build(path):
+    writer = PdfWriter()
+    for _ in range(4):
+        writer.add_blank_page(612, 792)
+    writer.add_named_destination("sec2", 2)
+
+    def link(page, y, dest=None, action=None):
+        annot = DictionaryObject({
+            NameObject("/Type"): NameObject("/Annot"),
+            NameObject("/Subtype"): NameObject("/Link"),
+            NameObject("/Rect"): ArrayObject([NumberObject(72), NumberObject(y), NumberObject(200), NumberObject(y + 12)]),
+        })
+        if dest is not None:
+            annot[NameObject("/Dest")] = dest
+        if action is not None:
+            annot[NameObject("/A")] = DictionaryObject(action)
+        page_obj = writer.pages[page]
+        if "/Annots" not in page_obj:
+            page_obj[NameObject("/Annots")] = ArrayObject()
+        page_obj["/Annots"].append(writer._add_object(annot))
+
+    def page_dest(index):
+        return ArrayObject([writer.pages[index].indirect_reference, NameObject("/Fit")])
+
+    link(0, 700, action={NameObject("/S"): NameObject("/URI"), NameObject("/URI"): TextStringObject("https://example.com")})
+    link(0, 680, dest=page_dest(3))
+    link(0, 660, dest=TextStringObject("sec2"))
+    link(1, 700, dest=ArrayObject())
+    link(1, 680, dest=NullObject())
+    link(1, 660, dest=ArrayObject(), action={NameObject("/S"): NameObject("/GoTo"), NameObject("/D"): page_dest(1)})
+    link(2, 700, action={NameObject("/S"): NameObject("/GoToR"), NameObject("/F"): TextStringObject("other.pdf")})
+    writer.write(str(path))
+    return path
+
+
+@pytest.fixture(scope="module")
+def links_pdf(tmp_path_factory):
+    return _build(tmp_path_factory.mktemp("xref") / "links.pdf")
+
+
+def test_raw_scanner_reads_the_file(links_pdf):
+    # Otherwise the comparison below would only exercise the pypdf fallback
+    assert isinstance(open_xref_document(str(links_pdf)), RawPdf)
+
+
+def test_xref_matches_pypdf(links_pdf):
+    xref = list(iter_links(str(links_pdf), "xref"))
+    pypdf = list(iter_links(str(links_pdf), "pypdf", anchor_text="none"))
+    assert xref == pypdf
+    assert {link['link_text'] for link in xref} == {ANCHOR_TEXT_SKIPPED}
+
+
+def test_degenerate_destinations(links_pdf):
+    links = list(iter_links(str(links_pdf), "xref"))
+    assert [(link['page'], link['type'], link['target']) for link in links] == [
+        (0, 'External (URI)', 'https://example.com'),
+        (0, 'Internal (GoTo/Dest)', 3),
+        (0, 'Internal (GoTo/Dest)', 2),
+        # Empty and null /Dest without an action stay unresolved
+        (1, 'Other Action', 'Unknown'),
+        (1, 'Other Action', 'Unknown'),
+        # Empty /Dest falls back to the action's /D
+        (1, 'Internal (GoTo/Dest)', 1),
+        (2, 'Remote (GoToR)', 'File: other.pdf'),
+    ]